@@ -3,14 +3,19 @@ OpenAI client wrapper for LLM text generation.
 Replaces the emergentintegrations dependency.
 """
 import os
+import re
 import json
 import logging
+import orjson
 from typing import Optional, Dict, Any
 from openai import OpenAI
 from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Outermost {...} span, for replies that wrap the JSON in fences or prose
+_JSON_BLOCK = re.compile(r"\{.*\}", re.S)
+
 
 async def generate_json(
     system_prompt: str,
@@ -60,19 +65,10 @@ async def generate_json(
         
         # Parse JSON from response
         # With json_object response_format, OpenAI should return pure JSON
-        # but we'll still handle markdown wrapping as a fallback
+        # but we'll still handle markdown wrapping or stray prose as a fallback
         try:
-            response_text = response_text.strip()
-            
-            # Remove markdown code blocks if present (shouldn't be with json_object format)
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            elif response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            parsed = json.loads(response_text.strip())
+            match = _JSON_BLOCK.search(response_text)
+            parsed = orjson.loads(match.group(0) if match else response_text)
             return parsed
             
         except json.JSONDecodeError as e:
@@ -0,0 +1,13 @@
+-- Migration: Indexes for inbox/next cap checks and dump_items triage listing
+-- Run this in Supabase SQL Editor
+
+-- Cap checks (SELECT COUNT(*) FROM tasks WHERE user_id = $1 AND status = 'inbox' / 'next')
+-- run on every promote and on every Next Today count refresh. Only inbox and
+-- next rows are ever counted, so a partial index keeps this tiny.
+CREATE INDEX IF NOT EXISTS tasks_user_inbox_next_idx
+ON public.tasks(user_id, status)
+WHERE status IN ('inbox', 'next');
+
+-- GET /dump-items filters by user and status and orders by newest first
+CREATE INDEX IF NOT EXISTS dump_items_user_status_created_idx
+ON public.dump_items(user_id, status, created_at DESC);
@@ -0,0 +1,12 @@
+-- Migration: Let Postgres generate ids for tasks and dump_items
+-- Run this in Supabase SQL Editor
+--
+-- ids stay TEXT (users/dumps/tasks all key on TEXT), so the default is the
+-- text form of gen_random_uuid(). Inserts that omit id get one server-side
+-- and read it back with RETURNING id.
+
+ALTER TABLE public.tasks
+ALTER COLUMN id SET DEFAULT gen_random_uuid()::text;
+
+ALTER TABLE public.dump_items
+ALTER COLUMN id SET DEFAULT gen_random_uuid()::text;
@@ -0,0 +1,9 @@
+-- Migration: Index for GET /tasks ordering and keyset pagination
+-- Run this in Supabase SQL Editor
+
+-- GET /tasks lists a user's tasks by priority (NULL first), newest first,
+-- and pages with a row comparison on the same key. Matching the ORDER BY
+-- expression lets Postgres read a page straight off the index instead of
+-- sorting every task the user has.
+CREATE INDEX IF NOT EXISTS tasks_user_list_order_idx
+ON public.tasks(user_id, (COALESCE(priority, 2147483647)) DESC, created_at DESC, id DESC);
@@ -0,0 +1,14 @@
+-- Migration: Partial index for the iCal export
+-- Run this in Supabase SQL Editor
+
+-- GET /tasks/export/ical reads a user's scheduled tasks in date/time order.
+-- Only scheduled rows with a date are ever exported, so a partial index
+-- keeps it small and hands the rows back already sorted.
+-- The time key is the export's own sort expression (defaulted to 09:00 and
+-- zero-padded to HH:MM); an index on the raw column can't serve that ORDER BY.
+-- Dropped first so databases with the earlier raw-column version pick it up.
+DROP INDEX IF EXISTS public.idx_tasks_user_scheduled;
+
+CREATE INDEX IF NOT EXISTS idx_tasks_user_scheduled
+ON public.tasks(user_id, scheduled_date, (lpad(COALESCE(NULLIF(scheduled_time, ''), '09:00'), 5, '0')))
+WHERE status = 'scheduled' AND scheduled_date IS NOT NULL;
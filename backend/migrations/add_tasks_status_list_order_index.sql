@@ -0,0 +1,8 @@
+-- Migration: Index for GET /tasks?status=... listings
+-- Run this in Supabase SQL Editor
+
+-- The status-filtered task list (e.g. the inbox) uses the same order as the
+-- full list. With status between user_id and the order key, Postgres reads
+-- the rows already sorted instead of sorting the user's matching tasks.
+CREATE INDEX IF NOT EXISTS tasks_user_status_list_order_idx
+ON public.tasks(user_id, status, (COALESCE(priority, 2147483647)) DESC, created_at DESC, id DESC);
@@ -0,0 +1,7 @@
+-- Migration: Drop the plain tasks(user_id) index
+-- Run this in Supabase SQL Editor (after add_tasks_list_order_index.sql)
+
+-- tasks_user_list_order_idx leads with user_id, so it already serves every
+-- lookup by user_id alone. The single-column index was one more btree
+-- to maintain on every task insert and on every update of a user's tasks.
+DROP INDEX IF EXISTS public.idx_tasks_user_id;
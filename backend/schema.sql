@@ -14,7 +14,7 @@ CREATE TABLE IF NOT EXISTS users (
 
 -- Tasks table for task management
 CREATE TABLE IF NOT EXISTS tasks (
-    id TEXT PRIMARY KEY,
+    id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
     user_id TEXT NOT NULL,
     title TEXT NOT NULL,
     description TEXT,
@@ -38,9 +38,12 @@ CREATE TABLE IF NOT EXISTS settings (
 );
 
 -- Indexes for better query performance
-CREATE INDEX IF NOT EXISTS idx_tasks_user_id ON tasks(user_id);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_tasks_user_status ON tasks(user_id, status);
+CREATE INDEX IF NOT EXISTS tasks_user_inbox_next_idx ON tasks(user_id, status) WHERE status IN ('inbox', 'next');
+CREATE INDEX IF NOT EXISTS tasks_user_list_order_idx ON tasks(user_id, (COALESCE(priority, 2147483647)) DESC, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS tasks_user_status_list_order_idx ON tasks(user_id, status, (COALESCE(priority, 2147483647)) DESC, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_user_scheduled ON tasks(user_id, scheduled_date, (lpad(COALESCE(NULLIF(scheduled_time, ''), '09:00'), 5, '0'))) WHERE status = 'scheduled' AND scheduled_date IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_users_google_id ON users(google_id);
 
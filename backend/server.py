@@ -1,25 +1,41 @@
 from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Form, Query, Depends, Request
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+import asyncio
 import asyncpg
+import base64
+import hashlib
+import hmac
 import ssl
 import os
+import shutil
+import sys
+import time
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from typing import List, Optional, Dict, Any
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+from operator import itemgetter
 from datetime import datetime, timezone, timedelta, date
 from llm.openai_client import generate_json, get_model_for_provider
 from llm.openai_audio import transcribe_audio_file
 import json
+import orjson
 import re
 import tempfile
-import requests
+from urllib.parse import quote_plus, urlencode
+import httpx
 import jwt
-from passlib.context import CryptContext
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 ROOT_DIR = Path(__file__).parent
 
@@ -46,6 +62,14 @@ MODEL_UPGRADE_MAP = {
     # Add other models as needed
 }
 
+# ISO-8601 parsing for client timestamps. Python 3.11+ accepts a trailing
+# 'Z' natively; older interpreters (CI runs 3.9) need it spelled as +00:00.
+if sys.version_info >= (3, 11):
+    parse_iso_datetime = datetime.fromisoformat
+else:
+    def parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 # Google OAuth Config
 GOOGLE_CLIENT_ID = os.environ.get('GOOGLE_CLIENT_ID')
 GOOGLE_CLIENT_SECRET = os.environ.get('GOOGLE_CLIENT_SECRET')
@@ -59,28 +83,123 @@ GOOGLE_SCOPES = ['https://www.googleapis.com/auth/calendar', 'https://www.google
 DATABASE_URL = os.environ.get('DATABASE_URL')
 db_pool = None
 
+# Shared client for outbound HTTP (Google OAuth); pooled connections, closed on shutdown.
+# Keep-alive connections outlive a single sign-in, so the TLS handshake with
+# Google's token endpoint is paid once per worker rather than per login.
+http_client = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+)
+
+# How DATABASE_URL reaches Postgres: "transaction" (default) for Supabase's
+# transaction pooler, which can't keep prepared statements across
+# transactions; "session" for a direct connection or the session pooler,
+# where asyncpg prepares each statement once per connection and reuses it.
+DB_POOLER_MODE = os.environ.get('DB_POOLER_MODE', 'transaction').lower()
+if DB_POOLER_MODE == 'session':
+    # Sized for the column-dependent and per-field-set statement variants, not just the fixed queries
+    DB_STATEMENT_CACHE = {'statement_cache_size': 1024, 'max_cached_statement_lifetime': 0}
+    # Short OLTP queries never gain from JIT, only pay its planning cost. The
+    # session time zone is pinned so server-side date casts don't depend on
+    # the role's default. Both go in the startup packet, costing no extra
+    # round trip, and only on session connections: poolers reject or leak
+    # startup parameters.
+    DB_SERVER_SETTINGS = {'jit': 'off', 'TimeZone': 'UTC'}
+else:
+    DB_STATEMENT_CACHE = {'statement_cache_size': 0}  # Required for Supabase transaction pooler
+    DB_SERVER_SETTINGS = None
+
+# Supabase caps connections per project (60 on the smaller plans), shared by
+# every worker, so each worker takes its share of 55 and leaves headroom for
+# migrations and the dashboard.
+DB_POOL_MAX_SIZE = max(2, 55 // max(1, int(os.environ.get('WEB_CONCURRENCY', '1'))))
+# Connections opened by the startup warm-up and kept through idle periods,
+# so the first requests after a deploy don't wait on TLS handshakes
+DB_POOL_MIN_SIZE = min(5, DB_POOL_MAX_SIZE)
+
+def _build_db_ssl_context() -> ssl.SSLContext:
+    """TLS context for the pool, built once at import.
+
+    With DB_SSL_ROOT_CERT pointing at the provider's CA bundle (Supabase's
+    prod-ca-2021.crt) the server certificate and hostname are verified.
+    Without it the connection is still encrypted but unverified, as the
+    provider's CA isn't in the system store.
+    """
+    root_cert = os.environ.get('DB_SSL_ROOT_CERT')
+    if root_cert:
+        return ssl.create_default_context(cafile=root_cert)
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+DB_SSL_CONTEXT = _build_db_ssl_context()
+
 async def get_db_pool():
     global db_pool
     if db_pool is None:
-        ssl_ctx = ssl.create_default_context()
-        ssl_ctx.check_hostname = False
-        ssl_ctx.verify_mode = ssl.CERT_NONE
         db_pool = await asyncpg.create_pool(
             DATABASE_URL, 
-            ssl=ssl_ctx, 
-            min_size=1, 
-            max_size=10,
-            statement_cache_size=0  # Required for Supabase transaction pooler
+            ssl=DB_SSL_CONTEXT, 
+            min_size=DB_POOL_MIN_SIZE, 
+            max_size=DB_POOL_MAX_SIZE,
+            # Close connections idle for 5 minutes instead of holding them against the cap
+            max_inactive_connection_lifetime=300,
+            command_timeout=30,
+            server_settings=DB_SERVER_SETTINGS,
+            **DB_STATEMENT_CACHE
         )
     return db_pool
 
+# Ownership checks shared by several handlers. One canonical statement text
+# per check, so they share a single server-side plan instead of one per
+# handler's spelling of the same query.
+SQL_TASK_OWNED = "SELECT id FROM tasks WHERE id = $1 AND user_id = $2"
+
+# Other statements issued from more than one place, kept as one text each
+SQL_USER_BY_ID = "SELECT id, email, name, google_id, avatar_url, created_at FROM users WHERE id = $1"
+
+# Capped writes (Inbox, Next Today) take this per-user lock first. Under READ
+# COMMITTED two concurrent count-then-insert statements would both see the old
+# count; the lock makes the second wait until the first commits, and its next
+# statement then sees the new count. Released when the transaction ends.
+SQL_LOCK_USER_CAPS = "SELECT pg_advisory_xact_lock(hashtext($1))"
+
+def _encode_record(obj):
+    """orjson fallback: an asyncpg Record serializes as the mapping it is"""
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj)
+    raise TypeError
+
+class RecordJSONResponse(ORJSONResponse):
+    """ORJSONResponse that accepts asyncpg Records (and lists of them) as content"""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_encode_record, option=orjson.OPT_NON_STR_KEYS)
+
+def etag_json_response(request: Request, content) -> Response:
+    """JSON response carrying an ETag of its body; 304 if the client already has it.
+
+    Dumps and dump_items have no updated_at, so the body itself is the only
+    reliable version marker. The ETag is weak because it hashes the JSON
+    before GZipMiddleware, so the gzip and identity bodies share it.
+    """
+    response = ORJSONResponse(content)
+    etag = f'W/"{hashlib.md5(response.body).hexdigest()}"'
+    headers = {'ETag': etag, 'Vary': 'Accept-Encoding'}
+    if_none_match = request.headers.get('if-none-match')
+    # If-None-Match uses weak comparison: a list of tags, W/ prefix ignored
+    if if_none_match and etag[2:] in {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
 # Create the main app with docs enabled in development, disabled in production
 # In development: docs at /api/docs, openapi at /api/openapi.json
 # In production: docs disabled for security
 if ENV == 'production':
-    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None, default_response_class=ORJSONResponse)
 else:
-    app = FastAPI(docs_url="/api/docs", redoc_url="/api/redoc", openapi_url="/api/openapi.json")
+    app = FastAPI(docs_url="/api/docs", redoc_url="/api/redoc", openapi_url="/api/openapi.json", default_response_class=ORJSONResponse)
 
 # CORS configuration - MUST be added BEFORE routes are defined
 # Note: When allow_credentials=True, you cannot use allow_origins=['*']
@@ -106,18 +225,21 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["authorization", "content-type", "accept", "origin", "x-requested-with"],
     expose_headers=["*"],
-    max_age=600,  # Cache preflight for 10 minutes
+    max_age=7200,  # Cache preflight for 2 hours (Chromium's cap; Firefox allows more)
 )
 
+# Compress JSON and iCal bodies over 1 KB for clients that accept gzip. Level 5
+# gets most of level 9's ratio on JSON at a fraction of the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Request logging middleware (dev only) - MUST be after CORS middleware
 if ENV != 'production':
     @app.middleware("http")
     async def log_requests(request, call_next):
         """Log all requests in development mode"""
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await call_next(request)
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         logger.info(
             f"{request.method} {request.url.path} → {response.status_code} "
             f"({process_time:.3f}s)"
@@ -167,8 +289,21 @@ JWT_SECRET = os.environ.get('JWT_SECRET', 'add-daily-secret-key-change-in-produc
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24 * 7  # 7 days
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: Argon2id with OWASP's baseline parameters (19 MiB, two
+# passes, one lane). Accounts created before the switch have bcrypt hashes;
+# those still verify, and are rehashed with Argon2id on the next login.
+PASSWORD_HASHER = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+# Shape of a well-formed bcrypt hash; bcrypt.checkpw panics on truncated ones
+BCRYPT_HASH_RE = re.compile(r"\$2[abxy]\$\d\d\$[./A-Za-z0-9]{53}")
+
+# Argon2 and bcrypt both release the GIL while hashing, so a dedicated thread
+# per core runs hashes in parallel without queueing behind other to_thread work. Beyond
+# PASSWORD_HASH_MAX_PENDING waiting jobs, auth requests get a 503 instead.
+PASSWORD_HASH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+PASSWORD_HASH_MAX_PENDING = 500
+_password_hash_pending = 0
 
 # HTTP Bearer for JWT
 security = HTTPBearer(auto_error=False)
@@ -200,6 +335,8 @@ class GoogleAuthRequest(BaseModel):
     code: str
     redirect_uri: Optional[str] = None
 
+# signup/login/google return their token and user via ORJSONResponse; the
+# model only documents the shape in the OpenAPI schema
 class AuthResponse(BaseModel):
     token: str
     user: dict
@@ -211,58 +348,182 @@ class UserPublic(BaseModel):
     avatar_url: Optional[str] = None
 
 # ============ AUTH HELPERS ============
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+class TTLCache:
+    """Small in-process cache whose entries expire after a number of seconds.
+
+    When full, the oldest entry is dropped (dicts keep insertion order).
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict = {}
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    def set(self, key, value, ttl: Optional[float] = None):
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key):
+        self._data.pop(key, None)
+
+# Verified token payloads, keyed by a token digest, and users by id. Failed
+# verifications and unknown users are never cached.
+_jwt_cache = TTLCache(maxsize=10000, ttl=60)
+_user_cache = TTLCache(maxsize=5000, ttl=30)
+
+def _verify_and_update(password: str, hashed_password: str) -> tuple:
+    """(matches, replacement hash or None), like passlib's verify_and_update.
+
+    A replacement is returned when the stored hash is bcrypt or uses older
+    Argon2 parameters than PASSWORD_HASHER. A corrupt stored hash is treated
+    as a mismatch.
+    """
+    if hashed_password.startswith("$argon2"):
+        try:
+            PASSWORD_HASHER.verify(hashed_password, password)
+        except (VerificationError, InvalidHashError):
+            return False, None
+        if PASSWORD_HASHER.check_needs_rehash(hashed_password):
+            return True, PASSWORD_HASHER.hash(password)
+        return True, None
+    # Legacy bcrypt hash; bcrypt only ever saw the first 72 bytes
+    if not BCRYPT_HASH_RE.fullmatch(hashed_password):
+        return False, None
+    try:
+        if not bcrypt.checkpw(password.encode()[:72], hashed_password.encode()):
+            return False, None
+    except ValueError:
+        return False, None
+    return True, PASSWORD_HASHER.hash(password)
+
+# Password hashing is deliberately slow, so hashing and checking run on
+# PASSWORD_HASH_EXECUTOR instead of blocking the event loop.
+async def _run_password_hash(func, *args):
+    """Run a password hash call on the hash pool, shedding load once the queue is full"""
+    global _password_hash_pending
+    if _password_hash_pending >= PASSWORD_HASH_MAX_PENDING:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many sign-in requests, please retry",
+            headers={"Retry-After": "1"}
+        )
+    _password_hash_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(PASSWORD_HASH_EXECUTOR, func, *args)
+    finally:
+        _password_hash_pending -= 1
+
+async def hash_password(password: str) -> str:
+    return await _run_password_hash(PASSWORD_HASHER.hash, password)
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple:
+    return await _run_password_hash(_verify_and_update, plain_password, hashed_password)
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# Tokens are always HS256, so the header segment is encoded once
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
 
 def create_jwt_token(user_id: str, email: str) -> str:
-    payload = {
+    """Sign an HS256 JWT directly; decode_jwt_token still verifies with PyJWT"""
+    now = int(time.time())
+    payload = orjson.dumps({
         "sub": user_id,
         "email": email,
-        "exp": datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS),
-        "iat": datetime.now(timezone.utc)
-    }
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+        "exp": now + JWT_EXPIRATION_HOURS * 3600,
+        "iat": now
+    })
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(payload)
+    signature = hmac.new(JWT_SECRET.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
 
 def decode_jwt_token(token: str) -> dict:
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = _jwt_cache.get(cache_key)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    # Never serve a cached payload past the token's own expiry
+    ttl = min(_jwt_cache.ttl, payload.get("exp", 0) - time.time())
+    if ttl > 0:
+        _jwt_cache.set(cache_key, payload, ttl)
+    return payload
+
+async def load_user(request: Request, token: str) -> Optional[dict]:
+    """Resolve the user for a bearer token, at most once per request.
+
+    The result is kept on request.state so get_current_user_full and
+    get_optional_user share one users lookup when both end up in a request.
+    """
+    if hasattr(request.state, "user"):
+        return request.state.user
+    payload = decode_jwt_token(token)
+    user = _user_cache.get(payload["sub"])
+    if user is None:
+        pool = await get_db_pool()
+        row = await pool.fetchrow(
+            SQL_USER_BY_ID,
+            payload["sub"]
+        )
+        if row:
+            user = dict(row)
+            _user_cache.set(payload["sub"], user)
+    request.state.user = user
+    return user
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """Id and email of the caller, from the verified token.
+
+    The account must still exist, so a token for a deleted user stops
+    working; that check goes through _user_cache and only reaches the
+    users table once per user every 30 seconds. Use get_current_user_full
+    for the stored profile.
+    """
     if not credentials:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     payload = decode_jwt_token(credentials.credentials)
-    pool = await get_db_pool()
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT id, email, name, google_id, avatar_url, created_at FROM users WHERE id = $1",
-            payload["sub"]
-        )
-    if not row:
+    user_id = payload["sub"]
+    if _user_cache.get(user_id) is None:
+        pool = await get_db_pool()
+        row = await pool.fetchrow(SQL_USER_BY_ID, user_id)
+        if not row:
+            raise HTTPException(status_code=401, detail="User not found")
+        _user_cache.set(user_id, dict(row))
+    return {"id": user_id, "email": payload.get("email")}
+
+async def get_current_user_full(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    if not credentials:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    user = await load_user(request, credentials.credentials)
+    if not user:
         raise HTTPException(status_code=401, detail="User not found")
-    return dict(row)
+    return user
 
-async def get_optional_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Optional[dict]:
+async def get_optional_user(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)) -> Optional[dict]:
     """Get current user if authenticated, otherwise return None"""
     if not credentials:
         return None
     try:
-        payload = decode_jwt_token(credentials.credentials)
-        pool = await get_db_pool()
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT id, email, name, google_id, avatar_url, created_at FROM users WHERE id = $1",
-                payload["sub"]
-            )
-        return dict(row) if row else None
+        return await load_user(request, credentials.credentials)
     except:
         return None
 
@@ -320,6 +581,67 @@ class SettingsUpdate(BaseModel):
     ai_provider: str
     ai_model: str
 
+def _response_defaults(model) -> dict:
+    """Defaults a response model would fill in for keys missing from a row"""
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+        if not field.is_required()
+    }
+
+# Task list/get/update build their dicts from rows and return them via
+# ORJSONResponse rather than through response_model validation; see
+# DUMP_RESPONSE_DEFAULTS.
+TASK_RESPONSE_DEFAULTS = _response_defaults(Task)
+# Keys a Task response carries, in model order; the list projects rows onto
+# these so it returns exactly what response_model=List[Task] used to
+TASK_RESPONSE_FIELDS = tuple(Task.model_fields)
+
+# Extracted priority label -> numeric task priority
+PRIORITY_FROM_LABEL = {
+    "high": 4,
+    "medium": 2,
+    "low": 1,
+    None: 2,  # Default to medium if null
+}
+
+# Impakt indicators in a task's title/notes (matched against lowercased text)
+HIGH_IMPAKT_RE = re.compile(
+    r"very\s+important|high\s+impact|critical\s+impact|high\s+leverage|very\s+high\s+importance"
+)
+MEDIUM_IMPAKT_RE = re.compile(r"important|medium\s+impact|some\s+importance")
+
+def _hours(m):
+    return int(m.group(1)) * 60
+
+def _minutes(m):
+    return int(m.group(1))
+
+# Duration mentions (both numeric and written-out numbers), first match wins
+DURATION_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), converter) for pattern, converter in [
+    # Numeric patterns
+    (r"(\d+)\s*hours?", _hours),
+    (r"(\d+)\s*hrs?", _hours),
+    (r"(\d+)\s*h\b", _hours),
+    (r"(\d+)\s*minutes?", _minutes),
+    (r"(\d+)\s*mins?", _minutes),
+    (r"(\d+)\s*m\b", _minutes),
+    # Written-out numbers (common patterns)
+    (r"one\s*hour", lambda m: 60),
+    (r"two\s*hours?", lambda m: 120),
+    (r"three\s*hours?", lambda m: 180),
+    (r"four\s*hours?", lambda m: 240),
+    (r"five\s*hours?", lambda m: 300),
+    (r"half\s*an?\s*hour", lambda m: 30),
+    (r"quarter\s*hour", lambda m: 15),
+    # "takes X hours" pattern (handles "that takes two hours")
+    (r"takes?\s+(\d+)\s*hours?", _hours),
+    (r"takes?\s+two\s*hours?", lambda m: 120),
+    (r"takes?\s+one\s*hour", lambda m: 60),
+    (r"that\s+takes?\s+two\s*hours?", lambda m: 120),
+    (r"that\s+takes?\s+(\d+)\s*hours?", _hours),
+])
+
 def transform_task_to_frontend_format(task_data: dict) -> dict:
     """
     Transform task from new schema (title, due_date, notes, priority) 
@@ -331,19 +653,8 @@ def transform_task_to_frontend_format(task_data: dict) -> dict:
     Returns:
         Task in frontend format
     """
-    # Map priority string to numeric values
-    priority_map = {
-        "high": 4,
-        "medium": 2,
-        "low": 1,
-        None: 2,  # Default to medium if null
-    }
-    
-    priority_str = task_data.get("priority", "medium")
-    if priority_str not in priority_map:
-        priority_str = "medium"
-    
-    priority_num = priority_map[priority_str]
+    # Map priority string to numeric values; anything unknown is medium
+    priority_num = PRIORITY_FROM_LABEL.get(task_data.get("priority", "medium"), 2)
     
     # Determine impakt from text analysis and priority
     # Check for "very important", "important", "high impact" etc. in notes/title
@@ -352,31 +663,11 @@ def transform_task_to_frontend_format(task_data: dict) -> dict:
     text_to_check = f"{title} {notes}".lower()
     
     impakt = None  # Default: not set
-    # Check for high impakt indicators
-    high_impakt_patterns = [
-        r"very\s+important",
-        r"high\s+impact",
-        r"critical\s+impact",
-        r"high\s+leverage",
-        r"very\s+high\s+importance",
-    ]
-    import re
-    for pattern in high_impakt_patterns:
-        if re.search(pattern, text_to_check):
-            impakt = "high"
-            break
-    
-    # If no high impakt found, check for medium/low indicators
-    if impakt is None:
-        medium_impakt_patterns = [
-            r"important",
-            r"medium\s+impact",
-            r"some\s+importance",
-        ]
-        for pattern in medium_impakt_patterns:
-            if re.search(pattern, text_to_check):
-                impakt = "medium"
-                break
+    # Check for high impakt indicators, then medium/low ones
+    if HIGH_IMPAKT_RE.search(text_to_check):
+        impakt = "high"
+    elif MEDIUM_IMPAKT_RE.search(text_to_check):
+        impakt = "medium"
     
     # If still None, leave it as None (not set) - reduces friction for new tasks
     
@@ -404,39 +695,11 @@ def transform_task_to_frontend_format(task_data: dict) -> dict:
     # If AI didn't extract duration, try to parse from notes and title
     if duration is None or not isinstance(duration, (int, float)) or duration <= 0:
         duration = 30  # Default
-        import re
         
         # Check both notes and title for duration mentions
-        title = task_data.get("title", "") or ""
-        text_to_search = f"{title} {notes}".lower()
-        
-        # Look for duration mentions (both numeric and written-out numbers)
-        duration_patterns = [
-            # Numeric patterns
-            (r"(\d+)\s*hours?", lambda m: int(m.group(1)) * 60),
-            (r"(\d+)\s*hrs?", lambda m: int(m.group(1)) * 60),
-            (r"(\d+)\s*h\b", lambda m: int(m.group(1)) * 60),
-            (r"(\d+)\s*minutes?", lambda m: int(m.group(1))),
-            (r"(\d+)\s*mins?", lambda m: int(m.group(1))),
-            (r"(\d+)\s*m\b", lambda m: int(m.group(1))),
-            # Written-out numbers (common patterns)
-            (r"one\s*hour", lambda m: 60),
-            (r"two\s*hours?", lambda m: 120),
-            (r"three\s*hours?", lambda m: 180),
-            (r"four\s*hours?", lambda m: 240),
-            (r"five\s*hours?", lambda m: 300),
-            (r"half\s*an?\s*hour", lambda m: 30),
-            (r"quarter\s*hour", lambda m: 15),
-            # "takes X hours" pattern (handles "that takes two hours")
-            (r"takes?\s+(\d+)\s*hours?", lambda m: int(m.group(1)) * 60),
-            (r"takes?\s+two\s*hours?", lambda m: 120),
-            (r"takes?\s+one\s*hour", lambda m: 60),
-            (r"that\s+takes?\s+two\s*hours?", lambda m: 120),
-            (r"that\s+takes?\s+(\d+)\s*hours?", lambda m: int(m.group(1)) * 60),
-        ]
-        
-        for pattern, converter in duration_patterns:
-            match = re.search(pattern, text_to_search)
+        text_to_search = f"{title} {notes}"
+        for pattern, converter in DURATION_PATTERNS:
+            match = pattern.search(text_to_search)
             if match:
                 duration = converter(match)
                 break
@@ -3315,29 +3578,31 @@ async def health():
 @api_router.post("/auth/signup", response_model=AuthResponse)
 async def signup(user_data: UserSignup):
     """Register a new user with email and password"""
+    # Hash before taking a connection so the pool isn't held during bcrypt
+    hashed_password = await hash_password(user_data.password)
+    email = user_data.email.lower()
     pool = await get_db_pool()
-    async with pool.acquire() as conn:
-        # Check if user exists
-        existing = await conn.fetchrow("SELECT id FROM users WHERE email = $1", user_data.email.lower())
-        if existing:
-            raise HTTPException(status_code=400, detail="Email already registered")
-        
-        # Create user
-        user_id = str(uuid.uuid4())
-        created_at = datetime.now(timezone.utc)
-        await conn.execute(
-            """INSERT INTO users (id, email, name, hashed_password, created_at) 
-               VALUES ($1, $2, $3, $4, $5)""",
-            user_id, user_data.email.lower(), user_data.name, hash_password(user_data.password), created_at
-        )
+    # Create user in one round trip; the unique email constraint rejects an
+    # existing account
+    user_id = str(uuid.uuid4())
+    created_at = datetime.now(timezone.utc)
+    inserted = await pool.fetchval(
+        """INSERT INTO users (id, email, name, hashed_password, created_at) 
+           VALUES ($1, $2, $3, $4, $5)
+           ON CONFLICT (email) DO NOTHING
+           RETURNING id""",
+        user_id, email, user_data.name, hashed_password, created_at
+    )
+    if inserted is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Generate token
-    token = create_jwt_token(user_id, user_data.email.lower())
+    token = create_jwt_token(user_id, email)
     
-    return AuthResponse(
-        token=token,
-        user={"id": user_id, "email": user_data.email.lower(), "name": user_data.name, "avatar_url": None}
-    )
+    return ORJSONResponse({
+        "token": token,
+        "user": {"id": user_id, "email": email, "name": user_data.name, "avatar_url": None}
+    })
 
 @api_router.post("/auth/login", response_model=AuthResponse)
 async def login(credentials: UserLogin):
@@ -3352,21 +3617,41 @@ async def login(credentials: UserLogin):
     if not user or not user["hashed_password"]:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
-    if not verify_password(credentials.password, user["hashed_password"]):
+    valid, new_hash = await verify_and_update_password(credentials.password, user["hashed_password"])
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid email or password")
+    if new_hash:
+        # Upgrade a bcrypt (or outdated Argon2) hash now that the password is known
+        await pool.execute(
+            "UPDATE users SET hashed_password = $1 WHERE id = $2",
+            new_hash, user["id"]
+        )
     
     token = create_jwt_token(user["id"], user["email"])
     
-    return AuthResponse(
-        token=token,
-        user={"id": user["id"], "email": user["email"], "name": user["name"] or "", "avatar_url": user["avatar_url"]}
-    )
+    return ORJSONResponse({
+        "token": token,
+        "user": {"id": user["id"], "email": user["email"], "name": user["name"] or "", "avatar_url": user["avatar_url"]}
+    })
 
 @api_router.get("/auth/me")
-async def get_me(user: dict = Depends(get_current_user)):
+async def get_me(user: dict = Depends(get_current_user_full)):
     """Get current authenticated user"""
     return user
 
+# Login auth URL up to its redirect_uri, which is the only per-request part,
+# and the full URL for the default callback
+GOOGLE_LOGIN_AUTH_URL_PREFIX = "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode({
+    "client_id": GOOGLE_CLIENT_ID,
+    "response_type": "code",
+    "scope": "openid email profile",
+    "access_type": "offline",
+    "prompt": "consent",
+}) + "&redirect_uri=" if GOOGLE_CLIENT_ID else None
+GOOGLE_LOGIN_AUTH_URL = (
+    GOOGLE_LOGIN_AUTH_URL_PREFIX + quote_plus(GOOGLE_AUTH_REDIRECT_URI) if GOOGLE_CLIENT_ID else None
+)
+
 @api_router.get("/auth/google/url")
 async def get_google_auth_url(redirect_uri: Optional[str] = None):
     """Get Google OAuth URL for login"""
@@ -3374,20 +3659,36 @@ async def get_google_auth_url(redirect_uri: Optional[str] = None):
         raise HTTPException(status_code=500, detail="Google OAuth not configured")
     
     # Use provided redirect_uri or default
-    callback_uri = redirect_uri or GOOGLE_AUTH_REDIRECT_URI
-    
-    params = {
-        "client_id": GOOGLE_CLIENT_ID,
-        "redirect_uri": callback_uri,
-        "response_type": "code",
-        "scope": "openid email profile",
-        "access_type": "offline",
-        "prompt": "consent"
+    if not redirect_uri:
+        return {"url": GOOGLE_LOGIN_AUTH_URL}
+    return {"url": GOOGLE_LOGIN_AUTH_URL_PREFIX + quote_plus(redirect_uri)}
+
+GOOGLE_ID_TOKEN_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+def google_id_token_claims(id_token: Optional[str]) -> Optional[dict]:
+    """User info from the id_token in Google's token response, in userinfo's shape.
+
+    The token comes straight from Google's token endpoint over TLS, so per
+    Google's OpenID Connect docs its signature needn't be checked; audience
+    and issuer still are. Returns None if the token is missing or unusable.
+    """
+    if not id_token:
+        return None
+    try:
+        claims = jwt.decode(id_token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+    if claims.get("aud") != GOOGLE_CLIENT_ID or claims.get("iss") not in GOOGLE_ID_TOKEN_ISSUERS:
+        logger.warning("Ignoring Google id_token with unexpected audience or issuer")
+        return None
+    if not claims.get("sub") or not claims.get("email"):
+        return None
+    return {
+        "id": claims["sub"],
+        "email": claims["email"],
+        "name": claims.get("name", ""),
+        "picture": claims.get("picture"),
     }
-    
-    from urllib.parse import urlencode
-    auth_url = f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
-    return {"url": auth_url}
 
 @api_router.post("/auth/google", response_model=AuthResponse)
 async def google_auth(auth_data: GoogleAuthRequest):
@@ -3399,7 +3700,7 @@ async def google_auth(auth_data: GoogleAuthRequest):
     callback_uri = auth_data.redirect_uri or GOOGLE_AUTH_REDIRECT_URI
     
     # Exchange code for tokens
-    token_response = requests.post(
+    token_response = await http_client.post(
         "https://oauth2.googleapis.com/token",
         data={
             "client_id": GOOGLE_CLIENT_ID,
@@ -3414,19 +3715,19 @@ async def google_auth(auth_data: GoogleAuthRequest):
         logger.error(f"Google token exchange failed: {token_response.text}")
         raise HTTPException(status_code=400, detail="Failed to authenticate with Google")
     
-    tokens = token_response.json()
-    access_token = tokens.get("access_token")
-    
-    # Get user info from Google
-    user_info_response = requests.get(
-        "https://www.googleapis.com/oauth2/v2/userinfo",
-        headers={"Authorization": f"Bearer {access_token}"}
-    )
-    
-    if user_info_response.status_code != 200:
-        raise HTTPException(status_code=400, detail="Failed to get user info from Google")
-    
-    google_user = user_info_response.json()
+    tokens = orjson.loads(token_response.content)
+    google_user = google_id_token_claims(tokens.get("id_token"))
+    if google_user is None:
+        # No usable id_token; fall back to the userinfo endpoint
+        user_info_response = await http_client.get(
+            "https://www.googleapis.com/oauth2/v2/userinfo",
+            headers={"Authorization": f"Bearer {tokens.get('access_token')}"}
+        )
+        
+        if user_info_response.status_code != 200:
+            raise HTTPException(status_code=400, detail="Failed to get user info from Google")
+        
+        google_user = orjson.loads(user_info_response.content)
     google_id = google_user.get("id")
     email = google_user.get("email", "").lower()
     name = google_user.get("name", "")
@@ -3434,53 +3735,121 @@ async def google_auth(auth_data: GoogleAuthRequest):
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Check if user exists by google_id or email
-        existing_user = await conn.fetchrow(
-            "SELECT id, email, name, avatar_url FROM users WHERE google_id = $1 OR email = $2",
-            google_id, email
+        # Link Google to the account matching google_id or email, or create
+        # one, in a single statement. A concurrent first login that loses the
+        # insert race lands in ON CONFLICT and links instead.
+        user = await conn.fetchrow(
+            """WITH upd AS (
+                   UPDATE users
+                   SET google_id = $4, avatar_url = COALESCE($5, avatar_url), name = COALESCE(NULLIF(name, ''), $3)
+                   WHERE id = (SELECT id FROM users WHERE google_id = $4 OR email = $2 LIMIT 1)
+                   RETURNING id, email, name, avatar_url
+               ), ins AS (
+                   INSERT INTO users (id, email, name, google_id, avatar_url, created_at)
+                   SELECT $1, $2, $3, $4, $5, $6::timestamptz
+                   WHERE NOT EXISTS (SELECT 1 FROM upd)
+                   ON CONFLICT (email) DO UPDATE
+                   SET google_id = EXCLUDED.google_id,
+                       avatar_url = COALESCE(EXCLUDED.avatar_url, users.avatar_url),
+                       name = COALESCE(NULLIF(users.name, ''), EXCLUDED.name)
+                   RETURNING id, email, name, avatar_url
+               )
+               SELECT * FROM upd UNION ALL SELECT * FROM ins""",
+            str(uuid.uuid4()), email, name, google_id, avatar_url, datetime.now(timezone.utc)
         )
-        
-        if existing_user:
-            # Update Google info
-            await conn.execute(
-                "UPDATE users SET google_id = $1, avatar_url = COALESCE($2, avatar_url), name = COALESCE(NULLIF(name, ''), $3) WHERE id = $4",
-                google_id, avatar_url, name, existing_user["id"]
-            )
-            user_id = existing_user["id"]
-            user_email = existing_user["email"]
-            user_name = existing_user["name"] or name
-            user_avatar = avatar_url or existing_user["avatar_url"]
-        else:
-            # Create new user
-            user_id = str(uuid.uuid4())
-            created_at = datetime.now(timezone.utc)
-            await conn.execute(
-                """INSERT INTO users (id, email, name, google_id, avatar_url, created_at) 
-                   VALUES ($1, $2, $3, $4, $5, $6)""",
-                user_id, email, name, google_id, avatar_url, created_at
-            )
-            user_email = email
-            user_name = name
-            user_avatar = avatar_url
+    _user_cache.pop(user["id"])
+    user_id = user["id"]
+    user_email = user["email"]
+    user_name = user["name"] or name
+    user_avatar = user["avatar_url"]
     
     # Generate JWT token
     token = create_jwt_token(user_id, user_email)
     
-    return AuthResponse(
-        token=token,
-        user={"id": user_id, "email": user_email, "name": user_name, "avatar_url": user_avatar}
+    return ORJSONResponse({
+        "token": token,
+        "user": {"id": user_id, "email": user_email, "name": user_name, "avatar_url": user_avatar}
+    })
+
+# Tables and columns added by migrations. Tables and columns don't get
+# dropped under a running server, so ones found are remembered for good;
+# misses expire after a minute, so a migration is picked up without a restart
+# and a not-yet-migrated schema isn't probed on every request.
+_schema_present: set = set()
+_schema_absent = TTLCache(maxsize=256, ttl=60)
+
+async def _schema_has(conn, key: tuple, query: str) -> bool:
+    if key in _schema_present:
+        return True
+    if _schema_absent.get(key):
+        return False
+    exists = await conn.fetchval(query, *key)
+    if exists:
+        _schema_present.add(key)
+    else:
+        _schema_absent.set(key, True)
+    return exists
+
+async def check_table_exists(conn, table_name: str) -> bool:
+    """Check if a table exists in the public schema"""
+    return await _schema_has(
+        conn, (table_name,),
+        """SELECT EXISTS (
+           SELECT 1 FROM information_schema.tables 
+           WHERE table_schema = 'public' 
+           AND table_name = $1
+        )"""
+    )
+
+async def column_exists(conn, table_name: str, column_name: str) -> bool:
+    """Check if a column exists on a table in the public schema"""
+    return await _schema_has(
+        conn, (table_name, column_name),
+        """SELECT EXISTS (
+           SELECT 1 FROM information_schema.columns 
+           WHERE table_schema = 'public' 
+           AND table_name = $1 
+           AND column_name = $2
+        )"""
     )
 
+# Optional tasks columns the handlers check for; once all are present the
+# column set is final and kept for good, otherwise it is re-read after a minute
+TASK_OPTIONAL_COLUMNS = frozenset({'impakt', 'energy_required', 'completed_at', 'sort_order'})
+_tasks_columns = TTLCache(maxsize=1, ttl=60)
+
+async def get_tasks_existing_columns(conn) -> frozenset:
+    """Get set of all existing column names in tasks table"""
+    columns = _tasks_columns.get('tasks')
+    if columns is None:
+        rows = await conn.fetch(
+            """SELECT column_name FROM information_schema.columns 
+               WHERE table_schema = 'public' 
+               AND table_name = 'tasks'"""
+        )
+        columns = frozenset(row['column_name'] for row in rows)
+        _tasks_columns.set('tasks', columns, float('inf') if TASK_OPTIONAL_COLUMNS <= columns else None)
+    return columns
+
 # Helper function to build task SELECT clause and convert rows
 async def build_task_select_clause(conn, include_optional: bool = True) -> tuple:
-    """Build SELECT clause for tasks, handling migration from importance to impakt."""
-    impakt_exists = await conn.fetchval(
-        """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'impakt')"""
-    )
-    energy_required_exists = await conn.fetchval(
-        """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'energy_required')"""
-    )
-    
+    """Build SELECT clause for tasks, handling migration from importance to impakt.
+
+    Once both migrations have run, this costs no queries, and list/get/update
+    always send the same statement text, which session-mode connections
+    prepare once and reuse.
+    """
+    impakt_exists = await column_exists(conn, 'tasks', 'impakt')
+    energy_required_exists = await column_exists(conn, 'tasks', 'energy_required')
+    return task_select_clause(impakt_exists, energy_required_exists), impakt_exists
+
+@lru_cache(maxsize=None)
+def task_select_clause(impakt_exists: bool, energy_required_exists: bool) -> str:
+    """SELECT clause for tasks given which optional columns exist.
+
+    Cached, so each schema state always yields the same string object and
+    statement texts built from it hash and compare cheaply downstream.
+    """
     if impakt_exists:
         base_select = """id, user_id, title, description, priority, impakt, 
                    scheduled_date::text, scheduled_time, duration, status, created_at::text"""
@@ -3497,21 +3866,42 @@ async def build_task_select_clause(conn, include_optional: bool = True) -> tuple
                    scheduled_date::text, scheduled_time, duration, status, created_at::text"""
     
     energy_select = ", energy_required" if energy_required_exists else ""
-    select_clause = base_select + energy_select
-    
-    return select_clause, impakt_exists
+    return base_select + energy_select
+
+@lru_cache(maxsize=None)
+def task_update_returning_clause(impakt_exists: bool, energy_required_exists: bool,
+                                 completed_at_exists: bool, sort_order_exists: bool) -> str:
+    """RETURNING clause for update_task, so the updated row comes back in one query"""
+    completed_at_returning = ", completed_at::text" if completed_at_exists else ""
+    sort_order_returning = ", sort_order" if sort_order_exists else ""
+    return task_select_clause(impakt_exists, energy_required_exists) + completed_at_returning + sort_order_returning
+
+@lru_cache(maxsize=256)
+def build_task_update_sql(field_names: tuple, returning_clause: str) -> str:
+    """Build the UPDATE for a task, once per field set.
 
-def convert_task_row_to_dict(row: dict) -> dict:
-    """Convert a database row to Task dict format, handling impakt conversion."""
-    task_dict = dict(row)
+    SET params are $1..$n in field_names order, followed by task id and user id.
+    """
+    n = len(field_names)
+    set_clause = ', '.join(f"{name} = ${i}" for i, name in enumerate(field_names, start=1))
+    return f"""UPDATE tasks SET {set_clause} 
+                WHERE id = ${n + 1} AND user_id = ${n + 2}
+                RETURNING {returning_clause}"""
+
+# Integer impakt values from before the importance -> impakt migration
+IMPAKT_FROM_INT = {1: 'low', 2: 'medium', 3: 'high', 4: 'high'}
+
+def convert_task_row_to_dict(row: dict, defaults: Optional[dict] = None) -> dict:
+    """Convert a database row to Task dict format, handling impakt conversion.
+
+    With defaults (e.g. TASK_RESPONSE_DEFAULTS), keys missing from the row
+    are filled in while copying it, rather than in a second dict.
+    """
+    task_dict = {**defaults, **row} if defaults else dict(row)
     # Ensure impakt is a string (low/medium/high) or None
-    if 'impakt' in task_dict:
-        if task_dict['impakt'] is None or isinstance(task_dict['impakt'], str):
-            pass  # Already correct
-        else:
-            # Convert integer to string if needed
-            impakt_map = {1: 'low', 2: 'medium', 3: 'high', 4: 'high'}
-            task_dict['impakt'] = impakt_map.get(task_dict['impakt'])
+    impakt = task_dict.get('impakt')
+    if impakt is not None and not isinstance(impakt, str):
+        task_dict['impakt'] = IMPAKT_FROM_INT.get(impakt)
     # Remove urgency if it exists (shouldn't be selected, but just in case)
     task_dict.pop('urgency', None)
     task_dict.pop('importance', None)  # Remove old field from response
@@ -3520,21 +3910,21 @@ def convert_task_row_to_dict(row: dict) -> dict:
 # Task CRUD
 @api_router.post("/tasks", response_model=Task)
 async def create_task(task_input: TaskCreate, user: dict = Depends(get_current_user)):
-    task = Task(**task_input.model_dump(), user_id=user["id"])
+    # One timestamp for both the stored row and the returned task
+    created_at = datetime.now(timezone.utc)
+    task = Task(**task_input.model_dump(), user_id=user["id"], created_at=created_at.isoformat())
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         # Convert expires_at string to datetime if provided
         expires_at_value = None
         if task.expires_at:
             try:
-                expires_at_value = datetime.fromisoformat(task.expires_at.replace('Z', '+00:00'))
+                expires_at_value = parse_iso_datetime(task.expires_at)
             except (ValueError, AttributeError):
                 expires_at_value = None
         
         # Check if impakt column exists, otherwise fall back to importance for migration
-        impakt_exists = await conn.fetchval(
-            """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'impakt')"""
-        )
+        impakt_exists = await column_exists(conn, 'tasks', 'impakt')
         
         if impakt_exists:
             # Map impakt string to integer for backwards compatibility if needed
@@ -3544,7 +3934,7 @@ async def create_task(task_input: TaskCreate, user: dict = Depends(get_current_u
                    scheduled_date, scheduled_time, duration, status, expires_at, created_at)
                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)""",
                 task.id, user["id"], task.title, task.description, task.priority, impakt_value,
-                task.scheduled_date, task.scheduled_time, task.duration, task.status, expires_at_value, datetime.now(timezone.utc)
+                task.scheduled_date, task.scheduled_time, task.duration, task.status, expires_at_value, created_at
             )
         else:
             # Fallback: map impakt to old importance integer format during migration
@@ -3555,31 +3945,81 @@ async def create_task(task_input: TaskCreate, user: dict = Depends(get_current_u
                    scheduled_date, scheduled_time, duration, status, expires_at, created_at)
                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)""",
                 task.id, user["id"], task.title, task.description, task.priority, importance_value,
-                task.scheduled_date, task.scheduled_time, task.duration, task.status, expires_at_value, datetime.now(timezone.utc)
+                task.scheduled_date, task.scheduled_time, task.duration, task.status, expires_at_value, created_at
             )
     return task
 
+# Task list order. NULL priority sorts first, as plain "priority DESC" does,
+# but as a value a row comparison can page past; created_at and id make the
+# order total so keyset pages never skip or repeat a row.
+TASK_LIST_ORDER_KEY = "COALESCE(priority, 2147483647), created_at, id"
+TASK_LIST_ORDER = "COALESCE(priority, 2147483647) DESC, created_at DESC, id DESC"
+
+def encode_task_cursor(row) -> str:
+    """Opaque keyset cursor pointing just past row"""
+    priority = row["priority"] if row["priority"] is not None else 2147483647
+    raw = f"{priority},{row['created_at']},{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_task_cursor(cursor: str) -> tuple:
+    try:
+        priority, created_at, task_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(",", 2)
+        return int(priority), created_at, task_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @api_router.get("/tasks", response_model=List[Task])
-async def get_tasks(status: Optional[str] = None, user: dict = Depends(get_current_user)):
+async def get_tasks(
+    status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    user: dict = Depends(get_current_user),
+):
+    """List tasks, optionally one page at a time.
+
+    Without limit every task is returned, as before. With limit, at most
+    that many come back and, if there are more, X-Next-Cursor carries the
+    cursor for the next page.
+    """
+    conditions = ["user_id = $1"]
+    params = [user["id"]]
+    if status:
+        params.append(status)
+        conditions.append(f"status = ${len(params)}")
+    if cursor:
+        params.extend(decode_task_cursor(cursor))
+        n = len(params)
+        conditions.append(f"({TASK_LIST_ORDER_KEY}) < (${n - 2}, ${n - 1}::text::timestamptz, ${n})")
+    limit_clause = ""
+    if limit:
+        # One extra row tells whether another page exists
+        params.append(limit + 1)
+        limit_clause = f" LIMIT ${len(params)}"
+    
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         select_clause, _ = await build_task_select_clause(conn)
-        
-        if status:
-            rows = await conn.fetch(
-                f"""SELECT {select_clause}
-                   FROM tasks WHERE user_id = $1 AND status = $2 ORDER BY priority DESC""",
-                user["id"], status
-            )
-        else:
+        try:
             rows = await conn.fetch(
                 f"""SELECT {select_clause}
-                   FROM tasks WHERE user_id = $1 ORDER BY priority DESC""",
-                user["id"]
+                   FROM tasks WHERE {' AND '.join(conditions)}
+                   ORDER BY {TASK_LIST_ORDER}{limit_clause}""",
+                *params
             )
+        except asyncpg.DataError:
+            # Only the cursor's timestamp can be malformed here
+            raise HTTPException(status_code=400, detail="Invalid cursor")
     
-    result = [convert_task_row_to_dict(row) for row in rows]
-    return result
+    headers = {}
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = encode_task_cursor(rows[-1])
+    
+    tasks = []
+    for row in rows:
+        task = convert_task_row_to_dict(row, TASK_RESPONSE_DEFAULTS)
+        tasks.append({name: task[name] for name in TASK_RESPONSE_FIELDS})
+    return ORJSONResponse(tasks, headers=headers)
 
 @api_router.get("/tasks/{task_id}", response_model=Task)
 async def get_task(task_id: str, user: dict = Depends(get_current_user)):
@@ -3594,7 +4034,7 @@ async def get_task(task_id: str, user: dict = Depends(get_current_user)):
         )
     if not row:
         raise HTTPException(status_code=404, detail="Task not found")
-    return convert_task_row_to_dict(row)
+    return ORJSONResponse(convert_task_row_to_dict(row, TASK_RESPONSE_DEFAULTS))
 
 @api_router.patch("/tasks/{task_id}", response_model=Task)
 async def update_task(task_id: str, task_update: TaskUpdate, user: dict = Depends(get_current_user)):
@@ -3614,18 +4054,19 @@ async def update_task(task_id: str, task_update: TaskUpdate, user: dict = Depend
         raise HTTPException(status_code=400, detail="No update data provided")
     
     pool = await get_db_pool()
+    
     async with pool.acquire() as conn:
-        # Check if energy_required column exists before filtering
-        energy_required_exists = await conn.fetchval(
-            """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'energy_required')"""
+        # The column set is cached, so normally only the status read hits the database
+        existing_columns = await get_tasks_existing_columns(conn)
+        current_task = await conn.fetchrow(
+            "SELECT status FROM tasks WHERE id = $1 AND user_id = $2", task_id, user["id"]
         )
+        energy_required_exists = 'energy_required' in existing_columns
+        impakt_exists = 'impakt' in existing_columns
+        completed_at_exists = 'completed_at' in existing_columns
+        sort_order_exists = 'sort_order' in existing_columns
         
         # Build dynamic update query with proper parameterization
-        # Check if impakt column exists
-        impakt_exists = await conn.fetchval(
-            """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'impakt')"""
-        )
-        
         # Only allow updating specific fields that exist in the database
         allowed_fields = {'title', 'description', 'priority', 
                          'scheduled_date', 'scheduled_time', 'duration', 'status', 'expires_at', 'sort_order'}
@@ -3654,7 +4095,6 @@ async def update_task(task_id: str, task_update: TaskUpdate, user: dict = Depend
             raise HTTPException(status_code=400, detail="No valid fields to update")
         
         # Check current status before updating (to detect status changes)
-        current_task = await conn.fetchrow("SELECT status FROM tasks WHERE id = $1 AND user_id = $2", task_id, user["id"])
         if not current_task:
             raise HTTPException(status_code=404, detail="Task not found or you don't have permission")
         
@@ -3678,62 +4118,37 @@ async def update_task(task_id: str, task_update: TaskUpdate, user: dict = Depend
         status_changing_to_completed = new_status == 'completed' and current_status != 'completed'
         status_changing_from_completed = current_status == 'completed' and new_status and new_status != 'completed'
         
-        set_clauses = []
+        # Fields go in sorted order so each field set maps to one SQL text
+        field_names = []
         values = []
-        param_num = 1
-        for key, value in filtered_data.items():
-            # Double-check that energy_required column exists if we're trying to update it
-            if key == 'energy_required' and not energy_required_exists:
-                logger.warning(f"Skipping update to energy_required - column does not exist")
-                continue
-            
-            logger.info(f"[update_task] Adding SET clause: {key} = ${param_num} (value: {value}, type: {type(value).__name__})")
-            set_clauses.append(f"{key} = ${param_num}")
+        for key in sorted(filtered_data):
+            value = filtered_data[key]
             # Convert date strings to date objects for asyncpg
             if key == 'scheduled_date' and isinstance(value, str):
                 try:
                     # Parse YYYY-MM-DD format string to date object
-                    value = datetime.strptime(value, "%Y-%m-%d").date()
+                    value = date.fromisoformat(value)
                 except ValueError:
                     raise HTTPException(status_code=400, detail=f"Invalid date format for scheduled_date: {value}. Expected YYYY-MM-DD")
+            field_names.append(key)
             values.append(value)
-            param_num += 1
         
         # Set completed_at when marking as completed, clear it when uncompleting
-        completed_at_exists = await conn.fetchval(
-            """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'completed_at')"""
-        )
-        
         if completed_at_exists:
             if status_changing_to_completed:
-                set_clauses.append(f"completed_at = ${param_num}")
+                field_names.append('completed_at')
                 values.append(datetime.now(timezone.utc))
-                param_num += 1
             elif status_changing_from_completed:
-                set_clauses.append(f"completed_at = ${param_num}")
+                field_names.append('completed_at')
                 values.append(None)
-                param_num += 1
         
-        # Add task_id and user_id as final parameters
-        where_clause = f"id = ${param_num} AND user_id = ${param_num + 1}"
         values.extend([task_id, user["id"]])
         
-        # Check if sort_order column exists (completed_at already checked above)
-        sort_order_exists = await conn.fetchval(
-            """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'sort_order')"""
+        # RETURNING clause from the columns probed above
+        returning_clause = task_update_returning_clause(
+            impakt_exists, energy_required_exists, completed_at_exists, sort_order_exists
         )
-        # energy_required_exists already checked above
-        
-        # Build RETURNING clause dynamically using helper
-        select_clause, _ = await build_task_select_clause(conn)
-        completed_at_returning = ", completed_at::text" if completed_at_exists else ""
-        sort_order_returning = ", sort_order" if sort_order_exists else ""
-        returning_clause = select_clause + completed_at_returning + sort_order_returning
-        
-        # Use RETURNING to get updated row in a single query (much faster)
-        query = f"""UPDATE tasks SET {', '.join(set_clauses)} 
-                    WHERE {where_clause}
-                    RETURNING {returning_clause}"""
+        query = build_task_update_sql(tuple(field_names), returning_clause)
         
         try:
             logger.info(f"Updating task {task_id} with {len(filtered_data)} fields: {list(filtered_data.keys())}")
@@ -3751,17 +4166,6 @@ async def update_task(task_id: str, task_update: TaskUpdate, user: dict = Depend
             if not row:
                 raise HTTPException(status_code=404, detail="Task not found or you don't have permission")
             
-            # Verify the update actually persisted in the database
-            if 'energy_required' in filtered_data:
-                verify_row = await conn.fetchrow(
-                    "SELECT energy_required FROM tasks WHERE id = $1 AND user_id = $2",
-                    task_id, user["id"]
-                )
-                if verify_row:
-                    logger.info(f"  [VERIFY] Database value after update: energy_required = {verify_row.get('energy_required')}")
-                else:
-                    logger.warning(f"  [VERIFY] Could not find task {task_id} to verify update")
-            
             result = dict(row)
             logger.info(f"[update_task] Response data keys: {list(result.keys())}")
             if 'description' in result:
@@ -3777,7 +4181,7 @@ async def update_task(task_id: str, task_update: TaskUpdate, user: dict = Depend
             if 'description' not in result:
                 result['description'] = ""
             
-            return result
+            return ORJSONResponse({**TASK_RESPONSE_DEFAULTS, **result})
         except HTTPException:
             raise
         except Exception as e:
@@ -3799,21 +4203,16 @@ async def delete_task(task_id: str, user: dict = Depends(get_current_user)):
     logger.info(f"Delete task request: task_id={task_id}, user_id={user.get('id')}")
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # First check if task exists
+        # Delete the task; RETURNING tells us whether it existed
         task = await conn.fetchrow(
-            "SELECT id, title, status FROM tasks WHERE id = $1 AND user_id = $2",
+            "DELETE FROM tasks WHERE id = $1 AND user_id = $2 RETURNING id, title",
             task_id, user["id"]
         )
-        if not task:
-            logger.warning(f"Task not found for deletion: task_id={task_id}, user_id={user.get('id')}")
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        # Delete the task
-        result = await conn.execute("DELETE FROM tasks WHERE id = $1 AND user_id = $2", task_id, user["id"])
-        logger.info(f"Task deleted: task_id={task_id}, title={task.get('title')}, result={result}")
     
-    if result == "DELETE 0":
+    if not task:
+        logger.warning(f"Task not found for deletion: task_id={task_id}, user_id={user.get('id')}")
         raise HTTPException(status_code=404, detail="Task not found")
+    logger.info(f"Task deleted: task_id={task_id}, title={task['title']}")
     return {"message": "Task deleted"}
 
 # Metrics endpoints
@@ -3840,14 +4239,7 @@ async def get_done_metrics(
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         # Check if completed_at column exists
-        completed_at_exists = await conn.fetchval(
-            """SELECT EXISTS (
-               SELECT 1 FROM information_schema.columns 
-               WHERE table_schema = 'public' 
-               AND table_name = 'tasks' 
-               AND column_name = 'completed_at'
-            )"""
-        )
+        completed_at_exists = await column_exists(conn, 'tasks', 'completed_at')
         
         if not completed_at_exists:
             # Return 0 count with error indicator (non-blocking)
@@ -3867,14 +4259,14 @@ async def get_done_metrics(
             
             if 'T' in start:
                 # Full ISO datetime string - parse as-is
-                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+                start_dt = parse_iso_datetime(start)
             else:
                 # YYYY-MM-DD format - treat as start of day in UTC
                 start_dt = datetime.strptime(start, "%Y-%m-%d").replace(tzinfo=timezone.utc)
             
             if 'T' in end:
                 # Full ISO datetime string - parse as-is
-                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
+                end_dt = parse_iso_datetime(end)
             else:
                 # YYYY-MM-DD format - treat as end of day in UTC (23:59:59.999)
                 end_dt = datetime.strptime(end, "%Y-%m-%d").replace(hour=23, minute=59, second=59, microsecond=999999, tzinfo=timezone.utc)
@@ -4020,13 +4412,7 @@ async def get_focus_metrics(
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         # Check if focus_sessions table exists
-        table_exists = await conn.fetchval(
-            """SELECT EXISTS (
-               SELECT 1 FROM information_schema.tables 
-               WHERE table_schema = 'public' 
-               AND table_name = 'focus_sessions'
-            )"""
-        )
+        table_exists = await check_table_exists(conn, 'focus_sessions')
         
         if not table_exists:
             # Return 0 values with error indicator (non-blocking)
@@ -4038,8 +4424,8 @@ async def get_focus_metrics(
         
         try:
             # Parse ISO date strings to timestamps
-            start_dt = datetime.fromisoformat(start.replace('Z', '+00:00')) if 'T' in start else datetime.strptime(start, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            end_dt = datetime.fromisoformat(end.replace('Z', '+00:00')) if 'T' in end else datetime.strptime(end, "%Y-%m-%d").replace(hour=23, minute=59, second=59, microsecond=999999, tzinfo=timezone.utc)
+            start_dt = parse_iso_datetime(start) if 'T' in start else datetime.strptime(start, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            end_dt = parse_iso_datetime(end) if 'T' in end else datetime.strptime(end, "%Y-%m-%d").replace(hour=23, minute=59, second=59, microsecond=999999, tzinfo=timezone.utc)
             
             # Query focus sessions within range (by ended_at)
             result = await conn.fetchrow(
@@ -4086,13 +4472,7 @@ async def create_focus_session(
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         # Check if focus_sessions table exists
-        table_exists = await conn.fetchval(
-            """SELECT EXISTS (
-               SELECT 1 FROM information_schema.tables 
-               WHERE table_schema = 'public' 
-               AND table_name = 'focus_sessions'
-            )"""
-        )
+        table_exists = await check_table_exists(conn, 'focus_sessions')
         
         if not table_exists:
             logger.warning("focus_sessions table does not exist. Please run migration.")
@@ -4105,8 +4485,8 @@ async def create_focus_session(
         
         try:
             # Parse ISO datetime strings
-            started_dt = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
-            ended_dt = datetime.fromisoformat(ended_at.replace('Z', '+00:00'))
+            started_dt = parse_iso_datetime(started_at)
+            ended_dt = parse_iso_datetime(ended_at)
             
             # Generate UUID for the session
             session_id = str(uuid.uuid4())
@@ -4146,13 +4526,7 @@ async def get_user_preferences(user: dict = Depends(get_current_user)):
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         # Check if user_preferences table exists
-        table_exists = await conn.fetchval(
-            """SELECT EXISTS (
-               SELECT 1 FROM information_schema.tables 
-               WHERE table_schema = 'public' 
-               AND table_name = 'user_preferences'
-            )"""
-        )
+        table_exists = await check_table_exists(conn, 'user_preferences')
         
         if not table_exists:
             # Return default if table doesn't exist
@@ -4197,7 +4571,7 @@ async def update_user_preferences(
     else:
         # Try to parse JSON body
         try:
-            body = await req.json()
+            body = orjson.loads(await req.body())
             if isinstance(body, dict):
                 energy = body.get("energy_level")
         except:
@@ -4216,13 +4590,7 @@ async def update_user_preferences(
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         # Check if user_preferences table exists
-        table_exists = await conn.fetchval(
-            """SELECT EXISTS (
-               SELECT 1 FROM information_schema.tables 
-               WHERE table_schema = 'public' 
-               AND table_name = 'user_preferences'
-            )"""
-        )
+        table_exists = await check_table_exists(conn, 'user_preferences')
         
         if not table_exists:
             logger.warning("user_preferences table does not exist. Please run migration.")
@@ -4266,14 +4634,7 @@ async def batch_update_sort_order(
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         # Check if sort_order column exists
-        sort_order_exists = await conn.fetchval(
-            """SELECT EXISTS (
-               SELECT 1 FROM information_schema.columns 
-               WHERE table_schema = 'public' 
-               AND table_name = 'tasks' 
-               AND column_name = 'sort_order'
-            )"""
-        )
+        sort_order_exists = await column_exists(conn, 'tasks', 'sort_order')
         
         if not sort_order_exists:
             error_msg = "sort_order column does not exist. Please run migration: ALTER TABLE public.tasks ADD COLUMN IF NOT EXISTS sort_order INTEGER NULL;"
@@ -4282,32 +4643,21 @@ async def batch_update_sort_order(
         
         try:
             async with conn.transaction():
-                # Use a single batch update with CASE WHEN for efficiency
-                task_ids = [str(update['task_id']) for update in updates]
-                case_clauses = []
-                params = []
-                param_num = 1
-                
+                # One UPDATE joined against the unnested (id, sort_order) pairs;
+                # the statement text and its three parameters don't depend on
+                # how many tasks were moved. A repeated task_id keeps its first
+                # sort_order.
+                orders = {}
                 for update in updates:
-                    task_id = str(update['task_id'])
-                    sort_order = int(update['sort_order'])
-                    case_clauses.append(f"WHEN ${param_num}::text THEN ${param_num + 1}::integer")
-                    params.extend([task_id, sort_order])
-                    param_num += 2
-                
-                # Build the query - only update tasks that belong to the current user
-                query = f"""
-                    UPDATE tasks 
-                    SET sort_order = CASE id
-                        {' '.join(case_clauses)}
-                        ELSE sort_order
-                    END
-                    WHERE id = ANY(${param_num}::text[]) 
-                    AND user_id = ${param_num + 1}::text
-                """
-                params.extend([task_ids, user["id"]])
+                    orders.setdefault(str(update['task_id']), int(update['sort_order']))
                 
-                result = await conn.execute(query, *params)
+                # Only update tasks that belong to the current user
+                result = await conn.execute(
+                    """UPDATE tasks SET sort_order = u.sort_order
+                       FROM unnest($1::text[], $2::int[]) AS u(id, sort_order)
+                       WHERE tasks.id = u.id AND tasks.user_id = $3""",
+                    list(orders), list(orders.values()), user["id"]
+                )
                 
                 # Check if all tasks were updated
                 updated_count = int(result.split()[-1])  # "UPDATE N" -> N
@@ -4336,6 +4686,13 @@ async def batch_update_sort_order(
                 error_msg += f" (Error type: {type(e).__name__})"
             raise HTTPException(status_code=500, detail=error_msg)
 
+def queue_task_duration(index: int, duration) -> int:
+    """Duration in minutes for a queued task, 30 if the AI's value is unusable"""
+    if isinstance(duration, (int, float)) and duration > 0:
+        return int(duration)
+    logger.warning(f"Invalid duration for task {index + 1}: {duration}, using default 30")
+    return 30
+
 # Voice processing - Queue mode (returns tasks for review, doesn't save yet)
 @api_router.post("/tasks/process-voice-queue")
 async def process_voice_queue(voice_input: VoiceInput, user: dict = Depends(get_current_user)):
@@ -4350,10 +4707,11 @@ async def process_voice_queue(voice_input: VoiceInput, user: dict = Depends(get_
             voice_input.model
         )
         
-        logger.info(f"AI response received: {len(result.get('tasks', []))} tasks found")
+        raw_tasks = result.get("tasks", [])
+        logger.info(f"AI response received: {len(raw_tasks)} tasks found")
         logger.info(f"Result structure: {json.dumps(result, indent=2, default=str)}")
         
-        if len(result.get("tasks", [])) == 0:
+        if not raw_tasks:
             logger.warning(f"No tasks extracted from transcript: {voice_input.transcript[:200]}")
             return {
                 "success": False,
@@ -4363,32 +4721,25 @@ async def process_voice_queue(voice_input: VoiceInput, user: dict = Depends(get_
             }
         
         # get_ai_response already returns tasks in frontend format
-        # Just add id and order fields for the queue
-        tasks_for_review = []
-        for i, task_data in enumerate(result.get("tasks", [])):
-            logger.info(f"Processing task {i+1} for queue: {json.dumps(task_data, default=str)}")
-            
-            # Ensure duration is valid
-            duration = task_data.get("duration", 30)
-            if not isinstance(duration, (int, float)) or duration <= 0:
-                logger.warning(f"Invalid duration for task {i+1}: {duration}, using default 30")
-                duration = 30
-            
-            task = {
+        # Just add id and order fields for the queue. Each task's full data is
+        # in the "Result structure" log above, so it isn't logged again here.
+        tasks_for_review = [
+            {
                 "id": str(uuid.uuid4()),
                 "title": task_data.get("title", "Untitled Task"),
                 "description": task_data.get("description", ""),
                 "urgency": task_data.get("urgency", 2),
                 "importance": task_data.get("importance", 2),
                 "priority": task_data.get("priority", 2),
-                "duration": int(duration),
+                "duration": queue_task_duration(i, task_data.get("duration", 30)),
                 "order": i,
             }
-            tasks_for_review.append(task)
-            logger.info(f"Added task {i+1} to queue: {task['title']} (duration: {task['duration']}, priority: {task['priority']})")
+            for i, task_data in enumerate(raw_tasks)
+        ]
         
-        # Sort by priority (highest first)
-        tasks_for_review.sort(key=lambda t: t["priority"], reverse=True)
+        # Sort by priority (highest first); the sort is stable, so equal
+        # priorities keep their spoken order
+        tasks_for_review.sort(key=itemgetter("priority"), reverse=True)
         
         logger.info(f"🔍 DIAGNOSTIC: Returning {len(tasks_for_review)} tasks for review from process_voice_queue")
         logger.info(f"🔍 DIAGNOSTIC: Tasks for review details: {json.dumps([{'title': t.get('title'), 'duration': t.get('duration'), 'priority': t.get('priority')} for t in tasks_for_review], indent=2)}")
@@ -4426,94 +4777,41 @@ async def push_to_inbox(request: PushToCalendarRequest, user: dict = Depends(get
         async with pool.acquire() as conn:
             # Use a transaction for atomicity
             async with conn.transaction():
-                # Build batch insert using VALUES with multiple rows
-                # This is much faster than individual INSERTs
-                values_list = []
-                params = []
-                param_num = 1
-                
-                # Check if impakt column exists
-                impakt_exists = await conn.fetchval(
-                    """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'impakt')"""
-                )
+                impakt_exists = await column_exists(conn, 'tasks', 'impakt')
+                # Fallback during migration: use importance integer
+                impakt_column, impakt_type = ('impakt', 'text') if impakt_exists else ('importance', 'int')
+                impakt_to_int = {'low': 1, 'medium': 2, 'high': 3, None: 2}
                 
+                # One column array per field; the INSERT below unnests them into rows
+                ids, titles, descriptions, priorities, impakts, energies, durations = [], [], [], [], [], [], []
                 for task_data in request.tasks:
-                    task_id = task_data.get("id", str(uuid.uuid4()))
                     # Get impakt from task_data, or convert from old importance if present
                     impakt_value = task_data.get("impakt")
                     if not impakt_value and "importance" in task_data:
                         impakt_map = {1: 'low', 2: 'medium', 3: 'high', 4: 'high'}
                         impakt_value = impakt_map.get(task_data.get("importance"))
                     
-                    if impakt_exists:
-                        values_list.append(
-                            f"(${param_num}, ${param_num+1}, ${param_num+2}, ${param_num+3}, "
-                            f"${param_num+4}, ${param_num+5}, ${param_num+6}, ${param_num+7}, "
-                            f"${param_num+8}, ${param_num+9}, ${param_num+10}, ${param_num+11}, "
-                            f"${param_num+12}, ${param_num+13})"
-                        )
-                        params.extend([
-                            task_id,
-                            user["id"],
-                            task_data.get("title", "Untitled Task"),
-                            task_data.get("description", ""),
-                            task_data.get("priority", 2),
-                            impakt_value,  # impakt
-                            task_data.get("energy_required", "medium"),  # energy_required
-                            None,  # scheduled_date (NULL for inbox tasks)
-                            None,  # scheduled_time (NULL for inbox tasks)
-                            task_data.get("duration", 30),
-                            "inbox",  # status
-                            None,  # expires_at (NULL for inbox tasks)
-                            created_at
-                        ])
-                        param_num += 14
-                    else:
-                        # Fallback during migration: use importance integer
-                        impakt_to_int = {'low': 1, 'medium': 2, 'high': 3, None: 2}
-                        importance_value = impakt_to_int.get(impakt_value, 2)
-                        values_list.append(
-                            f"(${param_num}, ${param_num+1}, ${param_num+2}, ${param_num+3}, "
-                            f"${param_num+4}, ${param_num+5}, ${param_num+6}, ${param_num+7}, "
-                            f"${param_num+8}, ${param_num+9}, ${param_num+10}, ${param_num+11}, "
-                            f"${param_num+12}, ${param_num+13})"
-                        )
-                        params.extend([
-                            task_id,
-                            user["id"],
-                            task_data.get("title", "Untitled Task"),
-                            task_data.get("description", ""),
-                            task_data.get("priority", 2),
-                            importance_value,  # importance (migration fallback)
-                            task_data.get("energy_required", "medium"),  # energy_required
-                            None,  # scheduled_date (NULL for inbox tasks)
-                            None,  # scheduled_time (NULL for inbox tasks)
-                            task_data.get("duration", 30),
-                            "inbox",  # status
-                            None,  # expires_at (NULL for inbox tasks)
-                            created_at
-                        ])
-                        param_num += 14
-                
-                # Single batch INSERT with RETURNING - much faster!
-                if impakt_exists:
-                    query = f"""
-                        INSERT INTO tasks (id, user_id, title, description, priority, impakt, energy_required,
-                                         scheduled_date, scheduled_time, duration, status, expires_at, created_at)
-                        VALUES {', '.join(values_list)}
-                        RETURNING id, user_id, title, description, priority, impakt, energy_required,
-                                  scheduled_date::text, scheduled_time, duration, status, expires_at::text, created_at::text
-                    """
-                else:
-                    query = f"""
-                        INSERT INTO tasks (id, user_id, title, description, priority, importance, energy_required,
-                                         scheduled_date, scheduled_time, duration, status, expires_at, created_at)
-                        VALUES {', '.join(values_list)}
-                        RETURNING id, user_id, title, description, priority, importance, energy_required,
-                                  scheduled_date::text, scheduled_time, duration, status, expires_at::text, created_at::text
-                    """
+                    ids.append(task_data.get("id"))  # NULL ids are generated by Postgres
+                    titles.append(task_data.get("title", "Untitled Task"))
+                    descriptions.append(task_data.get("description", ""))
+                    priorities.append(task_data.get("priority", 2))
+                    impakts.append(impakt_value if impakt_exists else impakt_to_int.get(impakt_value, 2))
+                    energies.append(task_data.get("energy_required", "medium"))
+                    durations.append(task_data.get("duration", 30))
                 
-                rows = await conn.fetch(query, *params)
+                # Single batch INSERT with RETURNING; the statement text doesn't depend on the task count
+                rows = await conn.fetch(
+                    f"""INSERT INTO tasks (id, user_id, title, description, priority, {impakt_column}, energy_required,
+                                           scheduled_date, scheduled_time, duration, status, expires_at, created_at)
+                        SELECT COALESCE(m.id, gen_random_uuid()::text), $1, m.title, m.description, m.priority,
+                               m.impakt, m.energy_required, NULL, NULL, m.duration, 'inbox', NULL, $2
+                        FROM unnest($3::text[], $4::text[], $5::text[], $6::int[], $7::{impakt_type}[], $8::text[], $9::int[])
+                             WITH ORDINALITY AS m(id, title, description, priority, impakt, energy_required, duration, ord)
+                        ORDER BY m.ord
+                        RETURNING id, user_id, title, description, priority, {impakt_column}, energy_required,
+                                  scheduled_date::text, scheduled_time, duration, status, expires_at::text, created_at::text""",
+                    user["id"], created_at, ids, titles, descriptions, priorities, impakts, energies, durations
+                )
                 created_tasks = [dict(row) for row in rows]
         
         return {
@@ -4549,26 +4847,25 @@ async def push_to_calendar(request: PushToCalendarRequest, user: dict = Depends(
                 tasks_by_date[date_str] = []
             tasks_by_date[date_str].append(task_data)
         
+        # Lay out every task's slot first, then insert them all in one statement
         created_tasks = []
-        pool = await get_db_pool()
-        
-        async with pool.acquire() as conn:
-            for date_str, date_tasks in tasks_by_date.items():
-                # Convert date string to date object for asyncpg (always a string from dict key)
-                try:
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-                except ValueError:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid date format for scheduled_date: {date_str}. Expected YYYY-MM-DD"
-                    )
-                
-                # Start scheduling: 1 hour from now if it's today (and before 10 PM), otherwise 9 AM
-                if date_str == today and now.hour < 22:
-                    current_hour = now.hour + 1
-                else:
-                    current_hour = 9
-                current_minute = 0
+        scheduled_dates = []  # date objects for asyncpg, parallel to created_tasks
+        for date_str, date_tasks in tasks_by_date.items():
+            # Convert date string to date object for asyncpg (always a string from dict key)
+            try:
+                date_obj = date.fromisoformat(date_str)
+            except ValueError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid date format for scheduled_date: {date_str}. Expected YYYY-MM-DD"
+                )
+            
+            # Start scheduling: 1 hour from now if it's today (and before 10 PM), otherwise 9 AM
+            if date_str == today and now.hour < 22:
+                current_hour = now.hour + 1
+            else:
+                current_hour = 9
+            current_minute = 0
             
             for task_data in date_tasks:
                 # Wrap to next day if past 10 PM
@@ -4577,17 +4874,6 @@ async def push_to_calendar(request: PushToCalendarRequest, user: dict = Depends(
                     current_minute = 0
                 
                 scheduled_time = f"{current_hour:02d}:{current_minute:02d}"
-                
-                # Check if impakt column exists
-                impakt_exists = await conn.fetchval(
-                    """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'impakt')"""
-                )
-                
-                # Ensure all required fields have defaults
-                task_id = task_data.get("id") or str(uuid.uuid4())
-                title = task_data.get("title") or "Untitled Task"
-                description = task_data.get("description") or ""
-                priority = task_data.get("priority", 2)
                 duration = task_data.get("duration", 30)
                 
                 # Get impakt from task_data, or convert from old importance if present
@@ -4596,50 +4882,20 @@ async def push_to_calendar(request: PushToCalendarRequest, user: dict = Depends(
                     impakt_map = {1: 'low', 2: 'medium', 3: 'high', 4: 'high'}
                     impakt_value = impakt_map.get(task_data.get("importance"))
                 
-                # Validate priority is in valid range
-                priority = max(1, min(4, priority))
-                
-                created_at = datetime.now(timezone.utc)
-                
-                try:
-                    if impakt_exists:
-                        await conn.execute(
-                            """INSERT INTO tasks (id, user_id, title, description, priority, impakt, 
-                                   scheduled_date, scheduled_time, duration, status, expires_at, created_at)
-                                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)""",
-                            task_id, user["id"], title, description, priority, impakt_value,
-                            date_obj, scheduled_time, duration, "scheduled", None, created_at
-                        )
-                    else:
-                        # Fallback during migration: use importance integer
-                        impakt_to_int = {'low': 1, 'medium': 2, 'high': 3, None: 2}
-                        importance_value = impakt_to_int.get(impakt_value, 2)
-                        await conn.execute(
-                            """INSERT INTO tasks (id, user_id, title, description, priority, importance, 
-                                   scheduled_date, scheduled_time, duration, status, expires_at, created_at)
-                                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)""",
-                            task_id, user["id"], title, description, priority, importance_value,
-                            date_obj, scheduled_time, duration, "scheduled", None, created_at
-                        )
-                    
-                    created_tasks.append({
-                        "id": task_id,
-                        "title": title,
-                        "description": description,
-                        "priority": priority,
-                        "impakt": impakt_value,
-                        "scheduled_date": date_obj.strftime("%Y-%m-%d"),  # Convert back to string for response
-                        "scheduled_time": scheduled_time,
-                        "duration": duration,
-                        "status": "scheduled",
-                        "expires_at": None
-                    })
-                except Exception as db_error:
-                        logger.error(f"Database error inserting task {task_id}: {str(db_error)}")
-                        raise HTTPException(
-                            status_code=500,
-                            detail=f"Failed to save task '{title}': {str(db_error)}"
-                        )
+                # Ensure all required fields have defaults; priority clamped to the valid range
+                created_tasks.append({
+                    "id": task_data.get("id") or str(uuid.uuid4()),
+                    "title": task_data.get("title") or "Untitled Task",
+                    "description": task_data.get("description") or "",
+                    "priority": max(1, min(4, task_data.get("priority", 2))),
+                    "impakt": impakt_value,
+                    "scheduled_date": date_str,
+                    "scheduled_time": scheduled_time,
+                    "duration": duration,
+                    "status": "scheduled",
+                    "expires_at": None
+                })
+                scheduled_dates.append(date_obj)
                 
                 # Advance time by task duration
                 current_minute += duration
@@ -4647,13 +4903,52 @@ async def push_to_calendar(request: PushToCalendarRequest, user: dict = Depends(
                     current_minute -= 60
                     current_hour += 1
         
-        return {
-            "success": True,
-            "tasks": created_tasks,
-            "message": f"{len(created_tasks)} tasks scheduled"
-        }
-    except HTTPException:
-        # Re-raise HTTP exceptions (already properly formatted)
+        if created_tasks:
+            pool = await get_db_pool()
+            async with pool.acquire() as conn:
+                impakt_exists = await column_exists(conn, 'tasks', 'impakt')
+                if impakt_exists:
+                    impakt_column, impakt_type = 'impakt', 'text'
+                    impakts = [t["impakt"] for t in created_tasks]
+                else:
+                    # Fallback during migration: use importance integer
+                    impakt_to_int = {'low': 1, 'medium': 2, 'high': 3, None: 2}
+                    impakt_column, impakt_type = 'importance', 'int'
+                    impakts = [impakt_to_int.get(t["impakt"], 2) for t in created_tasks]
+                
+                try:
+                    await conn.execute(
+                        f"""INSERT INTO tasks (id, user_id, title, description, priority, {impakt_column},
+                                               scheduled_date, scheduled_time, duration, status, expires_at, created_at)
+                            SELECT m.id, $1, m.title, m.description, m.priority, m.impakt,
+                                   m.scheduled_date, m.scheduled_time, m.duration, 'scheduled', NULL, $2
+                            FROM unnest($3::text[], $4::text[], $5::text[], $6::int[], $7::{impakt_type}[],
+                                        $8::date[], $9::text[], $10::int[])
+                                 AS m(id, title, description, priority, impakt, scheduled_date, scheduled_time, duration)""",
+                        user["id"], now,
+                        [t["id"] for t in created_tasks],
+                        [t["title"] for t in created_tasks],
+                        [t["description"] for t in created_tasks],
+                        [t["priority"] for t in created_tasks],
+                        impakts,
+                        scheduled_dates,
+                        [t["scheduled_time"] for t in created_tasks],
+                        [t["duration"] for t in created_tasks]
+                    )
+                except Exception as db_error:
+                    logger.error(f"Database error inserting {len(created_tasks)} tasks: {str(db_error)}")
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Failed to save tasks: {str(db_error)}"
+                    )
+        
+        return {
+            "success": True,
+            "tasks": created_tasks,
+            "message": f"{len(created_tasks)} tasks scheduled"
+        }
+    except HTTPException:
+        # Re-raise HTTP exceptions (already properly formatted)
         raise
     except Exception as e:
         logger.error(f"Error pushing to calendar: {str(e)}", exc_info=True)
@@ -4671,28 +4966,43 @@ async def push_to_calendar(request: PushToCalendarRequest, user: dict = Depends(
 async def get_settings(user: dict = Depends(get_current_user)):
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT id, ai_provider, ai_model FROM settings WHERE id = $1", f"settings_{user['id']}")
-        if not row:
-            # Create default settings
-            await conn.execute(
-                "INSERT INTO settings (id, ai_provider, ai_model) VALUES ($1, $2, $3)",
-                f"settings_{user['id']}", "openai", "gpt-5.2"
-            )
-            return Settings(id=f"settings_{user['id']}")
+        # Creates the default row on first read. The no-op DO UPDATE makes
+        # RETURNING fire for an existing row too, so this is one round-trip
+        # and concurrent first reads can't race each other into a conflict.
+        row = await conn.fetchrow(
+            """INSERT INTO settings (id, ai_provider, ai_model) VALUES ($1, $2, $3)
+               ON CONFLICT (id) DO UPDATE SET id = EXCLUDED.id
+               RETURNING id, ai_provider, ai_model""",
+            f"settings_{user['id']}", "openai", "gpt-5.2"
+        )
     return dict(row)
 
 @api_router.patch("/settings", response_model=Settings)
 async def update_settings(settings_update: SettingsUpdate, user: dict = Depends(get_current_user)):
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        await conn.execute(
+        row = await conn.fetchrow(
             """INSERT INTO settings (id, ai_provider, ai_model) VALUES ($1, $2, $3)
-               ON CONFLICT (id) DO UPDATE SET ai_provider = $2, ai_model = $3""",
+               ON CONFLICT (id) DO UPDATE SET ai_provider = $2, ai_model = $3
+               RETURNING id, ai_provider, ai_model""",
             f"settings_{user['id']}", settings_update.ai_provider, settings_update.ai_model
         )
-        row = await conn.fetchrow("SELECT id, ai_provider, ai_model FROM settings WHERE id = $1", f"settings_{user['id']}")
     return dict(row)
 
+def remove_temp_file(path: str) -> None:
+    """Delete a temp file, ignoring one that is already gone or can't be removed.
+
+    Blocking filesystem call; run it via asyncio.to_thread from handlers.
+    """
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+# OpenAI errors that mean rate limiting or an exhausted quota: "rate" and
+# "limit" anywhere in the message (either order), or "quota"
+QUOTA_ERROR_RE = re.compile(r"rate.*limit|limit.*rate|quota", re.IGNORECASE | re.DOTALL)
+
 # Whisper Speech-to-Text endpoint
 @api_router.post("/transcribe")
 async def transcribe_audio_endpoint(audio: UploadFile = File(...), user: dict = Depends(get_current_user)):
@@ -4706,9 +5016,10 @@ async def transcribe_audio_endpoint(audio: UploadFile = File(...), user: dict =
         # Save uploaded file to temp location
         suffix = Path(audio.filename).suffix if audio.filename else ".webm"
         with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await audio.read()
-            tmp.write(content)
             tmp_path = tmp.name
+            # Copy from Starlette's spooled file in chunks, off the event loop,
+            # rather than reading the whole upload into memory first
+            await asyncio.to_thread(shutil.copyfileobj, audio.file, tmp)
         
         # Transcribe using OpenAI Whisper (with segments)
         try:
@@ -4720,19 +5031,14 @@ async def transcribe_audio_endpoint(audio: UploadFile = File(...), user: dict =
             )
         except Exception as transcribe_error:
             logger.error(f"Transcription error: {str(transcribe_error)}", exc_info=True)
-            # Clean up temp file
-            if tmp_path:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            # The temp file is removed by the outer handler
             raise HTTPException(
                 status_code=500,
                 detail=f"Transcription failed: {str(transcribe_error)}"
             )
         
         # Clean up temp file
-        os.unlink(tmp_path)
+        await asyncio.to_thread(remove_temp_file, tmp_path)
         tmp_path = None
         
         # Return transcript text and segments
@@ -4751,17 +5057,13 @@ async def transcribe_audio_endpoint(audio: UploadFile = File(...), user: dict =
             }
         
     except Exception as e:
-        logger.error(f"Whisper transcription error: {str(e)}")
+        logger.error("Whisper transcription error: %s", e)
         # Clean up temp file on error
         if tmp_path:
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
+            await asyncio.to_thread(remove_temp_file, tmp_path)
         
         # Check for rate limit / quota errors
-        error_str = str(e).lower()
-        if "rate" in error_str and "limit" in error_str or "quota" in error_str:
+        if QUOTA_ERROR_RE.search(str(e)):
             raise HTTPException(
                 status_code=429, 
                 detail="QUOTA_EXCEEDED: Your OpenAI API quota has been exceeded. Please add credits to your OpenAI account."
@@ -4770,99 +5072,138 @@ async def transcribe_audio_endpoint(audio: UploadFile = File(...), user: dict =
 
 
 # iCal Export endpoint
-from fastapi.responses import Response
+
+# iCal TEXT escaping, applied in one pass
+ICAL_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ",": "\\,", ";": "\\;", "\n": "\\n"})
+
+# Task priority (1-4, index) -> iCal PRIORITY (1=high, 5=medium, 9=low)
+ICAL_PRIORITIES = (5, 9, 5, 3, 1)
+
+# One VEVENT, CRLF line endings per the iCal spec
+VEVENT_TEMPLATE = (
+    "BEGIN:VEVENT\r\n"
+    "UID:%s@adddaily.app\r\n"
+    "DTSTAMP:%s\r\n"
+    "DTSTART:%sT%s\r\n"
+    "DTEND:%sT%s\r\n"
+    "SUMMARY:%s\r\n"
+    "DESCRIPTION:%s\r\n"
+    "PRIORITY:%d\r\n"
+    "STATUS:CONFIRMED\r\n"
+    "END:VEVENT\r\n"
+)
+
+ICAL_HEADER = (
+    b"BEGIN:VCALENDAR\r\n"
+    b"VERSION:2.0\r\n"
+    b"PRODID:-//ADD Daily//Task Manager//EN\r\n"
+    b"CALSCALE:GREGORIAN\r\n"
+    b"METHOD:PUBLISH\r\n"
+    b"X-WR-CALNAME:ADD Daily Tasks\r\n"
+)
+
+# Defaults and the iCal date format are applied in SQL; events come out in
+# chronological order. The start time is sorted as exported: defaulted, and
+# zero-padded to HH:MM so "9:30" sorts before "10:00". That expression is the
+# one idx_tasks_user_scheduled indexes. One module-level text, so every export
+# on a connection hits the same entry in asyncpg's prepared-statement cache.
+EXPORT_ICAL_SQL = """SELECT id, COALESCE(NULLIF(title, ''), 'Untitled'), COALESCE(description, ''),
+       priority, scheduled_date,
+       to_char(scheduled_date, 'YYYYMMDD'),
+       lpad(COALESCE(NULLIF(scheduled_time, ''), '09:00'), 5, '0') AS start_time,
+       COALESCE(NULLIF(duration, 0), 30)
+FROM tasks WHERE user_id = $1 AND status = 'scheduled' AND scheduled_date IS NOT NULL
+ORDER BY scheduled_date, start_time"""
+
+# Events are buffered up to this many bytes per chunk sent to the client
+ICAL_CHUNK_SIZE = 64 * 1024
 
 @api_router.get("/tasks/export/ical")
 async def export_ical(user: dict = Depends(get_current_user)):
-    """Export scheduled tasks as iCal (.ics) file"""
+    """Export scheduled tasks as iCal (.ics) file, streamed as rows arrive"""
+    # Get the pool before streaming starts so a connection failure is still a 500.
+    # The startup hook has normally created it already; fall back only if that failed.
     try:
-        # Fetch all scheduled tasks for this user
-        pool = await get_db_pool()
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT id, title, description, priority, scheduled_date::text, scheduled_time, duration 
-                   FROM tasks WHERE user_id = $1 AND status = 'scheduled' AND scheduled_date IS NOT NULL""",
-                user["id"]
-            )
-        tasks = [dict(row) for row in rows]
-        
-        # Generate iCal content
-        ical_lines = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//ADD Daily//Task Manager//EN",
-            "CALSCALE:GREGORIAN",
-            "METHOD:PUBLISH",
-            "X-WR-CALNAME:ADD Daily Tasks",
-        ]
-        
-        for task in tasks:
-            scheduled_date = task.get("scheduled_date")
-            scheduled_time = task.get("scheduled_time", "09:00") or "09:00"
-            
-            if not scheduled_date:
-                continue
-                
-            # Parse date and time
-            date_str = scheduled_date.replace("-", "")
-            time_str = scheduled_time.replace(":", "") + "00"
-            
-            # Calculate end time based on duration
-            duration_mins = task.get("duration", 30) or 30
-            time_parts = scheduled_time.split(":")
-            start_hour = int(time_parts[0]) if len(time_parts) > 0 else 9
-            start_min = int(time_parts[1]) if len(time_parts) > 1 else 0
-            
-            end_min = start_min + duration_mins
-            end_hour = start_hour
-            while end_min >= 60:
-                end_min -= 60
-                end_hour += 1
-            
-            end_time_str = f"{end_hour:02d}{end_min:02d}00"
-            
-            # Create unique ID
-            uid = task.get("id", str(uuid.uuid4()))
-            
-            # Escape special characters in text
-            title = (task.get("title") or "Untitled").replace(",", "\\,").replace(";", "\\;").replace("\n", "\\n")
-            description = (task.get("description") or "").replace(",", "\\,").replace(";", "\\;").replace("\n", "\\n")
-            
-            # Priority mapping (iCal: 1=high, 5=medium, 9=low)
-            priority_map = {4: 1, 3: 3, 2: 5, 1: 9}
-            ical_priority = priority_map.get(task.get("priority", 2), 5)
-            
-            # Add event
-            ical_lines.extend([
-                "BEGIN:VEVENT",
-                f"UID:{uid}@adddaily.app",
-                f"DTSTAMP:{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}",
-                f"DTSTART:{date_str}T{time_str}",
-                f"DTEND:{date_str}T{end_time_str}",
-                f"SUMMARY:{title}",
-                f"DESCRIPTION:{description}",
-                f"PRIORITY:{ical_priority}",
-                "STATUS:CONFIRMED",
-                "END:VEVENT",
-            ])
-        
-        ical_lines.append("END:VCALENDAR")
-        
-        # Join with CRLF as per iCal spec
-        ical_content = "\r\n".join(ical_lines)
-        
-        # Return as downloadable file
-        return Response(
-            content=ical_content,
-            media_type="text/calendar",
-            headers={
-                "Content-Disposition": "attachment; filename=add-daily-tasks.ics"
-            }
-        )
+        pool = db_pool or await get_db_pool()
+    except Exception as e:
+        logger.error("Error exporting iCal: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def ical_stream():
+        # One export is one snapshot, so every event shares its DTSTAMP
+        dtstamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        # Chunks go out as bytes so Starlette has nothing left to encode
+        buf = bytearray(ICAL_HEADER)
         
+        async with pool.acquire() as conn:
+            # asyncpg cursors only exist inside a transaction
+            async with conn.transaction():
+                # Records unpack positionally, in EXPORT_ICAL_SQL column order
+                async for task_id, title, description, priority, scheduled_date, date_str, scheduled_time, duration_mins in conn.cursor(
+                    EXPORT_ICAL_SQL, user["id"], prefetch=256
+                ):
+                    # Parse time; the response is already streaming, so a
+                    # malformed value skips its event instead of failing the export
+                    hour_part, _, minute_part = scheduled_time.partition(":")
+                    minute_part = minute_part.partition(":")[0]
+                    if not hour_part.isdecimal() or not (minute_part or "0").isdecimal():
+                        logger.warning("iCal export: skipping task %s with scheduled_time %r", task_id, scheduled_time)
+                        continue
+                    start_hour = int(hour_part)
+                    start_min = int(minute_part) if minute_part else 0
+                    if start_hour > 23 or start_min > 59:
+                        logger.warning("iCal export: skipping task %s with scheduled_time %r", task_id, scheduled_time)
+                        continue
+                    time_str = "%02d%02d00" % (start_hour, start_min)
+                    
+                    # Calculate end time based on duration; an event running past
+                    # midnight ends on the following day
+                    end_days, end_total = divmod(start_hour * 60 + start_min + duration_mins, 1440)
+                    end_hour, end_min = divmod(end_total, 60)
+                    end_time_str = "%02d%02d00" % (end_hour, end_min)
+                    end_date_str = date_str
+                    if end_days:
+                        end_date_str = (scheduled_date + timedelta(days=end_days)).strftime("%Y%m%d")
+                    
+                    # Escape special characters in text
+                    title = title.translate(ICAL_TEXT_ESCAPES)
+                    description = description.translate(ICAL_TEXT_ESCAPES)
+                    
+                    ical_priority = ICAL_PRIORITIES[priority] if priority in (1, 2, 3, 4) else 5
+                    
+                    buf += (VEVENT_TEMPLATE % (
+                        task_id, dtstamp, date_str, time_str, end_date_str, end_time_str,
+                        title, description, ical_priority
+                    )).encode()
+                    if len(buf) >= ICAL_CHUNK_SIZE:
+                        yield bytes(buf)
+                        buf.clear()
+        
+        buf += b"END:VCALENDAR"
+        yield bytes(buf)
+    
+    # Run the query up to the first chunk before committing to a 200, so a
+    # failing query is still a 500 rather than a truncated file
+    chunks = ical_stream()
+    try:
+        first_chunk = await chunks.__anext__()
     except Exception as e:
-        logger.error(f"Error exporting iCal: {str(e)}")
+        logger.error("Error exporting iCal: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    
+    async def ical_body():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+    
+    # Return as downloadable file
+    return StreamingResponse(
+        ical_body(),
+        media_type="text/calendar; charset=utf-8",
+        headers={
+            "Content-Disposition": "attachment; filename=add-daily-tasks.ics"
+        }
+    )
 
 
 # Task status management endpoints
@@ -4889,6 +5230,7 @@ async def make_task_next(task_id: str, user: dict = Depends(get_current_user)):
     try:
         async with pool.acquire() as conn:
             async with conn.transaction():
+                await conn.execute(SQL_LOCK_USER_CAPS, user["id"])
                 # Check if task exists and belongs to user
                 task = await conn.fetchrow(
                     "SELECT id, status FROM tasks WHERE id = $1 AND user_id = $2",
@@ -4922,22 +5264,10 @@ async def make_task_next(task_id: str, user: dict = Depends(get_current_user)):
                 
                 # Return the updated task with dynamic column selection
                 # Check which columns exist for graceful degradation
-                effort_exists = await conn.fetchval(
-                    """SELECT EXISTS (SELECT 1 FROM information_schema.columns 
-                       WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'effort')"""
-                )
-                energy_required_exists = await conn.fetchval(
-                    """SELECT EXISTS (SELECT 1 FROM information_schema.columns 
-                       WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'energy_required')"""
-                )
-                completed_at_exists = await conn.fetchval(
-                    """SELECT EXISTS (SELECT 1 FROM information_schema.columns 
-                       WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'completed_at')"""
-                )
-                sort_order_exists = await conn.fetchval(
-                    """SELECT EXISTS (SELECT 1 FROM information_schema.columns 
-                       WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'sort_order')"""
-                )
+                effort_exists = await column_exists(conn, 'tasks', 'effort')
+                energy_required_exists = await column_exists(conn, 'tasks', 'energy_required')
+                completed_at_exists = await column_exists(conn, 'tasks', 'completed_at')
+                sort_order_exists = await column_exists(conn, 'tasks', 'sort_order')
                 
                 # Build SELECT clause using helper function
                 select_clause, _ = await build_task_select_clause(conn)
@@ -4988,34 +5318,33 @@ async def move_task_to_inbox(task_id: str, user: dict = Depends(get_current_user
     pool = await get_db_pool()
     
     async with pool.acquire() as conn:
-        # Check if task exists and belongs to user
-        task = await conn.fetchrow(
-            "SELECT id FROM tasks WHERE id = $1 AND user_id = $2",
-            task_id, user["id"]
-        )
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        # Update status to inbox
-        await conn.execute(
-            "UPDATE tasks SET status = 'inbox' WHERE id = $1 AND user_id = $2",
-            task_id, user["id"]
-        )
-        
-        # Return the updated task using helper function
-        select_clause, _ = await build_task_select_clause(conn)
-        energy_required_exists = await conn.fetchval(
-            """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'energy_required')"""
-        )
-        energy_select = ", energy_required" if energy_required_exists else ""
-        expires_at_select = ", expires_at::text"
-        full_select = select_clause + energy_select + expires_at_select
-        
-        updated_task = await conn.fetchrow(
-            f"""SELECT {full_select}
-               FROM tasks WHERE id = $1 AND user_id = $2""",
-            task_id, user["id"]
-        )
+        async with conn.transaction():
+            # Check if task exists and belongs to user
+            task = await conn.fetchrow(
+                SQL_TASK_OWNED,
+                task_id, user["id"]
+            )
+            if not task:
+                raise HTTPException(status_code=404, detail="Task not found")
+            
+            # Update status to inbox
+            await conn.execute(
+                "UPDATE tasks SET status = 'inbox' WHERE id = $1 AND user_id = $2",
+                task_id, user["id"]
+            )
+            
+            # Return the updated task using helper function
+            select_clause, _ = await build_task_select_clause(conn)
+            energy_required_exists = await column_exists(conn, 'tasks', 'energy_required')
+            energy_select = ", energy_required" if energy_required_exists else ""
+            expires_at_select = ", expires_at::text"
+            full_select = select_clause + energy_select + expires_at_select
+            
+            updated_task = await conn.fetchrow(
+                f"""SELECT {full_select}
+                   FROM tasks WHERE id = $1 AND user_id = $2""",
+                task_id, user["id"]
+            )
     
     return convert_task_row_to_dict(updated_task)
 
@@ -5029,34 +5358,33 @@ async def move_task_to_later(task_id: str, user: dict = Depends(get_current_user
     expires_at = datetime.now(timezone.utc) + timedelta(days=14)
     
     async with pool.acquire() as conn:
-        # Check if task exists and belongs to user
-        task = await conn.fetchrow(
-            "SELECT id FROM tasks WHERE id = $1 AND user_id = $2",
-            task_id, user["id"]
-        )
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        # Update status to later and set expires_at
-        await conn.execute(
-            "UPDATE tasks SET status = 'later', expires_at = $1 WHERE id = $2 AND user_id = $3",
-            expires_at, task_id, user["id"]
-        )
-        
-        # Return the updated task using helper function
-        select_clause, _ = await build_task_select_clause(conn)
-        energy_required_exists = await conn.fetchval(
-            """SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'tasks' AND column_name = 'energy_required')"""
-        )
-        energy_select = ", energy_required" if energy_required_exists else ""
-        expires_at_select = ", expires_at::text"
-        full_select = select_clause + energy_select + expires_at_select
-        
-        updated_task = await conn.fetchrow(
-            f"""SELECT {full_select}
-               FROM tasks WHERE id = $1 AND user_id = $2""",
-            task_id, user["id"]
-        )
+        async with conn.transaction():
+            # Check if task exists and belongs to user
+            task = await conn.fetchrow(
+                SQL_TASK_OWNED,
+                task_id, user["id"]
+            )
+            if not task:
+                raise HTTPException(status_code=404, detail="Task not found")
+            
+            # Update status to later and set expires_at
+            await conn.execute(
+                "UPDATE tasks SET status = 'later', expires_at = $1 WHERE id = $2 AND user_id = $3",
+                expires_at, task_id, user["id"]
+            )
+            
+            # Return the updated task using helper function
+            select_clause, _ = await build_task_select_clause(conn)
+            energy_required_exists = await column_exists(conn, 'tasks', 'energy_required')
+            energy_select = ", energy_required" if energy_required_exists else ""
+            expires_at_select = ", expires_at::text"
+            full_select = select_clause + energy_select + expires_at_select
+            
+            updated_task = await conn.fetchrow(
+                f"""SELECT {full_select}
+                   FROM tasks WHERE id = $1 AND user_id = $2""",
+                task_id, user["id"]
+            )
     
     return convert_task_row_to_dict(updated_task)
 
@@ -5076,10 +5404,10 @@ class DumpItem(BaseModel):
     impakt: Optional[str] = Field(default=None)  # low, medium, high, or None
     priority: int = Field(default=2, ge=1, le=4)
     energy_required: Optional[str] = Field(default="medium")  # low, medium, high
-    scheduled_date: Optional[str] = None  # ISO date string
+    scheduled_date: Optional[date] = None
     scheduled_time: Optional[str] = None  # HH:MM format
     duration: int = Field(default=30)  # Duration in minutes
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class Dump(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -5099,6 +5427,13 @@ class DumpCreate(BaseModel):
     transcript: Optional[str] = None
     title: Optional[str] = None
 
+# List endpoints build these dicts directly from rows and return them via
+# ORJSONResponse, skipping the per-row pydantic dump/validate round-trip the
+# response_model would otherwise do. Every row carries id/created_at, so the
+# one-off factory values computed here are always overwritten.
+DUMP_RESPONSE_DEFAULTS = _response_defaults(Dump)
+DUMP_ITEM_RESPONSE_DEFAULTS = _response_defaults(DumpItem)
+
 class DumpItemCreate(BaseModel):
     text: str
     status: Optional[str] = Field(default="new")
@@ -5466,7 +5801,6 @@ async def extract_items_from_dump(dump_id: str, raw_text: str, user_id: str, poo
                     debug_payload["db_insert_attempt_count"] = len(items)
                     logger.info(f"🔍 Database insertion: Processing {len(items)} items")
                     for idx, item_data in enumerate(items):
-                        item_id = str(uuid.uuid4())
                         item_text = item_data.get("text", "")
                         item_duration = item_data.get("duration_minutes")
                         
@@ -5501,28 +5835,23 @@ async def extract_items_from_dump(dump_id: str, raw_text: str, user_id: str, poo
                         # Use default 30 if duration is None (database has DEFAULT 30, but we'll pass it explicitly)
                         duration_value = item_duration if item_duration is not None else 30
                         
-                        await conn.execute(
-                            """INSERT INTO dump_items (id, dump_id, user_id, text, status, duration, created_at)
-                               VALUES ($1, $2, $3, $4, 'new', $5, $6)""",
-                            item_id, dump_id, user_id, item_text, duration_value, created_at
-                        )
-                        
-                        extraction_debug["insert_payload"].append({
-                            "item_id": item_id,
-                            "text": item_text[:100]  # Truncate for storage
-                        })
-                        
+                        # id is generated by Postgres; created_at is shared by the whole batch
                         row = await conn.fetchrow(
-                            """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at::text
-                               FROM dump_items WHERE id = $1""",
-                            item_id
+                            """INSERT INTO dump_items (id, dump_id, user_id, text, status, duration, created_at)
+                               VALUES (gen_random_uuid()::text, $1, $2, $3, 'new', $4, $5)
+                               RETURNING id, dump_id, user_id, text, status, created_task_id, duration, created_at""",
+                            dump_id, user_id, item_text, duration_value, created_at
                         )
                         if row:
+                            extraction_debug["insert_payload"].append({
+                                "item_id": row["id"],
+                                "text": item_text[:100]  # Truncate for storage
+                            })
                             created_items.append(dict(row))
                             inserted_count += 1
-                            logger.info(f"  ✓ Successfully inserted item {idx + 1} (ID: {item_id[:8]}...): text='{row.get('text', '')[:80]}'")
+                            logger.info(f"  ✓ Successfully inserted item {idx + 1} (ID: {row['id'][:8]}...): text='{row.get('text', '')[:80]}'")
                         else:
-                            logger.error(f"  ✗ FAILED to verify insertion of item {idx + 1} (ID: {item_id[:8]}...) - row is None!")
+                            logger.error(f"  ✗ FAILED to verify insertion of item {idx + 1} - row is None!")
                             logger.error(f"    Item data was: text='{item_text[:80]}', duration={item_duration}")
                     
                     logger.info(f"🔍 Database insertion complete: {inserted_count}/{len(items)} items inserted")
@@ -5587,14 +5916,11 @@ async def extract_items_from_dump(dump_id: str, raw_text: str, user_id: str, poo
                 if ENV == 'development' or os.environ.get('EXTRACT_DEBUG') == '1':
                     try:
                         # Check if extraction_debug column exists
-                        debug_col_exists = await conn.fetchval(
-                            """SELECT EXISTS (SELECT 1 FROM information_schema.columns 
-                               WHERE table_schema = 'public' AND table_name = 'dumps' AND column_name = 'extraction_debug')"""
-                        )
+                        debug_col_exists = await column_exists(conn, 'dumps', 'extraction_debug')
                         if debug_col_exists:
                             await conn.execute(
                                 "UPDATE dumps SET extraction_debug = $1 WHERE id = $2",
-                                json.dumps(extraction_debug), dump_id
+                                orjson.dumps(extraction_debug, option=orjson.OPT_NON_STR_KEYS).decode(), dump_id
                             )
                     except Exception as debug_err:
                         logger.warning(f"Failed to store extraction_debug: {debug_err}")
@@ -5770,7 +6096,6 @@ async def extract_items_from_dump(dump_id: str, raw_text: str, user_id: str, poo
                 
                 try:
                     for idx, item_data in enumerate(items):
-                        item_id = str(uuid.uuid4())
                         item_text = item_data.get("text", "")
                         item_duration = item_data.get("duration_minutes")
                         
@@ -5790,16 +6115,12 @@ async def extract_items_from_dump(dump_id: str, raw_text: str, user_id: str, poo
                         # Use default 30 if duration is None (database has DEFAULT 30, but we'll pass it explicitly)
                         duration_value = item_duration if item_duration is not None else 30
                         
-                        await conn.execute(
-                            """INSERT INTO dump_items (id, dump_id, user_id, text, status, duration, created_at)
-                               VALUES ($1, $2, $3, $4, 'new', $5, $6)""",
-                            item_id, dump_id, user_id, item_text, duration_value, created_at
-                        )
-                        
+                        # id is generated by Postgres; created_at is shared by the whole batch
                         row = await conn.fetchrow(
-                            """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at::text
-                               FROM dump_items WHERE id = $1""",
-                            item_id
+                            """INSERT INTO dump_items (id, dump_id, user_id, text, status, duration, created_at)
+                               VALUES (gen_random_uuid()::text, $1, $2, $3, 'new', $4, $5)
+                               RETURNING id, dump_id, user_id, text, status, created_task_id, duration, created_at""",
+                            dump_id, user_id, item_text, duration_value, created_at
                         )
                         if row:
                             created_items.append(dict(row))
@@ -5854,18 +6175,13 @@ async def create_dump(
         dump_id = str(uuid.uuid4())
         created_at = datetime.now(timezone.utc)
         
-        await conn.execute(
+        dump_row = await conn.fetchrow(
             """INSERT INTO dumps (id, user_id, created_at, source, raw_text, transcript, title, trace_id)
-               VALUES ($1, $2, $3, $4, $5, $6, $7, $8)""",
+               VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+               RETURNING id, user_id, created_at, source, raw_text, transcript, title,
+                         clarified_at, archived_at""",
             dump_id, user["id"], created_at, dump_data.source, dump_data.raw_text, dump_data.transcript, dump_data.title, trace_id
         )
-        
-        dump_row = await conn.fetchrow(
-            """SELECT id, user_id, created_at::text, source, raw_text, transcript, title,
-                      clarified_at::text, archived_at::text
-               FROM dumps WHERE id = $1""",
-            dump_id
-        )
     
     dump_dict = dict(dump_row)
     
@@ -5895,7 +6211,8 @@ async def create_dump(
     return dump_dict
 
 @api_router.get("/dumps", response_model=List[Dump])
-async def get_dumps(archived: Optional[bool] = Query(None, description="Filter by archived status"), 
+async def get_dumps(request: Request,
+                    archived: Optional[bool] = Query(None, description="Filter by archived status"), 
                     user: dict = Depends(get_current_user)):
     """Get all dumps for the current user, newest first. Returns [] if table doesn't exist (dev mode)."""
     if not user or not user.get("id"):
@@ -5905,13 +6222,7 @@ async def get_dumps(archived: Optional[bool] = Query(None, description="Filter b
     async with pool.acquire() as conn:
         try:
             # Check if dumps table exists - if not, return empty list (graceful degradation)
-            table_exists = await conn.fetchval(
-                """SELECT EXISTS (
-                   SELECT 1 FROM information_schema.tables 
-                   WHERE table_schema = 'public' 
-                   AND table_name = 'dumps'
-                )"""
-            )
+            table_exists = await check_table_exists(conn, 'dumps')
             
             if not table_exists:
                 logger.warning(f"dumps table does not exist for user {user['id']}. Returning empty list.")
@@ -5927,8 +6238,8 @@ async def get_dumps(archived: Optional[bool] = Query(None, description="Filter b
             if archived is None:
                 # Get non-archived dumps by default
                 rows = await conn.fetch(
-                    """SELECT id, user_id, created_at::text, source, raw_text, transcript, title,
-                              clarified_at::text, archived_at::text
+                    """SELECT id, user_id, created_at, source, raw_text, transcript, title,
+                              clarified_at, archived_at
                        FROM dumps 
                        WHERE user_id = $1 AND archived_at IS NULL
                        ORDER BY created_at DESC""",
@@ -5936,15 +6247,15 @@ async def get_dumps(archived: Optional[bool] = Query(None, description="Filter b
                 )
             else:
                 rows = await conn.fetch(
-                    """SELECT id, user_id, created_at::text, source, raw_text, transcript, title,
-                              clarified_at::text, archived_at::text
+                    """SELECT id, user_id, created_at, source, raw_text, transcript, title,
+                              clarified_at, archived_at
                        FROM dumps 
                        WHERE user_id = $1 AND (archived_at IS NULL) = $2
                        ORDER BY created_at DESC""",
                     user["id"], not archived
                 )
             
-            return [dict(row) for row in rows]
+            return etag_json_response(request, [{**DUMP_RESPONSE_DEFAULTS, **row} for row in rows])
         except Exception as e:
             error_str = str(e).lower()
             if "does not exist" in error_str or "relation" in error_str or "table" in error_str or "column" in error_str:
@@ -5962,52 +6273,68 @@ async def get_dumps(archived: Optional[bool] = Query(None, description="Filter b
                 detail=f"Error fetching dumps: {str(e)}"
             )
 
+# Columns a client may set on a dump, and whether the value is a timestamp
+# that needs coercing from an ISO string.
+DUMP_UPDATE_FIELDS = {
+    'transcript': False,
+    'title': False,
+    'clarified_at': True,
+    'archived_at': True,
+}
+
+
+def _coerce_dump_field(key: str, value):
+    """Coerce a PATCH value for the dumps table; empty timestamps clear the column."""
+    if DUMP_UPDATE_FIELDS[key]:
+        if not value:
+            return None
+        if isinstance(value, str):
+            return parse_iso_datetime(value)
+    return value
+
+
+def _build_dump_update_sql(fields: tuple) -> str:
+    """UPDATE for one subset of DUMP_UPDATE_FIELDS; SET params are $1..$n in field order."""
+    n = len(fields)
+    set_clause = ', '.join(f"{key} = ${i}" for i, key in enumerate(fields, start=1))
+    return f"""UPDATE dumps SET {set_clause}
+                WHERE id = ${n + 1} AND user_id = ${n + 2}
+                RETURNING id, user_id, created_at, source, raw_text, transcript, title,
+                          clarified_at, archived_at"""
+
+
+# Every non-empty field subset, built once at import: frozenset -> (sql, field order)
+DUMP_UPDATE_SQL = {
+    frozenset(fields): (_build_dump_update_sql(fields), fields)
+    for r in range(1, len(DUMP_UPDATE_FIELDS) + 1)
+    for fields in combinations(DUMP_UPDATE_FIELDS, r)
+}
+
+
 @api_router.patch("/dumps/{dump_id}", response_model=Dump)
 async def update_dump(dump_id: str, dump_update: dict, user: dict = Depends(get_current_user)):
     """Update a dump (e.g., archive, clarify)"""
     if not user or not user.get("id"):
         raise HTTPException(status_code=401, detail="User authentication required")
     
+    update_data = {k: v for k, v in dump_update.items() if k in DUMP_UPDATE_FIELDS}
+    if not update_data:
+        raise HTTPException(status_code=400, detail="No valid fields to update")
+    
+    # Every field binds exactly one parameter (NULL included), in the order
+    # the pre-built statement expects.
+    query, fields = DUMP_UPDATE_SQL[frozenset(update_data)]
+    values = [_coerce_dump_field(key, update_data[key]) for key in fields]
+    values.extend([dump_id, user["id"]])
+    
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Build update query dynamically
-        allowed_fields = {'transcript', 'title', 'clarified_at', 'archived_at'}
-        update_data = {k: v for k, v in dump_update.items() if k in allowed_fields}
-        
-        if not update_data:
-            raise HTTPException(status_code=400, detail="No valid fields to update")
-        
-        set_clauses = []
-        values = []
-        param_num = 1
-        
-        for key, value in update_data.items():
-            if key == 'clarified_at' or key == 'archived_at':
-                if value:
-                    set_clauses.append(f"{key} = ${param_num}")
-                    values.append(datetime.fromisoformat(value.replace('Z', '+00:00')) if isinstance(value, str) else value)
-                else:
-                    set_clauses.append(f"{key} = NULL")
-                param_num += 1 if value else 0
-            else:
-                set_clauses.append(f"{key} = ${param_num}")
-                values.append(value)
-                param_num += 1
-        
-        where_clause = f"id = ${param_num} AND user_id = ${param_num + 1}"
-        values.extend([dump_id, user["id"]])
-        
-        query = f"""UPDATE dumps SET {', '.join(set_clauses)} 
-                    WHERE {where_clause}
-                    RETURNING id, user_id, created_at::text, source, raw_text, transcript, title,
-                              clarified_at::text, archived_at::text"""
-        
         row = await conn.fetchrow(query, *values)
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
     
-    return dict(row)
+    if not row:
+        raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
+    
+    return ORJSONResponse({**DUMP_RESPONSE_DEFAULTS, **row})
 
 @api_router.delete("/dumps/{dump_id}")
 async def delete_dump(dump_id: str, user: dict = Depends(get_current_user)):
@@ -6017,16 +6344,8 @@ async def delete_dump(dump_id: str, user: dict = Depends(get_current_user)):
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify dump belongs to user (authorization check)
-        dump = await conn.fetchrow(
-            "SELECT id FROM dumps WHERE id = $1 AND user_id = $2",
-            dump_id, user["id"]
-        )
-        
-        if not dump:
-            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
-        
-        # Delete dump (cascade will delete dump_items automatically due to ON DELETE CASCADE)
+        # The user_id filter is the authorization check; nothing deleted means 404
+        # (cascade will delete dump_items automatically due to ON DELETE CASCADE)
         result = await conn.execute(
             "DELETE FROM dumps WHERE id = $1 AND user_id = $2",
             dump_id, user["id"]
@@ -6044,55 +6363,38 @@ async def create_dump_item(dump_id: str, item_data: DumpItemCreate, user: dict =
     if not user or not user.get("id"):
         raise HTTPException(status_code=401, detail="User authentication required")
     
+    created_at = datetime.now(timezone.utc)
+    status = item_data.status or "new"
+    
+    snooze_until_value = None
+    if item_data.snooze_until:
+        snooze_until_value = parse_iso_datetime(item_data.snooze_until)
+    
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify dump belongs to user
-        dump = await conn.fetchrow(
-            "SELECT id FROM dumps WHERE id = $1 AND user_id = $2",
-            dump_id, user["id"]
-        )
-        if not dump:
-            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
-        
-        item_id = str(uuid.uuid4())
-        created_at = datetime.now(timezone.utc)
-        status = item_data.status or "new"
-        
-        snooze_until_value = None
-        if item_data.snooze_until:
-            snooze_until_value = datetime.fromisoformat(item_data.snooze_until.replace('Z', '+00:00'))
-        
-        await conn.execute(
-            """INSERT INTO dump_items (id, dump_id, created_at, text, status, snooze_until)
-               VALUES ($1, $2, $3, $4, $5, $6)""",
-            item_id, dump_id, created_at, item_data.text, status, snooze_until_value
-        )
-        
+        # Insert only if the dump belongs to user; no row back means 404
         row = await conn.fetchrow(
-            """SELECT id, dump_id, created_at::text, text, status, 
-                      snooze_until::text, linked_task_id, duration
-               FROM dump_items WHERE id = $1""",
-            item_id
+            """INSERT INTO dump_items (id, dump_id, created_at, text, status, snooze_until)
+               SELECT gen_random_uuid()::text, $1, $2, $3, $4, $5
+               WHERE EXISTS (SELECT 1 FROM dumps WHERE id = $1 AND user_id = $6)
+               RETURNING id, dump_id, created_at, text, status,
+                         snooze_until, linked_task_id, duration""",
+            dump_id, created_at, item_data.text, status, snooze_until_value, user["id"]
         )
     
-    return dict(row)
+    if not row:
+        raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
+    
+    return ORJSONResponse({**DUMP_ITEM_RESPONSE_DEFAULTS, **row})
 
 @api_router.get("/dumps/{dump_id}/items", response_model=List[DumpItem])
-async def get_dump_items(dump_id: str, user: dict = Depends(get_current_user)):
+async def get_items_for_dump(dump_id: str, request: Request, user: dict = Depends(get_current_user)):
     """Get all items for a dump"""
     if not user or not user.get("id"):
         raise HTTPException(status_code=401, detail="User authentication required")
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify dump belongs to user
-        dump = await conn.fetchrow(
-            "SELECT id FROM dumps WHERE id = $1 AND user_id = $2",
-            dump_id, user["id"]
-        )
-        if not dump:
-            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
-        
         # Get all existing columns in dump_items table
         existing_columns = await get_dump_items_existing_columns(conn)
         
@@ -6107,7 +6409,7 @@ async def get_dump_items(dump_id: str, user: dict = Depends(get_current_user)):
         if 'user_id' in existing_columns:
             select_parts.append('user_id')
         if 'created_at' in existing_columns:
-            select_parts.append('created_at::text')
+            select_parts.append('created_at')
         if 'text' in existing_columns:
             select_parts.append('text')
         if 'status' in existing_columns:
@@ -6127,30 +6429,36 @@ async def get_dump_items(dump_id: str, user: dict = Depends(get_current_user)):
         if 'energy_required' in existing_columns:
             select_parts.append('energy_required')
         if 'scheduled_date' in existing_columns:
-            select_parts.append('scheduled_date::text')
+            select_parts.append('scheduled_date')
         if 'scheduled_time' in existing_columns:
             select_parts.append('scheduled_time')
         if 'linked_task_id' in existing_columns:
             select_parts.append('linked_task_id')
         if 'snooze_until' in existing_columns:
-            select_parts.append('snooze_until::text')
+            select_parts.append('snooze_until')
         
-        select_clause = ', '.join(select_parts)
+        select_clause = ', '.join(f"di.{part}" for part in select_parts)
         
+        # Ownership check folded into the read: the dumps row drives the join,
+        # so an owned-but-empty dump yields one all-NULL item row and a
+        # foreign/missing dump yields nothing.
         rows = await conn.fetch(
             f"""SELECT {select_clause}
-               FROM dump_items 
-               WHERE dump_id = $1
-               ORDER BY created_at ASC""",
-            dump_id
+               FROM dumps d
+               LEFT JOIN dump_items di ON di.dump_id = d.id
+               WHERE d.id = $1 AND d.user_id = $2
+               ORDER BY di.created_at ASC""",
+            dump_id, user["id"]
         )
+        if not rows:
+            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
         
         # Log duration values for debugging
         for row in rows:
             if 'duration' in row:
                 logger.info(f"GET dump_items: item {row.get('id', 'unknown')} has duration = {row.get('duration')}")
     
-    return [dict(row) for row in rows]
+    return etag_json_response(request, [{**DUMP_ITEM_RESPONSE_DEFAULTS, **row} for row in rows if row['id'] is not None])
 
 async def check_dump_items_column_exists(conn, column_name: str) -> bool:
     """Check if a column exists in dump_items table"""
@@ -6173,6 +6481,35 @@ async def get_dump_items_existing_columns(conn) -> set:
     )
     return {row['column_name'] for row in rows}
 
+async def get_dump_items_state_column(conn) -> str:
+    """Column holding an item's triage state: 'state' once migrated, else 'status'"""
+    return 'state' if await column_exists(conn, 'dump_items', 'state') else 'status'
+
+# Promote/triage targets mapped to task status (triage targets are the same names upper-cased)
+TARGET_TO_STATUS = {'inbox': 'inbox', 'next_today': 'next', 'later': 'later'}
+
+# Columns returned by update_dump_item, in response order, when they exist
+DUMP_ITEM_RETURNING_COLUMNS = (
+    'id', 'dump_id', 'user_id', 'created_at', 'text', 'status',
+    'duration', 'description', 'urgency', 'importance', 'priority', 'energy_required',
+    'scheduled_date', 'scheduled_time', 'linked_task_id', 'snooze_until',
+)
+
+@lru_cache(maxsize=256)
+def build_dump_item_update_sql(field_names: tuple, returning_parts: tuple) -> str:
+    """Build the UPDATE for a dump item, once per field set.
+
+    SET params are $1..$n in field_names order, followed by item id and user id.
+    Ownership is checked by the UPDATE itself via the dumps join.
+    """
+    n = len(field_names)
+    set_clause = ', '.join(f"{name} = ${i}" for i, name in enumerate(field_names, start=1))
+    returning_clause = ', '.join(f"dump_items.{part}" for part in returning_parts)
+    return f"""UPDATE dump_items SET {set_clause}
+               FROM dumps
+               WHERE dump_items.id = ${n + 1} AND dump_items.dump_id = dumps.id AND dumps.user_id = ${n + 2}
+               RETURNING {returning_clause}"""
+
 @api_router.patch("/dump-items/{item_id}", response_model=DumpItem)
 async def update_dump_item(item_id: str, item_update: DumpItemUpdate, user: dict = Depends(get_current_user)):
     """Update a dump item"""
@@ -6182,16 +6519,6 @@ async def update_dump_item(item_id: str, item_update: DumpItemUpdate, user: dict
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            # Verify item belongs to user's dump
-            item = await conn.fetchrow(
-                """SELECT dump_items.id FROM dump_items
-                   JOIN dumps ON dump_items.dump_id = dumps.id
-                   WHERE dump_items.id = $1 AND dumps.user_id = $2""",
-                item_id, user["id"]
-            )
-            if not item:
-                raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
-            
             # Get all existing columns in dump_items table
             existing_columns = await get_dump_items_existing_columns(conn)
             logger.info(f"Existing columns in dump_items: {sorted(existing_columns)}")
@@ -6223,87 +6550,32 @@ async def update_dump_item(item_id: str, item_update: DumpItemUpdate, user: dict
             if not update_data:
                 raise HTTPException(status_code=400, detail="No update data provided")
             
-            set_clauses = []
-            values = []
-            param_num = 1
+            # Sorted so the same field set always produces the same (cached) statement
+            field_names = tuple(sorted(k for k in update_data if k in existing_columns))
+            if not field_names:
+                logger.error(f"No SET clauses after filtering - this should not happen. update_data was: {update_data}, allowed_fields: {allowed_fields}")
+                raise HTTPException(status_code=400, detail="No valid fields to update after filtering")
             
-            for key, value in update_data.items():
-                # Double-check that the column exists (safety check)
-                if key not in existing_columns:
-                    logger.warning(f"Skipping update to non-existent column: {key}")
-                    continue
-                
-                set_clauses.append(f"{key} = ${param_num}")
+            values = []
+            for key in field_names:
+                value = update_data[key]
                 # Handle special cases: date/datetime parsing
                 if key == 'scheduled_date' and isinstance(value, str):
                     try:
                         # Parse YYYY-MM-DD format string to date object
-                        value = datetime.strptime(value, "%Y-%m-%d").date()
+                        value = date.fromisoformat(value)
                     except ValueError:
                         raise HTTPException(status_code=400, detail=f"Invalid date format for scheduled_date: {value}. Expected YYYY-MM-DD")
                 elif key == 'snooze_until' and isinstance(value, str):
                     # Parse ISO datetime string
-                    value = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                
+                    value = parse_iso_datetime(value)
                 values.append(value)
-                param_num += 1
-            
-            # Check if we have any SET clauses (shouldn't happen due to earlier check, but safety)
-            if not set_clauses:
-                logger.error(f"No SET clauses after filtering - this should not happen. update_data was: {update_data}, allowed_fields: {allowed_fields}")
-                raise HTTPException(status_code=400, detail="No valid fields to update after filtering")
-            
-            where_clause = f"id = ${param_num}"
-            values.append(item_id)
-            
-            # Build RETURNING clause dynamically - only include columns that exist
-            returning_parts = []
-            
-            # Required columns (should always exist)
-            if 'id' in existing_columns:
-                returning_parts.append('id')
-            if 'dump_id' in existing_columns:
-                returning_parts.append('dump_id')
-            if 'user_id' in existing_columns:
-                returning_parts.append('user_id')
-            if 'created_at' in existing_columns:
-                returning_parts.append('created_at::text')
-            if 'text' in existing_columns:
-                returning_parts.append('text')
-            if 'status' in existing_columns:
-                returning_parts.append('status')
+            values.extend([item_id, user["id"]])
             
-            # Optional columns (only if they exist)
-            if 'duration' in existing_columns:
-                returning_parts.append('duration')
-            if 'description' in existing_columns:
-                returning_parts.append('description')
-            if 'urgency' in existing_columns:
-                returning_parts.append('urgency')
-            if 'importance' in existing_columns:
-                returning_parts.append('importance')
-            if 'priority' in existing_columns:
-                returning_parts.append('priority')
-            if 'energy_required' in existing_columns:
-                returning_parts.append('energy_required')
-            if 'scheduled_date' in existing_columns:
-                returning_parts.append('scheduled_date::text')
-            if 'scheduled_time' in existing_columns:
-                returning_parts.append('scheduled_time')
-            if 'linked_task_id' in existing_columns:
-                returning_parts.append('linked_task_id')
-            if 'snooze_until' in existing_columns:
-                returning_parts.append('snooze_until::text')
+            returning_parts = tuple(c for c in DUMP_ITEM_RETURNING_COLUMNS if c in existing_columns)
+            query = build_dump_item_update_sql(field_names, returning_parts)
             
-            returning_clause = ', '.join(returning_parts)
-            logger.info(f"RETURNING clause: {returning_clause}")
-            
-            query = f"""UPDATE dump_items SET {', '.join(set_clauses)} 
-                        WHERE {where_clause}
-                        RETURNING {returning_clause}"""
-            
-            set_clause_names = [clause.split('=')[0].strip() for clause in set_clauses]
-            logger.info(f"Executing UPDATE query with {len(set_clauses)} SET clauses: {', '.join(set_clause_names)}")
+            logger.info(f"Executing UPDATE query with {len(field_names)} SET clauses: {', '.join(field_names)}")
             logger.info(f"Query: {query}")
             logger.info(f"Values: {values}")
             
@@ -6316,13 +6588,13 @@ async def update_dump_item(item_id: str, item_update: DumpItemUpdate, user: dict
                 raise HTTPException(status_code=500, detail=f"Database error: {type(query_error).__name__}: {str(query_error)}")
             
             if not row:
-                raise HTTPException(status_code=404, detail="Item not found after update")
+                raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
             
-            result = dict(row)
+            result = {**DUMP_ITEM_RESPONSE_DEFAULTS, **row}
             logger.info(f"Update successful, returning {len(result)} fields: {list(result.keys())}")
             if 'duration' in result:
                 logger.info(f"Update successful: duration value in response = {result.get('duration')} (type: {type(result.get('duration'))})")
-            return result
+            return ORJSONResponse(result)
         except HTTPException:
             raise
         except Exception as e:
@@ -6375,83 +6647,74 @@ async def promote_dump_item(item_id: str, promote_request: PromoteRequest, user:
     if not user or not user.get("id"):
         raise HTTPException(status_code=401, detail="User authentication required")
     
-    if promote_request.target not in ['inbox', 'next_today', 'later']:
+    if promote_request.target not in TARGET_TO_STATUS:
         raise HTTPException(status_code=400, detail="Target must be 'inbox', 'next_today', or 'later'")
     
+    # Map target to task status
+    task_status = TARGET_TO_STATUS[promote_request.target]
+    INBOX_CAP = 5
+    NEXT_TODAY_CAP = 1
+    cap = INBOX_CAP if task_status == 'inbox' else (NEXT_TODAY_CAP if task_status == 'next' else None)
+    
+    created_at = datetime.now(timezone.utc)
+    
+    # One statement: ownership check, cap check, task insert and dump_item update,
+    # behind the per-user cap lock when the target is capped.
+    # The outer SELECT always yields a row for an owned item, so a missing row
+    # means 404 and a row without a task id tells us which check failed.
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify item belongs to user (authorization check)
-        item = await conn.fetchrow(
-            """SELECT id, text, status, duration FROM dump_items
-               WHERE id = $1 AND user_id = $2""",
-            item_id, user["id"]
-        )
-        if not item:
-            raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
-        
-        # Check if already promoted
-        if item.get('status') == 'promoted':
-            raise HTTPException(status_code=400, detail="Dump item already promoted")
-        
-        # Map target to task status
-        task_status = 'inbox' if promote_request.target == 'inbox' else ('next' if promote_request.target == 'next_today' else 'later')
-        
-        # Check Inbox cap if target is inbox
-        if task_status == 'inbox':
-            inbox_count = await conn.fetchval(
-                "SELECT COUNT(*) FROM tasks WHERE user_id = $1 AND status = 'inbox'",
-                user["id"]
+        async with conn.transaction():
+            if cap is not None:
+                await conn.execute(SQL_LOCK_USER_CAPS, user["id"])
+            row = await conn.fetchrow(
+                """WITH src AS (
+                       SELECT id, text, status, duration FROM dump_items
+                       WHERE id = $1 AND user_id = $2
+                   ),
+                   cap AS (
+                       SELECT COUNT(*) AS c FROM tasks WHERE user_id = $2 AND status = $3
+                   ),
+                   ins AS (
+                       INSERT INTO tasks (id, user_id, title, status, created_at, priority, urgency, importance, duration)
+                       SELECT gen_random_uuid()::text, $2, src.text, $3, $4, 2, 2, 2, src.duration FROM src
+                       WHERE src.status IS DISTINCT FROM 'promoted'
+                         AND ($5::int IS NULL OR (SELECT c FROM cap) < $5::int)
+                       RETURNING id, user_id, title, description, priority, urgency, importance,
+                                 scheduled_date::text AS scheduled_date, scheduled_time, duration, status,
+                                 created_at::text AS created_at
+                   ),
+                   upd AS (
+                       UPDATE dump_items SET status = 'promoted', created_task_id = ins.id
+                       FROM ins WHERE dump_items.id = $1
+                       RETURNING dump_items.id
+                   )
+                   SELECT src.status AS item_status, ins.*
+                   FROM src LEFT JOIN ins ON true""",
+                item_id, user["id"], task_status, created_at, cap
             )
-            INBOX_CAP = 5
-            if inbox_count >= INBOX_CAP:
-                raise HTTPException(
-                    status_code=409,
-                    detail="Inbox is full. Promote to Later or Next Today."
-                )
-        
-        # Check Next Today cap if target is next_today
-        if task_status == 'next':
-            next_count = await conn.fetchval(
-                "SELECT COUNT(*) FROM tasks WHERE user_id = $1 AND status = 'next'",
-                user["id"]
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
+    
+    if row["id"] is None:
+        if row["item_status"] == 'promoted':
+            raise HTTPException(status_code=400, detail="Dump item already promoted")
+        if task_status == 'inbox':
+            raise HTTPException(
+                status_code=409,
+                detail="Inbox is full. Promote to Later or Next Today."
             )
-            NEXT_TODAY_CAP = 1
-            if next_count >= NEXT_TODAY_CAP:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Next Today is full ({NEXT_TODAY_CAP}). Finish or move something out first."
-                )
-        
-        # Create task - use duration from dump_item, default to 30 if not set
-        task_id = str(uuid.uuid4())
-        created_at = datetime.now(timezone.utc)
-        item_duration = item.get('duration', 30)
-        
-        logger.info(f"Promoting dump_item {item_id} to task with duration: {item_duration} minutes")
-        
-        await conn.execute(
-            """INSERT INTO tasks (id, user_id, title, status, created_at, priority, urgency, importance, duration)
-               VALUES ($1, $2, $3, $4, $5, 2, 2, 2, $6)""",
-            task_id, user["id"], item.get('text', 'Untitled Task'), task_status, created_at, item_duration
-        )
-        
-        # Update dump_item: status='promoted', created_task_id=task_id
-        await conn.execute(
-            """UPDATE dump_items 
-               SET status = 'promoted', created_task_id = $1
-               WHERE id = $2""",
-            task_id, item_id
-        )
-        
-        # Fetch created task
-        task_row = await conn.fetchrow(
-            """SELECT id, user_id, title, description, priority, urgency, importance, 
-                      scheduled_date::text, scheduled_time, duration, status, created_at::text
-               FROM tasks WHERE id = $1""",
-            task_id
+        raise HTTPException(
+            status_code=400,
+            detail=f"Next Today is full ({NEXT_TODAY_CAP}). Finish or move something out first."
         )
     
-    return dict(task_row)
+    logger.info(f"Promoted dump_item {item_id} to task {row['id']} with duration: {row['duration']} minutes")
+    
+    task = dict(row)
+    del task["item_status"]
+    return task
 
 @api_router.post("/dump-items/promote-bulk")
 async def promote_dump_items_bulk(promote_request: PromoteBulkRequest, user: dict = Depends(get_current_user)):
@@ -6459,7 +6722,7 @@ async def promote_dump_items_bulk(promote_request: PromoteBulkRequest, user: dic
     if not user or not user.get("id"):
         raise HTTPException(status_code=401, detail="User authentication required")
     
-    if promote_request.target not in ['inbox', 'next_today', 'later']:
+    if promote_request.target not in TARGET_TO_STATUS:
         raise HTTPException(status_code=400, detail="Target must be 'inbox', 'next_today', or 'later'")
     
     if not promote_request.item_ids:
@@ -6467,83 +6730,97 @@ async def promote_dump_items_bulk(promote_request: PromoteBulkRequest, user: dic
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify all items belong to user (authorization check)
-        item_ids_placeholder = ','.join(f'${i+1}' for i in range(len(promote_request.item_ids)))
-        items = await conn.fetch(
-            f"""SELECT id, text, status, duration FROM dump_items
-               WHERE id IN ({item_ids_placeholder}) AND user_id = ${len(promote_request.item_ids) + 1}""",
-            *promote_request.item_ids, user["id"]
-        )
-        
-        if len(items) != len(promote_request.item_ids):
-            raise HTTPException(status_code=404, detail="Some dump items not found or you don't have permission")
-        
-        # Filter out already promoted items
-        items_to_promote = [item for item in items if item.get('status') != 'promoted']
-        
-        if not items_to_promote:
-            raise HTTPException(status_code=400, detail="All selected items are already promoted")
-        
-        # Map target to task status
-        task_status = 'inbox' if promote_request.target == 'inbox' else ('next' if promote_request.target == 'next_today' else 'later')
-        
-        # Check Next Today cap if target is next_today
-        if task_status == 'next':
-            next_count = await conn.fetchval(
-                "SELECT COUNT(*) FROM tasks WHERE user_id = $1 AND status = 'next'",
-                user["id"]
+        # Verify and promote in one transaction
+        async with conn.transaction():
+            # Verify all items belong to user (authorization check) and fetch only
+            # the ones not yet promoted. The count side always yields one row, so
+            # "nothing left to promote" is still distinguishable from a 404.
+            # Ids travel as one array parameter so the statement text (and its
+            # cached plan) is the same whatever the batch size.
+            rows = await conn.fetch(
+                """SELECT c.found, di.id, di.text, di.duration
+                   FROM (SELECT COUNT(*) AS found FROM dump_items
+                         WHERE id = ANY($1::text[]) AND user_id = $2) c
+                   LEFT JOIN dump_items di
+                     ON di.id = ANY($1::text[]) AND di.user_id = $2
+                    AND di.status IS DISTINCT FROM 'promoted'""",
+                promote_request.item_ids, user["id"]
             )
-            NEXT_TODAY_CAP = 1
-            available_slots = NEXT_TODAY_CAP - next_count
             
-            if available_slots <= 0:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Next Today is full ({NEXT_TODAY_CAP}). Finish or move something out first."
-                )
+            if rows[0]["found"] != len(promote_request.item_ids):
+                raise HTTPException(status_code=404, detail="Some dump items not found or you don't have permission")
             
-            if len(items_to_promote) > available_slots:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Next Today only has {available_slots} slot(s) available. Can only promote {available_slots} item(s)."
-                )
-        
-        # Create tasks for each item
-        created_tasks = []
-        created_at = datetime.now(timezone.utc)
-        
-        for item in items_to_promote:
-            task_id = str(uuid.uuid4())
-            item_duration = item.get('duration', 30)
-            logger.info(f"Promoting dump_item {item.get('id')} to task with duration: {item_duration} minutes")
+            items_to_promote = [row for row in rows if row["id"] is not None]
             
-            await conn.execute(
-                """INSERT INTO tasks (id, user_id, title, status, created_at, priority, urgency, importance, duration)
-                   VALUES ($1, $2, $3, $4, $5, 2, 2, 2, $6)""",
-                task_id, user["id"], item.get('text', 'Untitled Task'), task_status, created_at, item_duration
-            )
+            if not items_to_promote:
+                raise HTTPException(status_code=400, detail="All selected items are already promoted")
             
-            # Update dump_item: status='promoted', created_task_id=task_id
-            await conn.execute(
-                """UPDATE dump_items 
-                   SET status = 'promoted', created_task_id = $1
-                   WHERE id = $2""",
-                task_id, item['id']
-            )
+            # Map target to task status
+            task_status = TARGET_TO_STATUS[promote_request.target]
+            
+            # Next Today is capped; the cap is checked inside the INSERT below
+            NEXT_TODAY_CAP = 1
+            cap = NEXT_TODAY_CAP if task_status == 'next' else None
             
-            # Fetch created task
-            task_row = await conn.fetchrow(
-                """SELECT id, user_id, title, description, priority, urgency, importance, 
-                          scheduled_date::text, scheduled_time, duration, status, created_at::text
-                   FROM tasks WHERE id = $1""",
-                task_id
+            # Create all tasks and mark all items promoted in one set-oriented statement.
+            # Task ids are generated per item in SQL so each item can be linked to its task.
+            created_at = datetime.now(timezone.utc)
+            item_ids = [item['id'] for item in items_to_promote]
+            titles = [item.get('text', 'Untitled Task') for item in items_to_promote]
+            durations = [item.get('duration', 30) for item in items_to_promote]
+            logger.info(f"Promoting {len(item_ids)} dump_items to tasks with status {task_status}")
+            
+            # The INSERT only fires if the whole batch fits under the cap; the
+            # per-user lock keeps a concurrent promote from counting alongside us.
+            if cap is not None:
+                await conn.execute(SQL_LOCK_USER_CAPS, user["id"])
+            rows = await conn.fetch(
+                """WITH m AS (
+                       SELECT gen_random_uuid()::text AS task_id, u.*
+                       FROM unnest($1::text[], $2::text[], $3::int[]) AS u(item_id, title, duration)
+                   ),
+                   cap AS (
+                       SELECT COUNT(*) AS c FROM tasks WHERE user_id = $4 AND status = $5
+                   ),
+                   ins AS (
+                       INSERT INTO tasks (id, user_id, title, status, created_at, priority, urgency, importance, duration)
+                       SELECT m.task_id, $4, m.title, $5, $6, 2, 2, 2, m.duration FROM m
+                       WHERE $7::int IS NULL OR (SELECT c FROM cap) + cardinality($1::text[]) <= $7::int
+                       RETURNING id, user_id, title, description, priority, urgency, importance,
+                                 scheduled_date, scheduled_time, duration, status,
+                                 created_at
+                   ),
+                   upd AS (
+                       UPDATE dump_items SET status = 'promoted', created_task_id = m.task_id
+                       FROM m WHERE dump_items.id = m.item_id AND EXISTS (SELECT 1 FROM ins)
+                   )
+                   SELECT (SELECT c FROM cap) AS cap_count, ins.*
+                   FROM (SELECT 1) AS one LEFT JOIN ins ON true""",
+                item_ids, titles, durations, user["id"], task_status, created_at, cap
             )
-            created_tasks.append(dict(task_row))
     
-    return {"tasks": created_tasks}
+    if rows[0]["id"] is None:
+        available_slots = NEXT_TODAY_CAP - rows[0]["cap_count"]
+        if available_slots <= 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Next Today is full ({NEXT_TODAY_CAP}). Finish or move something out first."
+            )
+        raise HTTPException(
+            status_code=400,
+            detail=f"Next Today only has {available_slots} slot(s) available. Can only promote {available_slots} item(s)."
+        )
+    
+    created_tasks = []
+    for row in rows:
+        task = dict(row)
+        del task["cap_count"]
+        created_tasks.append(task)
+    
+    return ORJSONResponse({"tasks": created_tasks})
 
 @api_router.get("/dump-items")
-async def get_dump_items(
+async def list_dump_items(
     status: Optional[str] = Query(None, description="Filter by status: 'new', 'promoted', 'dismissed'"),
     include_seed: Optional[int] = Query(0, description="Include seed dumps (0=no, 1=yes). Default: exclude in development."),
     user: dict = Depends(get_current_user)
@@ -6564,28 +6841,28 @@ async def get_dump_items(
         
         if status:
             if exclude_seed:
-                sql_query = """SELECT di.id, di.dump_id, di.user_id, di.text, di.status, di.created_task_id, di.duration, di.created_at::text
+                sql_query = """SELECT di.id, di.dump_id, di.user_id, di.text, di.status, di.created_task_id, di.duration, di.created_at
                                FROM dump_items di
                                INNER JOIN dumps d ON di.dump_id = d.id
                                WHERE di.user_id = $1 AND di.status = $2 AND (d.source != 'seed' OR d.source IS NULL)
                                ORDER BY di.created_at DESC"""
                 rows = await conn.fetch(sql_query, user["id"], status)
             else:
-                sql_query = """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at::text
+                sql_query = """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at
                    FROM dump_items
                    WHERE user_id = $1 AND status = $2
                                ORDER BY created_at DESC"""
                 rows = await conn.fetch(sql_query, user["id"], status)
         else:
             if exclude_seed:
-                sql_query = """SELECT di.id, di.dump_id, di.user_id, di.text, di.status, di.created_task_id, di.duration, di.created_at::text
+                sql_query = """SELECT di.id, di.dump_id, di.user_id, di.text, di.status, di.created_task_id, di.duration, di.created_at
                                FROM dump_items di
                                INNER JOIN dumps d ON di.dump_id = d.id
                                WHERE di.user_id = $1 AND (d.source != 'seed' OR d.source IS NULL)
                                ORDER BY di.created_at DESC"""
                 rows = await conn.fetch(sql_query, user["id"])
             else:
-                sql_query = """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at::text
+                sql_query = """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at
                    FROM dump_items
                    WHERE user_id = $1
                                ORDER BY created_at DESC"""
@@ -6612,17 +6889,17 @@ async def get_dump_items(
         }))
     
     # Add debug info to response if requested
-    result = [dict(row) for row in rows]
-    if debug_mode and len(result) > 0:
+    if debug_mode and len(rows) > 0:
         # Add debug metadata to first item (temporary, for debugging)
-        if result:
-            result[0]["_debug"] = {
-                "sql_query": sql_query[:200] if sql_query else None,
-                "field_read": field_read,
-                "total_rows": len(rows)
-            }
+        first = dict(rows[0])
+        first["_debug"] = {
+            "sql_query": sql_query[:200] if sql_query else None,
+            "field_read": field_read,
+            "total_rows": len(rows)
+        }
+        return RecordJSONResponse([first, *rows[1:]])
     
-    return result
+    return RecordJSONResponse(rows)
 
 @api_router.get("/debug/dumps/{dump_id}/items")
 async def debug_get_dump_items(dump_id: str, user: dict = Depends(get_current_user)):
@@ -6642,7 +6919,7 @@ async def debug_get_dump_items(dump_id: str, user: dict = Depends(get_current_us
         
         # Get all items with full details
         rows = await conn.fetch(
-            """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at::text
+            """SELECT id, dump_id, user_id, text, status, created_task_id, duration, created_at
                FROM dump_items 
                WHERE dump_id = $1
                ORDER BY created_at ASC""",
@@ -6653,7 +6930,7 @@ async def debug_get_dump_items(dump_id: str, user: dict = Depends(get_current_us
         for idx, row in enumerate(rows):
             logger.info(f"  Item {idx + 1}: id={row.get('id', '')[:8]}..., text='{row.get('text', '')[:80]}', status={row.get('status')}")
     
-    return [dict(row) for row in rows]
+    return RecordJSONResponse(rows)
 
 @api_router.post("/dump-items/{item_id}/dismiss")
 async def dismiss_dump_item(item_id: str, user: dict = Depends(get_current_user)):
@@ -6663,37 +6940,41 @@ async def dismiss_dump_item(item_id: str, user: dict = Depends(get_current_user)
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify item belongs to user (authorization check)
-        item = await conn.fetchrow(
-            """SELECT id, status FROM dump_items
-               WHERE id = $1 AND user_id = $2""",
+        # Ownership check and status update in one statement; prior_status
+        # tells us why nothing was updated.
+        row = await conn.fetchrow(
+            """WITH src AS (
+                   SELECT id, status FROM dump_items
+                   WHERE id = $1 AND user_id = $2
+               ),
+               upd AS (
+                   UPDATE dump_items SET status = 'dismissed'
+                   FROM src
+                   WHERE dump_items.id = src.id
+                     AND src.status IS DISTINCT FROM 'dismissed'
+                     AND src.status IS DISTINCT FROM 'promoted'
+                   RETURNING dump_items.id, dump_items.dump_id, dump_items.user_id, dump_items.text,
+                             dump_items.status, dump_items.created_task_id,
+                             dump_items.created_at
+               )
+               SELECT src.status AS prior_status, upd.id, upd.dump_id, upd.user_id, upd.text,
+                      upd.status, upd.created_task_id, upd.created_at
+               FROM src LEFT JOIN upd ON true""",
             item_id, user["id"]
         )
-        if not item:
-            raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
-        
-        # Check if already dismissed or promoted
-        if item.get('status') == 'dismissed':
-            raise HTTPException(status_code=400, detail="Dump item already dismissed")
-        if item.get('status') == 'promoted':
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
+    
+    # Check if already dismissed or promoted
+    if row["id"] is None:
+        if row["prior_status"] == 'promoted':
             raise HTTPException(status_code=400, detail="Cannot dismiss promoted item")
-        
-        # Update status to dismissed
-        await conn.execute(
-            """UPDATE dump_items 
-               SET status = 'dismissed'
-               WHERE id = $1""",
-            item_id
-        )
-        
-        # Fetch updated item
-        updated_row = await conn.fetchrow(
-            """SELECT id, dump_id, user_id, text, status, created_task_id, created_at::text
-               FROM dump_items WHERE id = $1""",
-            item_id
-        )
+        raise HTTPException(status_code=400, detail="Dump item already dismissed")
     
-    return dict(updated_row)
+    updated_item = dict(row)
+    del updated_item["prior_status"]
+    return updated_item
 
 @api_router.post("/dump-items/dismiss-bulk")
 async def dismiss_dump_items_bulk(
@@ -6710,34 +6991,34 @@ async def dismiss_dump_items_bulk(
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify all items belong to user (authorization check)
-        item_ids_placeholder = ','.join(f'${i+1}' for i in range(len(item_ids)))
-        items = await conn.fetch(
-            f"""SELECT id, status FROM dump_items
-               WHERE id IN ({item_ids_placeholder}) AND user_id = ${len(item_ids) + 1}""",
-            *item_ids, user["id"]
-        )
-        
-        if len(items) != len(item_ids):
-            raise HTTPException(status_code=404, detail="Some dump items not found or you don't have permission")
-        
-        # Filter out already dismissed or promoted items
-        items_to_dismiss = [item for item in items if item.get('status') not in ['dismissed', 'promoted']]
-        
-        if not items_to_dismiss:
-            raise HTTPException(status_code=400, detail="All selected items are already dismissed or promoted")
-        
-        # Update status to dismissed
-        item_ids_to_dismiss = [item['id'] for item in items_to_dismiss]
-        item_ids_placeholder_dismiss = ','.join(f'${i+1}' for i in range(len(item_ids_to_dismiss)))
-        await conn.execute(
-            f"""UPDATE dump_items 
-               SET status = 'dismissed'
-               WHERE id IN ({item_ids_placeholder_dismiss}) AND user_id = ${len(item_ids_to_dismiss) + 1}""",
-            *item_ids_to_dismiss, user["id"]
+        # Authorization check and update in one statement: src is every owned
+        # item that was asked for, upd the ones that were still dismissable.
+        counts = await conn.fetchrow(
+            """WITH src AS (
+                    SELECT id, status FROM dump_items
+                    WHERE id = ANY($1::text[]) AND user_id = $2
+                ),
+                upd AS (
+                    UPDATE dump_items SET status = 'dismissed'
+                    FROM src
+                    WHERE dump_items.id = src.id
+                      AND src.status IS DISTINCT FROM 'dismissed'
+                      AND src.status IS DISTINCT FROM 'promoted'
+                      AND (SELECT COUNT(*) FROM src) = $3
+                    RETURNING dump_items.id
+                )
+                SELECT (SELECT COUNT(*) FROM src) AS found, (SELECT COUNT(*) FROM upd) AS dismissed""",
+            item_ids, user["id"], len(item_ids)
         )
     
-    return {"dismissed_count": len(items_to_dismiss)}
+    # Nothing is updated unless every requested item was found
+    if counts["found"] != len(item_ids):
+        raise HTTPException(status_code=404, detail="Some dump items not found or you don't have permission")
+    
+    if not counts["dismissed"]:
+        raise HTTPException(status_code=400, detail="All selected items are already dismissed or promoted")
+    
+    return {"dismissed_count": counts["dismissed"]}
 
 @api_router.patch("/dump-items/{item_id}/snooze")
 async def snooze_dump_item(item_id: str, snooze_request: SnoozeRequest, user: dict = Depends(get_current_user)):
@@ -6745,35 +7026,25 @@ async def snooze_dump_item(item_id: str, snooze_request: SnoozeRequest, user: di
     if not user or not user.get("id"):
         raise HTTPException(status_code=401, detail="User authentication required")
     
+    snooze_until_dt = parse_iso_datetime(snooze_request.snooze_until)
+    
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify item belongs to user's dump
-        item = await conn.fetchrow(
-            """SELECT dump_items.id FROM dump_items
-               JOIN dumps ON dump_items.dump_id = dumps.id
-               WHERE dump_items.id = $1 AND dumps.user_id = $2""",
-            item_id, user["id"]
-        )
-        if not item:
-            raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
-        
-        snooze_until_dt = datetime.fromisoformat(snooze_request.snooze_until.replace('Z', '+00:00'))
-        
-        await conn.execute(
+        # Update only if the item belongs to user's dump
+        updated_item = await conn.fetchrow(
             """UPDATE dump_items 
                SET status = 'snoozed', snooze_until = $1
-               WHERE id = $2""",
-            snooze_until_dt, item_id
-        )
-        
-        updated_item = await conn.fetchrow(
-            """SELECT id, dump_id, created_at::text, text, status,
-                      snooze_until::text, linked_task_id
-               FROM dump_items WHERE id = $1""",
-            item_id
+               FROM dumps
+               WHERE dump_items.id = $2 AND dump_items.dump_id = dumps.id AND dumps.user_id = $3
+               RETURNING dump_items.id, dump_items.dump_id, dump_items.created_at, dump_items.text,
+                         dump_items.status, dump_items.snooze_until, dump_items.linked_task_id""",
+            snooze_until_dt, item_id, user["id"]
         )
     
-    return dict(updated_item)
+    if not updated_item:
+        raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
+    
+    return RecordJSONResponse(updated_item)
 
 @api_router.patch("/dump-items/{item_id}/save")
 async def save_dump_item(item_id: str, user: dict = Depends(get_current_user)):
@@ -6783,29 +7054,20 @@ async def save_dump_item(item_id: str, user: dict = Depends(get_current_user)):
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify item belongs to user's dump
-        item = await conn.fetchrow(
-            """SELECT dump_items.id FROM dump_items
-               JOIN dumps ON dump_items.dump_id = dumps.id
-               WHERE dump_items.id = $1 AND dumps.user_id = $2""",
-            item_id, user["id"]
-        )
-        if not item:
-            raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
-        
-        await conn.execute(
-            "UPDATE dump_items SET status = 'saved' WHERE id = $1",
-            item_id
-        )
-        
+        # Update only if the item belongs to user's dump
         updated_item = await conn.fetchrow(
-            """SELECT id, dump_id, created_at::text, text, status,
-                      snooze_until::text, linked_task_id
-               FROM dump_items WHERE id = $1""",
-            item_id
+            """UPDATE dump_items SET status = 'saved'
+               FROM dumps
+               WHERE dump_items.id = $1 AND dump_items.dump_id = dumps.id AND dumps.user_id = $2
+               RETURNING dump_items.id, dump_items.dump_id, dump_items.created_at, dump_items.text,
+                         dump_items.status, dump_items.snooze_until, dump_items.linked_task_id""",
+            item_id, user["id"]
         )
     
-    return dict(updated_item)
+    if not updated_item:
+        raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
+    
+    return RecordJSONResponse(updated_item)
 
 @api_router.patch("/dump-items/{item_id}/trash")
 async def trash_dump_item(item_id: str, user: dict = Depends(get_current_user)):
@@ -6815,29 +7077,20 @@ async def trash_dump_item(item_id: str, user: dict = Depends(get_current_user)):
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify item belongs to user's dump
-        item = await conn.fetchrow(
-            """SELECT dump_items.id FROM dump_items
-               JOIN dumps ON dump_items.dump_id = dumps.id
-               WHERE dump_items.id = $1 AND dumps.user_id = $2""",
-            item_id, user["id"]
-        )
-        if not item:
-            raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
-        
-        await conn.execute(
-            "UPDATE dump_items SET status = 'trashed' WHERE id = $1",
-            item_id
-        )
-        
+        # Update only if the item belongs to user's dump
         updated_item = await conn.fetchrow(
-            """SELECT id, dump_id, created_at::text, text, status,
-                      snooze_until::text, linked_task_id
-               FROM dump_items WHERE id = $1""",
-            item_id
+            """UPDATE dump_items SET status = 'trashed'
+               FROM dumps
+               WHERE dump_items.id = $1 AND dump_items.dump_id = dumps.id AND dumps.user_id = $2
+               RETURNING dump_items.id, dump_items.dump_id, dump_items.created_at, dump_items.text,
+                         dump_items.status, dump_items.snooze_until, dump_items.linked_task_id""",
+            item_id, user["id"]
         )
     
-    return dict(updated_item)
+    if not updated_item:
+        raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
+    
+    return RecordJSONResponse(updated_item)
 
 @api_router.delete("/dump-items/{item_id}")
 async def delete_dump_item(item_id: str, user: dict = Depends(get_current_user)):
@@ -6847,20 +7100,14 @@ async def delete_dump_item(item_id: str, user: dict = Depends(get_current_user))
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify item belongs to user's dump
-        item = await conn.fetchrow(
-            """SELECT dump_items.id FROM dump_items
-               JOIN dumps ON dump_items.dump_id = dumps.id
-               WHERE dump_items.id = $1 AND dumps.user_id = $2""",
+        # Ownership is checked by the DELETE itself via the dumps join
+        result = await conn.execute(
+            """DELETE FROM dump_items USING dumps
+               WHERE dump_items.id = $1 AND dump_items.dump_id = dumps.id AND dumps.user_id = $2""",
             item_id, user["id"]
         )
-        if not item:
+        if result == "DELETE 0":
             raise HTTPException(status_code=404, detail="Dump item not found or you don't have permission")
-        
-        await conn.execute(
-            "DELETE FROM dump_items WHERE id = $1",
-            item_id
-        )
     
     return {"success": True}
 
@@ -6887,40 +7134,47 @@ async def get_next_today_count(user: dict = Depends(get_current_user)):
 
 # ===== Google Calendar Integration =====
 
+# Calendar sync is switched off; the disabled endpoints answer with these
+# prebuilt constants instead of building a message and body per call
+GCAL_DISABLED_MESSAGE = "Google Calendar sync is currently disabled"
+GCAL_DISABLED_REDIRECT_URL = f"{FRONTEND_URL}?google_error={GCAL_DISABLED_MESSAGE}"
+GCAL_STATUS_BODY = orjson.dumps({"connected": False, "message": GCAL_DISABLED_MESSAGE})
+GCAL_DISCONNECT_BODY = orjson.dumps({"success": True, "message": GCAL_DISABLED_MESSAGE})
+
+# The calendar consent URL depends only on config, so it's built once
+GOOGLE_CALENDAR_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode({
+    "client_id": GOOGLE_CLIENT_ID,
+    "redirect_uri": GOOGLE_REDIRECT_URI,
+    "response_type": "code",
+    "scope": " ".join(GOOGLE_SCOPES),
+    "access_type": "offline",
+    "prompt": "consent",
+}) if GOOGLE_CLIENT_ID else None
+
 @api_router.get("/auth/google/login")
 async def google_login():
     """Start Google OAuth flow"""
-    if not GOOGLE_CLIENT_ID:
+    if not GOOGLE_CALENDAR_AUTH_URL:
         raise HTTPException(status_code=500, detail="Google OAuth not configured")
-    
-    auth_url = (
-        "https://accounts.google.com/o/oauth2/v2/auth?"
-        f"client_id={GOOGLE_CLIENT_ID}&"
-        f"redirect_uri={GOOGLE_REDIRECT_URI}&"
-        "response_type=code&"
-        f"scope={' '.join(GOOGLE_SCOPES)}&"
-        "access_type=offline&"
-        "prompt=consent"
-    )
-    return {"authorization_url": auth_url}
+    return {"authorization_url": GOOGLE_CALENDAR_AUTH_URL}
 
 
 @api_router.get("/auth/google/callback")
 async def google_callback(code: str = Query(None)):
     """Handle Google OAuth callback - DISABLED for Calendar sync"""
-    return RedirectResponse(f"{FRONTEND_URL}?google_error=Google Calendar sync is currently disabled")
+    return RedirectResponse(GCAL_DISABLED_REDIRECT_URL)
 
 
 @api_router.get("/auth/google/status")
 async def google_status():
     """Check if Google Calendar is connected - DISABLED: pending Supabase migration"""
-    return {"connected": False, "message": "Google Calendar sync is currently disabled"}
+    return Response(GCAL_STATUS_BODY, media_type="application/json")
 
 
 @api_router.post("/auth/google/disconnect")
 async def google_disconnect():
     """Disconnect Google Calendar - DISABLED: pending Supabase migration"""
-    return {"success": True, "message": "Google Calendar sync is currently disabled"}
+    return Response(GCAL_DISCONNECT_BODY, media_type="application/json")
 
 
 async def get_google_credentials():
@@ -6931,101 +7185,18 @@ async def get_google_credentials():
 @api_router.post("/calendar/sync")
 async def sync_to_google_calendar():
     """Sync all scheduled tasks to Google Calendar - DISABLED"""
-    raise HTTPException(status_code=503, detail="Google Calendar sync is currently disabled")
+    raise HTTPException(status_code=503, detail=GCAL_DISABLED_MESSAGE)
 
 
 @api_router.post("/calendar/sync-task/{task_id}")
 async def sync_single_task(task_id: str):
     """Sync a single task to Google Calendar - DISABLED"""
-    raise HTTPException(status_code=503, detail="Google Calendar sync is currently disabled")
+    raise HTTPException(status_code=503, detail=GCAL_DISABLED_MESSAGE)
 
 
 # Dump models and endpoints are defined above, starting around line 1749
 # Duplicate removed here - see # ===== Dump (Transmission) System ===== section above
 # (This comment is just to prevent accidental re-addition)
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    source: str = Field(..., description="Source type: 'voice' or 'text'")
-    raw_text: str
-    transcript: Optional[str] = None
-    clarified_at: Optional[str] = None
-    archived_at: Optional[str] = None
-
-class DumpCreate(BaseModel):
-    source: str = Field(..., description="Source type: 'voice' or 'text'")
-    raw_text: str
-    transcript: Optional[str] = None
-    title: Optional[str] = None
-
-# Dump endpoints
-@api_router.get("/dumps", response_model=List[Dump])
-async def get_dumps(archived: Optional[bool] = Query(None, description="Filter by archived status"), 
-                    user: dict = Depends(get_current_user)):
-    """Get all dumps for the current user, newest first. Returns [] if table doesn't exist (dev mode)."""
-    if not user or not user.get("id"):
-        raise HTTPException(status_code=401, detail="User authentication required")
-    
-    pool = await get_db_pool()
-    async with pool.acquire() as conn:
-        try:
-            # Check if dumps table exists - if not, return empty list (graceful degradation)
-            table_exists = await conn.fetchval(
-                """SELECT EXISTS (
-                   SELECT 1 FROM information_schema.tables 
-                   WHERE table_schema = 'public' 
-                   AND table_name = 'dumps'
-                )"""
-            )
-            
-            if not table_exists:
-                logger.warning(f"dumps table does not exist for user {user['id']}. Returning empty list.")
-                return []
-        except Exception as e:
-            logger.error(f"Error checking for dumps table: {e}")
-            # In dev mode, return empty list instead of crashing
-            if ENV != 'production':
-                return []
-            raise HTTPException(status_code=500, detail="Database error")
-        
-        try:
-            if archived is None:
-                # Get non-archived dumps by default
-                rows = await conn.fetch(
-                    """SELECT id, user_id, created_at::text, source, raw_text, transcript, title,
-                              clarified_at::text, archived_at::text
-                       FROM dumps 
-                       WHERE user_id = $1 AND archived_at IS NULL
-                       ORDER BY created_at DESC""",
-                    user["id"]
-                )
-            else:
-                rows = await conn.fetch(
-                    """SELECT id, user_id, created_at::text, source, raw_text, transcript, title,
-                              clarified_at::text, archived_at::text
-                       FROM dumps 
-                       WHERE user_id = $1 AND (archived_at IS NULL) = $2
-                       ORDER BY created_at DESC""",
-                    user["id"], not archived
-                )
-            
-            return [dict(row) for row in rows]
-        except Exception as e:
-            error_str = str(e).lower()
-            if "does not exist" in error_str or "relation" in error_str or "table" in error_str or "column" in error_str:
-                logger.warning(f"Database schema issue with dumps table: {e}. Returning empty list.")
-                # In dev mode, return empty list instead of crashing
-                if ENV != 'production':
-                    return []
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Database schema error: {str(e)}"
-                )
-            logger.error(f"Error fetching dumps: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error fetching dumps: {str(e)}"
-            )
 
 @api_router.get("/dumps/{dump_id}")
 async def get_dump(dump_id: str, user: dict = Depends(get_current_user)):
@@ -7034,20 +7205,6 @@ async def get_dump(dump_id: str, user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=401, detail="User authentication required")
     
     pool = await get_db_pool()
-    async with pool.acquire() as conn:
-        # Get dump
-        dump_row = await conn.fetchrow(
-            """SELECT id, user_id, created_at::text, source, raw_text, transcript, title,
-                      clarified_at::text, archived_at::text
-               FROM dumps
-               WHERE id = $1 AND user_id = $2""",
-            dump_id, user["id"]
-        )
-    
-    if not dump_row:
-        raise HTTPException(status_code=404, detail="Dump not found")
-    
-    # Get items for this dump
     async with pool.acquire() as conn:
         # Get all existing columns in dump_items table
         existing_columns = await get_dump_items_existing_columns(conn)
@@ -7063,7 +7220,7 @@ async def get_dump(dump_id: str, user: dict = Depends(get_current_user)):
         if 'user_id' in existing_columns:
             select_parts.append('user_id')
         if 'created_at' in existing_columns:
-            select_parts.append('created_at::text')
+            select_parts.append('created_at')
         if 'text' in existing_columns:
             select_parts.append('text')
         if 'status' in existing_columns:
@@ -7085,120 +7242,42 @@ async def get_dump(dump_id: str, user: dict = Depends(get_current_user)):
         if 'energy_required' in existing_columns:
             select_parts.append('energy_required')
         if 'scheduled_date' in existing_columns:
-            select_parts.append('scheduled_date::text')
+            select_parts.append('scheduled_date')
         if 'scheduled_time' in existing_columns:
             select_parts.append('scheduled_time')
         if 'linked_task_id' in existing_columns:
             select_parts.append('linked_task_id')
         if 'snooze_until' in existing_columns:
-            select_parts.append('snooze_until::text')
+            select_parts.append('snooze_until')
         
         select_clause = ', '.join(select_parts)
         
-        item_rows = await conn.fetch(
-            f"""SELECT {select_clause}
-               FROM dump_items
-               WHERE dump_id = $1
-               ORDER BY created_at ASC""",
-            dump_id
+        # Dump and its items in one round-trip: items are aggregated into a
+        # JSON array by a correlated subquery.
+        dump_row = await conn.fetchrow(
+            f"""SELECT d.id, d.user_id, d.created_at, d.source, d.raw_text, d.transcript, d.title,
+                       d.clarified_at, d.archived_at,
+                       COALESCE((
+                           SELECT json_agg(i ORDER BY i.created_at)
+                           FROM (SELECT {select_clause} FROM dump_items WHERE dump_id = d.id) i
+                       ), '[]') AS items
+               FROM dumps d
+               WHERE d.id = $1 AND d.user_id = $2""",
+            dump_id, user["id"]
         )
-        
-        # Log duration values for debugging
-        for row in item_rows:
-            if 'duration' in row:
-                logger.info(f"GET dump: item {row.get('id', 'unknown')} has duration = {row.get('duration')}")
-    
-    dump_dict = dict(dump_row)
-    dump_dict["items"] = [dict(row) for row in item_rows]
     
-    return dump_dict
-
-@api_router.patch("/dumps/{dump_id}", response_model=Dump)
-async def update_dump(dump_id: str, dump_update: dict, user: dict = Depends(get_current_user)):
-    """Update a dump (e.g., archive, clarify)"""
-    if not user or not user.get("id"):
-        raise HTTPException(status_code=401, detail="User authentication required")
-    
-    pool = await get_db_pool()
-    async with pool.acquire() as conn:
-        # Build update query dynamically
-        allowed_fields = {'transcript', 'title', 'clarified_at', 'archived_at'}
-        update_data = {k: v for k, v in dump_update.items() if k in allowed_fields}
-        
-        if not update_data:
-            raise HTTPException(status_code=400, detail="No valid fields to update")
-        
-        set_clauses = []
-        values = []
-        param_num = 1
-        
-        for key, value in update_data.items():
-            if key == 'clarified_at' or key == 'archived_at':
-                if value:
-                    set_clauses.append(f"{key} = ${param_num}")
-                    values.append(datetime.fromisoformat(value.replace('Z', '+00:00')) if isinstance(value, str) else value)
-                else:
-                    set_clauses.append(f"{key} = NULL")
-                param_num += 1 if value else 0
-            else:
-                set_clauses.append(f"{key} = ${param_num}")
-                values.append(value)
-                param_num += 1
-        
-        where_clause = f"id = ${param_num} AND user_id = ${param_num + 1}"
-        values.extend([dump_id, user["id"]])
-        
-        query = f"""UPDATE dumps SET {', '.join(set_clauses)} 
-                    WHERE {where_clause}
-                    RETURNING id, user_id, created_at::text, source, raw_text, transcript, title,
-                              clarified_at::text, archived_at::text"""
-        
-        row = await conn.fetchrow(query, *values)
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
+    if not dump_row:
+        raise HTTPException(status_code=404, detail="Dump not found")
     
-    return dict(row)
-
-# Dump Items endpoints
-@api_router.post("/dumps/{dump_id}/items", response_model=DumpItem)
-async def create_dump_item(dump_id: str, item_data: DumpItemCreate, user: dict = Depends(get_current_user)):
-    """Create a new item in a dump"""
-    if not user or not user.get("id"):
-        raise HTTPException(status_code=401, detail="User authentication required")
+    dump_dict = dict(dump_row)
+    dump_dict["items"] = orjson.loads(dump_dict["items"])
     
-    pool = await get_db_pool()
-    async with pool.acquire() as conn:
-        # Verify dump belongs to user
-        dump = await conn.fetchrow(
-            "SELECT id FROM dumps WHERE id = $1 AND user_id = $2",
-            dump_id, user["id"]
-        )
-        if not dump:
-            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
-        
-        item_id = str(uuid.uuid4())
-        created_at = datetime.now(timezone.utc)
-        status = item_data.status or "new"
-        
-        snooze_until_value = None
-        if item_data.snooze_until:
-            snooze_until_value = datetime.fromisoformat(item_data.snooze_until.replace('Z', '+00:00'))
-        
-        await conn.execute(
-            """INSERT INTO dump_items (id, dump_id, created_at, text, status, snooze_until)
-               VALUES ($1, $2, $3, $4, $5, $6)""",
-            item_id, dump_id, created_at, item_data.text, status, snooze_until_value
-        )
-        
-        row = await conn.fetchrow(
-            """SELECT id, dump_id, created_at::text, text, status, 
-                      snooze_until::text, linked_task_id, duration
-               FROM dump_items WHERE id = $1""",
-            item_id
-        )
+    # Log duration values for debugging
+    for item in dump_dict["items"]:
+        if 'duration' in item:
+            logger.info(f"GET dump: item {item.get('id', 'unknown')} has duration = {item.get('duration')}")
     
-    return dict(row)
+    return dump_dict
 
 @api_router.post("/dumps/{dump_id}/triage")
 async def triage_dump_items(dump_id: str, triage_request: TriageRequest, user: dict = Depends(get_current_user)):
@@ -7211,100 +7290,100 @@ async def triage_dump_items(dump_id: str, triage_request: TriageRequest, user: d
     
     pool = await get_db_pool()
     async with pool.acquire() as conn:
-        # Verify dump belongs to user
-        dump = await conn.fetchrow(
-            "SELECT id FROM dumps WHERE id = $1 AND user_id = $2",
-            dump_id, user["id"]
-        )
-        if not dump:
-            raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
-        
-        # Get dump_items (verify they belong to this dump and user)
-        # Use COALESCE to handle both state and status columns (migration transition)
-        item_ids_placeholder = ','.join(f'${i+1}' for i in range(len(triage_request.item_ids)))
-        items_query = f"""SELECT di.id, di.text, COALESCE(di.state, di.status, 'new') as item_state, di.user_id, di.duration
-                          FROM dump_items di
-                          WHERE di.id IN ({item_ids_placeholder}) 
-                            AND di.dump_id = $${len(triage_request.item_ids) + 1}
-                            AND di.user_id = $${len(triage_request.item_ids) + 2}"""
-        
-        items = await conn.fetch(
-            items_query,
-            *triage_request.item_ids, dump_id, user["id"]
-        )
-        
-        if len(items) != len(triage_request.item_ids):
-            raise HTTPException(status_code=400, detail="Some dump items not found or don't belong to this dump")
-        
-        # Check Next Today cap if target is NEXT_TODAY
-        if triage_request.target == 'NEXT_TODAY':
-            next_count = await conn.fetchval(
-                "SELECT COUNT(*) FROM tasks WHERE user_id = $1 AND status = 'next'",
-                user["id"]
+        # Item read, task inserts and item updates commit together
+        async with conn.transaction():
+            # Get dump_items (verify they belong to this dump and user)
+            # Use COALESCE to handle both state and status columns (migration transition)
+            state_column = await get_dump_items_state_column(conn)
+            item_state = "COALESCE(di.state, di.status, 'new')" if state_column == 'state' else "COALESCE(di.status, 'new')"
+            # Ownership check folded into the read: the dumps row drives the join,
+            # so a foreign/missing dump yields nothing and an owned dump yields its
+            # matching items (or one all-NULL item row if none match).
+            item_ids = triage_request.item_ids or []
+            rows = await conn.fetch(
+                f"""SELECT di.id, di.text, {item_state} as item_state, di.user_id, di.duration
+                   FROM dumps d
+                   LEFT JOIN dump_items di ON di.dump_id = d.id
+                     AND di.user_id = d.user_id
+                     AND di.id = ANY($1::text[])
+                   WHERE d.id = $2 AND d.user_id = $3""",
+                item_ids, dump_id, user["id"]
             )
-            NEXT_TODAY_CAP = 1
-            available_slots = NEXT_TODAY_CAP - next_count
+            if not rows:
+                raise HTTPException(status_code=404, detail="Dump not found or you don't have permission")
+            items = [row for row in rows if row['id'] is not None]
             
-            if available_slots <= 0:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Next Today is full ({NEXT_TODAY_CAP}). Convert remaining to Inbox or Later."
-                )
+            if len(items) != len(item_ids):
+                raise HTTPException(status_code=400, detail="Some dump items not found or don't belong to this dump")
             
-            # If trying to add more items than available slots, only convert what fits
-            if len(items) > available_slots:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Next Today is full ({NEXT_TODAY_CAP}). Only {available_slots} slot(s) available. Convert remaining to Inbox or Later."
-                )
-        
-        # Map target to task status
-        task_status = 'inbox' if triage_request.target == 'INBOX' else ('next' if triage_request.target == 'NEXT_TODAY' else 'later')
-        
-        # Create tasks from dump_items
-        created_tasks = []
-        created_at = datetime.now(timezone.utc)
-        
-        for item in items:
-            # Skip if already converted (check item_state which uses COALESCE)
-            if item.get('item_state') == 'converted' or item.get('item_state') == 'promoted':
-                continue
+            # Map target to task status
+            task_status = TARGET_TO_STATUS[triage_request.target.lower()]
             
-            task_id = str(uuid.uuid4())
-            item_duration = item.get('duration', 30)
-            logger.info(f"Triaging dump_item {item.get('id')} to task with duration: {item_duration} minutes")
+            # Next Today is capped; the cap is checked inside the INSERT below
+            NEXT_TODAY_CAP = 1
+            cap = NEXT_TODAY_CAP if task_status == 'next' else None
             
-            await conn.execute(
-                """INSERT INTO tasks (id, user_id, title, status, created_at, priority, urgency, importance, duration)
-                   VALUES ($1, $2, $3, $4, $5, 2, 2, 2, $6)""",
-                task_id, user["id"], item.get('text', 'Untitled Task'), task_status, created_at, item_duration
+            # Skip items already converted (item_state uses COALESCE)
+            to_convert = [item for item in items if item.get('item_state') not in ('converted', 'promoted')]
+            created_at = datetime.now(timezone.utc)
+            
+            # Create all tasks in one statement; task ids are generated in SQL.
+            # The outer SELECT always yields a row carrying the Next Today count,
+            # so an empty insert can be told apart from a full Next Today.
+            if cap is not None:
+                await conn.execute(SQL_LOCK_USER_CAPS, user["id"])
+            rows = await conn.fetch(
+                """WITH cap AS (
+                       SELECT COUNT(*) AS c FROM tasks WHERE user_id = $1 AND status = 'next'
+                   ), ins AS (
+                       INSERT INTO tasks (id, user_id, title, status, created_at, priority, urgency, importance, duration)
+                       SELECT gen_random_uuid()::text, $1, m.title, $2, $3, 2, 2, 2, m.duration
+                       FROM unnest($4::text[], $5::int[]) WITH ORDINALITY AS m(title, duration, ord), cap
+                       WHERE $6::int IS NULL OR (cap.c < $6 AND cap.c + $7 <= $6)
+                       ORDER BY m.ord
+                       RETURNING id, user_id, title, description, priority, urgency, importance,
+                                 scheduled_date, scheduled_time, duration, status, created_at
+                   )
+                   SELECT cap.c AS cap_count, ins.* FROM cap LEFT JOIN ins ON true""",
+                user["id"], task_status, created_at,
+                [item.get('text', 'Untitled Task') for item in to_convert],
+                [item.get('duration', 30) for item in to_convert],
+                cap, len(items)
             )
             
-            # Mark dump_item as converted (try state first, fallback to status for migration transition)
+            if cap is not None:
+                available_slots = cap - rows[0]["cap_count"]
+                if available_slots <= 0:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Next Today is full ({NEXT_TODAY_CAP}). Convert remaining to Inbox or Later."
+                    )
+                # If trying to add more items than available slots, nothing was converted
+                if len(items) > available_slots:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Next Today is full ({NEXT_TODAY_CAP}). Only {available_slots} slot(s) available. Convert remaining to Inbox or Later."
+                    )
+            
+            rows = [row for row in rows if row["id"] is not None]
+            logger.info(f"Triaged {len(rows)} dump_item(s) to {task_status}")
+            
+            # Mark dump_items as converted. Older schemas' status CHECK may not
+            # allow 'converted'; the savepoint keeps that from undoing the tasks.
             try:
-                await conn.execute(
-                    "UPDATE dump_items SET state = 'converted' WHERE id = $1",
-                    item['id']
-                )
-            except Exception:
-                # Fallback: if state column doesn't exist, use status
-                try:
+                async with conn.transaction():
                     await conn.execute(
-                        "UPDATE dump_items SET status = 'converted' WHERE id = $1",
-                        item['id']
+                        f"UPDATE dump_items SET {state_column} = 'converted' WHERE id = ANY($1::text[])",
+                        [item['id'] for item in to_convert]
                     )
-                except Exception as e:
-                    logger.warning(f"Failed to update dump_item state/status: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to update dump_item {state_column}: {e}")
             
-            # Fetch created task
-            task = await conn.fetchrow(
-                """SELECT id, user_id, title, description, priority, urgency, importance,
-                      scheduled_date::text, scheduled_time, duration, status, created_at::text
-                   FROM tasks WHERE id = $1""",
-                task_id
-            )
-            if task:
-                created_tasks.append(dict(task))
+            created_tasks = []
+            for row in rows:
+                task = dict(row)
+                del task["cap_count"]
+                created_tasks.append(task)
     
     return {"tasks": created_tasks}
 
@@ -7321,52 +7400,14 @@ async def health_root():
     return {"status": "healthy"}
 
 # Root-level dump endpoint aliases (for backward compatibility)
-# These delegate to the handlers defined in api_router
-# Both /dumps and /api/dumps routes work for all dump operations
-
-@app.post("/dumps", response_model=Dump)
-async def create_dump_root(dump_data: DumpCreate, user: dict = Depends(get_current_user)):
-    """Root-level POST /dumps endpoint (alias for /api/dumps)"""
-    # Delegate to the existing create_dump handler (defined above in api_router)
-    return await create_dump(dump_data, user)
-
-@app.get("/dumps", response_model=List[Dump])
-async def get_dumps_root(
-    archived: Optional[bool] = Query(None, description="Filter by archived status"), 
-    user: dict = Depends(get_current_user)
-):
-    """Root-level GET /dumps endpoint (alias for /api/dumps) - returns [] if not authenticated or table missing"""
-    # Delegate to the existing get_dumps handler (defined above in api_router)
-    # This will handle authentication and graceful degradation for missing tables
-    try:
-        return await get_dumps(archived, user)
-    except HTTPException as e:
-        # Re-raise HTTP exceptions (401, 500, etc.) as-is
-        raise
-    except Exception as e:
-        # Catch any other unexpected errors and return empty list in dev mode
-        logger.error(f"Unexpected error in get_dumps_root: {e}", exc_info=True)
-        if ENV != 'production':
-            return []
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-@app.get("/dumps/{dump_id}", response_model=Dump)
-async def get_dump_root(dump_id: str, user: dict = Depends(get_current_user)):
-    """Root-level GET /dumps/{dump_id} endpoint (alias for /api/dumps/{dump_id})"""
-    # Delegate to the existing get_dump handler (defined above in api_router)
-    return await get_dump(dump_id, user)
-
-@app.post("/dumps/{dump_id}/extract")
-async def extract_dump_root(dump_id: str, user: dict = Depends(get_current_user)):
-    """Root-level POST /dumps/{dump_id}/extract endpoint (alias for /api/dumps/{dump_id}/extract)"""
-    # Delegate to the extract_dump handler (which itself delegates to clarify_dump)
-    return await extract_dump(dump_id, user)
-
-@app.post("/dumps/{dump_id}/triage")
-async def triage_dump_root(dump_id: str, triage_request: TriageRequest, user: dict = Depends(get_current_user)):
-    """Root-level POST /dumps/{dump_id}/triage endpoint (alias for /api/dumps/{dump_id}/triage)"""
-    # Delegate to the existing triage_dump_items handler
-    return await triage_dump_items(dump_id, triage_request, user)
+# Both /dumps and /api/dumps routes work for all dump operations. The aliases
+# are registered on the api_router handlers themselves, so a root-level request
+# resolves dependencies and validates its body once, like its /api twin.
+app.add_api_route("/dumps", create_dump, methods=["POST"])
+app.add_api_route("/dumps", get_dumps, methods=["GET"], response_model=List[Dump])
+app.add_api_route("/dumps/{dump_id}", get_dump, methods=["GET"])
+app.add_api_route("/dumps/{dump_id}/extract", extract_dump, methods=["POST"])
+app.add_api_route("/dumps/{dump_id}/triage", triage_dump_items, methods=["POST"])
 
 
 # Debug endpoint for extraction investigation
@@ -7398,8 +7439,8 @@ async def get_extraction_debug(dump_id: str, user: dict = Depends(get_current_us
         extraction_debug = None
         if dump.get("extraction_debug"):
             try:
-                extraction_debug = json.loads(dump.get("extraction_debug"))
-            except:
+                extraction_debug = orjson.loads(dump.get("extraction_debug"))
+            except (orjson.JSONDecodeError, TypeError):
                 extraction_debug = dump.get("extraction_debug")
         
         # Get dump_items from DB
@@ -7429,7 +7470,7 @@ async def get_extraction_debug(dump_id: str, user: dict = Depends(get_current_us
 @app.get("/gcal")
 async def google_callback_root(code: str = Query(None)):
     """Handle Google OAuth callback - DISABLED"""
-    return RedirectResponse(f"{FRONTEND_URL}?google_error=Google Calendar sync is currently disabled")
+    return RedirectResponse(GCAL_DISABLED_REDIRECT_URL)
 
 # CORS middleware already added above (before routes)
 
@@ -7441,8 +7482,24 @@ async def root():
         return {"message": "ADD Daily API", "docs": "API documentation is disabled in production"}
     return RedirectResponse(url="/api/docs")
 
+@app.on_event("startup")
+async def startup_db_client():
+    """Open the pool (connections and TLS handshakes) before the first request.
+
+    A failure is only logged: get_db_pool() retries on the next request, so
+    the app still comes up while the database is briefly unreachable.
+    """
+    if DB_SSL_CONTEXT.verify_mode == ssl.CERT_NONE:
+        logger.warning("Database TLS certificate is not verified; set DB_SSL_ROOT_CERT to the provider's CA file")
+    try:
+        await get_db_pool()
+    except Exception as e:
+        logger.warning("Database pool not ready at startup: %s", e)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     global db_pool
     if db_pool:
         await db_pool.close()
+    await http_client.aclose()
+    PASSWORD_HASH_EXECUTOR.shutdown(wait=False)
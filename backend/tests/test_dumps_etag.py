@@ -0,0 +1,109 @@
+"""
+Tests for the ETag on GET /dumps: weak, shared by the gzip and identity
+bodies, answered with 304 on a match, and always sent with
+Vary: Accept-Encoding.
+
+To run these tests:
+    cd backend
+    pip install pytest
+    pytest tests/test_dumps_etag.py -v
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+from server import app, get_current_user
+
+TEST_USER = {"id": "user-1", "email": "test-etag@example.com"}
+
+# Enough dumps that the body is over GZipMiddleware's minimum_size
+DUMP_ROWS = [
+    {
+        "id": f"dump-{i}", "user_id": "user-1",
+        "created_at": datetime(2026, 10, 17, tzinfo=timezone.utc) - timedelta(minutes=i),
+        "source": "text", "raw_text": f"Things to do, take {i}", "transcript": None,
+        "title": None, "clarified_at": None, "archived_at": None,
+    }
+    for i in range(20)
+]
+
+
+class FakeConnection:
+    async def fetchval(self, query, *args):
+        # The dumps table exists
+        return True
+
+    async def fetch(self, query, *args):
+        return DUMP_ROWS
+
+
+class FakeAcquire:
+    async def __aenter__(self):
+        return FakeConnection()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePool:
+    def acquire(self):
+        return FakeAcquire()
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user] = lambda: TEST_USER
+    with patch("server.get_db_pool", AsyncMock(return_value=FakePool())):
+        yield TestClient(app)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def get_dumps(client, **headers):
+    return client.get("/api/dumps", headers={"Accept-Encoding": "gzip", **headers})
+
+
+def vary_tokens(response):
+    return {token.strip().lower() for token in response.headers.get("vary", "").split(",")}
+
+
+def test_gzip_and_identity_share_a_weak_etag(client):
+    gzipped = get_dumps(client)
+    identity = get_dumps(client, **{"Accept-Encoding": "identity"})
+
+    assert gzipped.status_code == identity.status_code == 200
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert gzipped.json() == identity.json()
+    assert gzipped.headers["etag"].startswith('W/"')
+    assert gzipped.headers["etag"] == identity.headers["etag"]
+    assert "accept-encoding" in vary_tokens(gzipped)
+    assert "accept-encoding" in vary_tokens(identity)
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity"])
+def test_matching_if_none_match_is_304(client, accept_encoding):
+    etag = get_dumps(client).headers["etag"]
+
+    response = get_dumps(client, **{"Accept-Encoding": accept_encoding, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == etag
+    assert "accept-encoding" in vary_tokens(response)
+
+
+def test_if_none_match_uses_weak_comparison(client):
+    etag = get_dumps(client).headers["etag"]
+    strong_form = etag[2:]
+
+    assert get_dumps(client, **{"If-None-Match": strong_form}).status_code == 304
+    assert get_dumps(client, **{"If-None-Match": f'"stale", {etag}'}).status_code == 304
+
+
+def test_stale_if_none_match_gets_the_body(client):
+    response = get_dumps(client, **{"If-None-Match": 'W/"stale"'})
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(DUMP_ROWS)
@@ -0,0 +1,130 @@
+"""
+Tests for GET /dumps/{dump_id}, whose items come back as one json_agg column.
+
+To run these tests:
+    cd backend
+    pip install pytest
+    pytest tests/test_get_dump_items.py -v
+"""
+import pytest
+import orjson
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+from server import app, get_current_user, DumpItem
+
+TEST_USER = {"id": "user-1", "email": "test-dump@example.com"}
+
+DUMP_ITEMS_COLUMNS = [
+    "id", "dump_id", "user_id", "created_at", "text", "status", "created_task_id",
+    "duration", "priority", "energy_required", "scheduled_date", "scheduled_time",
+]
+
+# json_agg renders timestamptz and date columns the way Postgres does
+ITEMS_JSON = orjson.dumps([
+    {
+        "id": "item-1", "dump_id": "dump-1", "user_id": "user-1",
+        "created_at": "2026-10-17T07:00:00.123456+00:00", "text": "Call the bank",
+        "status": "new", "created_task_id": None, "duration": 15, "priority": 3,
+        "energy_required": "low", "scheduled_date": "2026-10-18", "scheduled_time": "09:30",
+    },
+    {
+        "id": "item-2", "dump_id": "dump-1", "user_id": "user-1",
+        "created_at": "2026-10-17T07:05:00+00:00", "text": "Buy milk",
+        "status": "promoted", "created_task_id": "task-9", "duration": 30, "priority": 2,
+        "energy_required": None, "scheduled_date": None, "scheduled_time": None,
+    },
+]).decode()
+
+
+class FakeConnection:
+    def __init__(self, dump_row):
+        self.dump_row = dump_row
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        return [{"column_name": name} for name in DUMP_ITEMS_COLUMNS]
+
+    async def fetchrow(self, query, *args):
+        self.queries.append(query)
+        return self.dump_row
+
+
+class FakeAcquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePool:
+    def __init__(self, dump_row):
+        self.conn = FakeConnection(dump_row)
+
+    def acquire(self):
+        return FakeAcquire(self.conn)
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user] = lambda: TEST_USER
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def get_dump_with(client, dump_row):
+    pool = FakePool(dump_row)
+    with patch("server.get_db_pool", AsyncMock(return_value=pool)):
+        response = client.get("/api/dumps/dump-1")
+    return response, pool
+
+
+def test_get_dump_items_validate_against_dump_item(client):
+    """Items decoded from the json_agg column still validate as DumpItem"""
+    dump_row = {
+        "id": "dump-1", "user_id": "user-1",
+        "created_at": datetime(2026, 10, 17, 7, 0, tzinfo=timezone.utc),
+        "source": "text", "raw_text": "Call the bank, buy milk", "transcript": None,
+        "title": None, "clarified_at": None, "archived_at": None,
+        "items": ITEMS_JSON,
+    }
+
+    response, pool = get_dump_with(client, dump_row)
+
+    assert response.status_code == 200
+    assert "json_agg" in pool.conn.queries[0]
+    body = response.json()
+    assert body["created_at"] == "2026-10-17T07:00:00+00:00"
+    assert [item["id"] for item in body["items"]] == ["item-1", "item-2"]
+
+    first, second = (DumpItem(**item) for item in body["items"])
+    assert first.created_at == datetime(2026, 10, 17, 7, 0, 0, 123456, tzinfo=timezone.utc)
+    assert first.scheduled_date.isoformat() == "2026-10-18"
+    assert first.priority == 3
+    assert second.scheduled_date is None
+    assert second.created_task_id == "task-9"
+
+
+def test_get_dump_without_items(client):
+    """A dump with no items comes back with an empty list"""
+    dump_row = {
+        "id": "dump-1", "user_id": "user-1", "created_at": None,
+        "source": "voice", "raw_text": "", "transcript": "", "title": None,
+        "clarified_at": None, "archived_at": None, "items": "[]",
+    }
+
+    response, _ = get_dump_with(client, dump_row)
+
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+def test_get_dump_not_found(client):
+    response, _ = get_dump_with(client, None)
+
+    assert response.status_code == 404
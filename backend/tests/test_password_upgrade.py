@@ -0,0 +1,114 @@
+"""
+Tests for password login against legacy and current hashes.
+
+To run these tests:
+    cd backend
+    pip install pytest
+    pytest tests/test_password_upgrade.py -v
+"""
+import pytest
+import bcrypt
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+from server import app, PASSWORD_HASHER, _verify_and_update
+
+TEST_USER_EMAIL = "test-upgrade@example.com"
+TEST_USER_PASSWORD = "test-password-123"
+
+
+class FakeConnection:
+    def __init__(self, user):
+        self.user = user
+
+    async def fetchrow(self, query, *args):
+        return self.user
+
+
+class FakeAcquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePool:
+    """Pool holding one users row; records the statements run through execute"""
+    def __init__(self, hashed_password):
+        self.user = {
+            "id": "user-1",
+            "email": TEST_USER_EMAIL,
+            "name": "Test Upgrade User",
+            "hashed_password": hashed_password,
+            "avatar_url": None,
+        }
+        self.executed = []
+
+    def acquire(self):
+        return FakeAcquire(FakeConnection(self.user))
+
+    async def execute(self, query, *args):
+        self.executed.append((query, args))
+
+
+def login_with(hashed_password, password=TEST_USER_PASSWORD):
+    pool = FakePool(hashed_password)
+    with patch("server.get_db_pool", AsyncMock(return_value=pool)):
+        response = TestClient(app).post("/api/auth/login", json={
+            "email": TEST_USER_EMAIL,
+            "password": password
+        })
+    return response, pool
+
+
+def test_login_with_bcrypt_hash_rehashes_to_argon2():
+    """A legacy bcrypt hash still logs in and is replaced by an Argon2id hash"""
+    legacy_hash = bcrypt.hashpw(TEST_USER_PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+    response, pool = login_with(legacy_hash)
+
+    assert response.status_code == 200
+    assert response.json()["user"]["id"] == "user-1"
+    assert len(pool.executed) == 1
+    query, (new_hash, user_id) = pool.executed[0]
+    assert query.startswith("UPDATE users SET hashed_password")
+    assert user_id == "user-1"
+    assert new_hash.startswith("$argon2id$")
+    assert PASSWORD_HASHER.verify(new_hash, TEST_USER_PASSWORD)
+
+
+def test_login_with_bcrypt_hash_wrong_password():
+    """A wrong password against a bcrypt hash is rejected and nothing is rewritten"""
+    legacy_hash = bcrypt.hashpw(TEST_USER_PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+    response, pool = login_with(legacy_hash, password="wrong-password")
+
+    assert response.status_code == 401
+    assert pool.executed == []
+
+
+def test_login_with_current_argon2_hash_keeps_hash():
+    """A hash with the current Argon2 parameters is not rewritten"""
+    response, pool = login_with(PASSWORD_HASHER.hash(TEST_USER_PASSWORD))
+
+    assert response.status_code == 200
+    assert pool.executed == []
+
+
+@pytest.mark.parametrize("corrupt_hash", [
+    "$argon2id$garbage",
+    "$argon2id$v=19$m=19456,t=2,p=1$c2FsdA",
+    "$2b$12$truncated",
+])
+def test_corrupt_hash_is_a_mismatch(corrupt_hash):
+    """A corrupt stored hash fails verification instead of raising"""
+    assert _verify_and_update(TEST_USER_PASSWORD, corrupt_hash) == (False, None)
+
+    response, pool = login_with(corrupt_hash)
+
+    assert response.status_code == 401
+    assert pool.executed == []
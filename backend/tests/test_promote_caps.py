@@ -0,0 +1,275 @@
+"""
+Tests for the Inbox / Next Today caps on promote, bulk promote and triage.
+
+The cap checks live in the INSERT statements themselves, so these run the
+handlers against the real database (DATABASE_URL, migrated as for
+test_dumps.py). Each test gets its own user, dump and items and removes
+them afterwards.
+
+To run these tests:
+    cd backend
+    pip install pytest pytest-asyncio
+    pytest tests/test_promote_caps.py -v
+"""
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+import server
+from server import (
+    PromoteRequest, PromoteBulkRequest, TriageRequest,
+    promote_dump_item, promote_dump_items_bulk, triage_dump_items,
+)
+
+
+class Fixture:
+    """One test user with a dump, plus helpers to add items and tasks"""
+    def __init__(self, pool, user_id, dump_id):
+        self.pool = pool
+        self.user = {"id": user_id, "email": f"{user_id}@example.com"}
+        self.dump_id = dump_id
+
+    async def add_items(self, count):
+        now = datetime.now(timezone.utc)
+        ids = [str(uuid.uuid4()) for _ in range(count)]
+        await self.pool.executemany(
+            """INSERT INTO dump_items (id, dump_id, user_id, text, status, created_at, duration)
+               VALUES ($1, $2, $3, $4, 'new', $5, 20)""",
+            [(item_id, self.dump_id, self.user["id"], f"Item {i}", now) for i, item_id in enumerate(ids)]
+        )
+        return ids
+
+    async def add_tasks(self, status, count):
+        now = datetime.now(timezone.utc)
+        await self.pool.executemany(
+            "INSERT INTO tasks (id, user_id, title, status, created_at) VALUES ($1, $2, $3, $4, $5)",
+            [(str(uuid.uuid4()), self.user["id"], f"Existing {i}", status, now) for i in range(count)]
+        )
+
+    async def task_count(self, status):
+        return await self.pool.fetchval(
+            "SELECT COUNT(*) FROM tasks WHERE user_id = $1 AND status = $2", self.user["id"], status
+        )
+
+    async def item_statuses(self, item_ids):
+        rows = await self.pool.fetch(
+            "SELECT id, status FROM dump_items WHERE id = ANY($1::text[])", item_ids
+        )
+        return {row["id"]: row["status"] for row in rows}
+
+
+@pytest_asyncio.fixture
+async def data():
+    # A pool on this test's event loop, built by the app's own factory
+    server.db_pool = None
+    pool = await server.get_db_pool()
+    user_id = f"test-caps-{uuid.uuid4()}"
+    dump_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    await pool.execute(
+        "INSERT INTO users (id, email, name, created_at) VALUES ($1, $2, 'Test Caps User', $3)",
+        user_id, f"{user_id}@example.com", now
+    )
+    await pool.execute(
+        "INSERT INTO dumps (id, user_id, created_at, source, raw_text) VALUES ($1, $2, $3, 'text', 'caps')",
+        dump_id, user_id, now
+    )
+    try:
+        yield Fixture(pool, user_id, dump_id)
+    finally:
+        await pool.execute("DELETE FROM tasks WHERE user_id = $1", user_id)
+        await pool.execute("DELETE FROM dump_items WHERE dump_id = $1", dump_id)
+        await pool.execute("DELETE FROM dumps WHERE id = $1", dump_id)
+        await pool.execute("DELETE FROM users WHERE id = $1", user_id)
+        await pool.close()
+        server.db_pool = None
+
+
+# Single promote
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("target,status", [("inbox", "inbox"), ("next_today", "next"), ("later", "later")])
+async def test_promote_under_cap_creates_task(data, target, status):
+    [item_id] = await data.add_items(1)
+
+    task = await promote_dump_item(item_id, PromoteRequest(target=target), user=data.user)
+
+    assert task["status"] == status
+    assert task["title"] == "Item 0"
+    assert task["duration"] == 20
+    assert await data.item_statuses([item_id]) == {item_id: "promoted"}
+    linked = await data.pool.fetchval("SELECT created_task_id FROM dump_items WHERE id = $1", item_id)
+    assert linked == task["id"]
+
+
+@pytest.mark.asyncio
+async def test_promote_to_full_next_today_is_400(data):
+    await data.add_tasks("next", 1)
+    [item_id] = await data.add_items(1)
+
+    with pytest.raises(HTTPException) as exc:
+        await promote_dump_item(item_id, PromoteRequest(target="next_today"), user=data.user)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail.startswith("Next Today is full (1)")
+    assert await data.task_count("next") == 1
+    assert await data.item_statuses([item_id]) == {item_id: "new"}
+
+
+@pytest.mark.asyncio
+async def test_promote_to_full_inbox_is_409(data):
+    await data.add_tasks("inbox", 5)
+    [item_id] = await data.add_items(1)
+
+    with pytest.raises(HTTPException) as exc:
+        await promote_dump_item(item_id, PromoteRequest(target="inbox"), user=data.user)
+
+    assert exc.value.status_code == 409
+    assert await data.task_count("inbox") == 5
+    assert await data.item_statuses([item_id]) == {item_id: "new"}
+
+
+@pytest.mark.asyncio
+async def test_promote_to_later_is_uncapped(data):
+    await data.add_tasks("later", 10)
+    [item_id] = await data.add_items(1)
+
+    task = await promote_dump_item(item_id, PromoteRequest(target="later"), user=data.user)
+
+    assert task["status"] == "later"
+    assert await data.task_count("later") == 11
+
+
+@pytest.mark.asyncio
+async def test_promote_twice_is_400(data):
+    [item_id] = await data.add_items(1)
+    await promote_dump_item(item_id, PromoteRequest(target="later"), user=data.user)
+
+    with pytest.raises(HTTPException) as exc:
+        await promote_dump_item(item_id, PromoteRequest(target="later"), user=data.user)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == "Dump item already promoted"
+    assert await data.task_count("later") == 1
+
+
+@pytest.mark.asyncio
+async def test_promote_other_users_item_is_404(data):
+    [item_id] = await data.add_items(1)
+    stranger = {"id": f"test-caps-{uuid.uuid4()}", "email": "stranger@example.com"}
+
+    with pytest.raises(HTTPException) as exc:
+        await promote_dump_item(item_id, PromoteRequest(target="inbox"), user=stranger)
+
+    assert exc.value.status_code == 404
+    assert await data.item_statuses([item_id]) == {item_id: "new"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_promotes_respect_next_today_cap(data):
+    """Two promotes racing for the last Next Today slot: one wins, one gets the cap error"""
+    item_ids = await data.add_items(2)
+
+    results = await asyncio.gather(
+        *(promote_dump_item(item_id, PromoteRequest(target="next_today"), user=data.user) for item_id in item_ids),
+        return_exceptions=True
+    )
+
+    created = [r for r in results if isinstance(r, dict)]
+    rejected = [r for r in results if isinstance(r, HTTPException)]
+    assert len(created) == 1 and len(rejected) == 1, results
+    assert rejected[0].status_code == 400
+    assert await data.task_count("next") == 1
+
+
+# Bulk promote
+
+@pytest.mark.asyncio
+async def test_bulk_promote_uncapped_target(data):
+    await data.add_tasks("later", 3)
+    item_ids = await data.add_items(3)
+
+    response = await promote_dump_items_bulk(PromoteBulkRequest(item_ids=item_ids, target="later"), user=data.user)
+
+    assert response.status_code == 200
+    assert await data.task_count("later") == 6
+    assert set((await data.item_statuses(item_ids)).values()) == {"promoted"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_promote_fitting_next_today(data):
+    item_ids = await data.add_items(1)
+
+    response = await promote_dump_items_bulk(PromoteBulkRequest(item_ids=item_ids, target="next_today"), user=data.user)
+
+    assert response.status_code == 200
+    assert await data.task_count("next") == 1
+    assert await data.item_statuses(item_ids) == {item_ids[0]: "promoted"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_promote_over_next_today_cap_inserts_nothing(data):
+    item_ids = await data.add_items(2)
+
+    with pytest.raises(HTTPException) as exc:
+        await promote_dump_items_bulk(PromoteBulkRequest(item_ids=item_ids, target="next_today"), user=data.user)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail.startswith("Next Today only has 1 slot(s) available")
+    assert await data.task_count("next") == 0
+    assert set((await data.item_statuses(item_ids)).values()) == {"new"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_promote_to_full_next_today(data):
+    await data.add_tasks("next", 1)
+    item_ids = await data.add_items(1)
+
+    with pytest.raises(HTTPException) as exc:
+        await promote_dump_items_bulk(PromoteBulkRequest(item_ids=item_ids, target="next_today"), user=data.user)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail.startswith("Next Today is full (1)")
+    assert await data.task_count("next") == 1
+    assert await data.item_statuses(item_ids) == {item_ids[0]: "new"}
+
+
+# Triage
+
+@pytest.mark.asyncio
+async def test_triage_uncapped_target(data):
+    item_ids = await data.add_items(3)
+
+    response = await triage_dump_items(data.dump_id, TriageRequest(target="INBOX", item_ids=item_ids), user=data.user)
+
+    assert [task["status"] for task in response["tasks"]] == ["inbox"] * 3
+    assert await data.task_count("inbox") == 3
+
+
+@pytest.mark.asyncio
+async def test_triage_over_next_today_cap_inserts_nothing(data):
+    item_ids = await data.add_items(2)
+
+    with pytest.raises(HTTPException) as exc:
+        await triage_dump_items(data.dump_id, TriageRequest(target="NEXT_TODAY", item_ids=item_ids), user=data.user)
+
+    assert exc.value.status_code == 400
+    assert "Only 1 slot(s) available" in exc.value.detail
+    assert await data.task_count("next") == 0
+
+
+@pytest.mark.asyncio
+async def test_triage_to_full_next_today(data):
+    await data.add_tasks("next", 1)
+    item_ids = await data.add_items(1)
+
+    with pytest.raises(HTTPException) as exc:
+        await triage_dump_items(data.dump_id, TriageRequest(target="NEXT_TODAY", item_ids=item_ids), user=data.user)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail.startswith("Next Today is full (1)")
+    assert await data.task_count("next") == 1
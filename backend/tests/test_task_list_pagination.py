@@ -0,0 +1,207 @@
+"""
+Tests for keyset pagination of GET /tasks (limit / cursor / X-Next-Cursor).
+
+The fake connection applies the list's WHERE and ORDER BY the way Postgres
+would: rows sort by (COALESCE(priority, 2147483647), created_at, id)
+descending and a cursor keeps only rows whose key is below it.
+
+To run these tests:
+    cd backend
+    pip install pytest
+    pytest tests/test_task_list_pagination.py -v
+"""
+import re
+import base64
+from datetime import datetime
+
+import asyncpg
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+from server import app, get_current_user, encode_task_cursor, decode_task_cursor
+
+TEST_USER = {"id": "user-1", "email": "test-pages@example.com"}
+NULL_PRIORITY = 2147483647
+
+
+def make_task(task_id, priority, created_at, user_id="user-1", status="inbox"):
+    return {
+        "id": task_id, "user_id": user_id, "title": f"Task {task_id}", "description": "",
+        "priority": priority, "impakt": None, "scheduled_date": None, "scheduled_time": None,
+        "duration": 30, "status": status, "created_at": created_at, "energy_required": None,
+    }
+
+
+def parse_timestamptz(text):
+    """Parse created_at::text output ("... 07:00:00+00") on any Python version"""
+    if re.search(r"[+-]\d\d$", text):
+        text += ":00"
+    return datetime.fromisoformat(text)
+
+
+def sort_key(row):
+    priority = row["priority"] if row["priority"] is not None else NULL_PRIORITY
+    return (priority, parse_timestamptz(row["created_at"]), row["id"])
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetchval(self, query, *args):
+        # Schema probes: every optional column exists
+        return True
+
+    async def fetch(self, query, *args):
+        assert "ORDER BY COALESCE(priority, 2147483647) DESC, created_at DESC, id DESC" in query
+        rows = [row for row in self.rows if row["user_id"] == args[0]]
+        status = re.search(r"status = \$(\d+)", query)
+        if status:
+            rows = [row for row in rows if row["status"] == args[int(status.group(1)) - 1]]
+        cursor = re.search(r"\) < \(\$(\d+), \$(\d+)::text::timestamptz, \$(\d+)\)", query)
+        if cursor:
+            priority, created_at, task_id = (args[int(n) - 1] for n in cursor.groups())
+            try:
+                created_at = parse_timestamptz(created_at)
+            except ValueError:
+                raise asyncpg.DataError(f'invalid input syntax for type timestamp with time zone: "{created_at}"')
+            rows = [row for row in rows if sort_key(row) < (priority, created_at, task_id)]
+        rows.sort(key=sort_key, reverse=True)
+        limit = re.search(r"LIMIT \$(\d+)", query)
+        if limit:
+            rows = rows[:args[int(limit.group(1)) - 1]]
+        return rows
+
+
+class FakeAcquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePool:
+    def __init__(self, rows):
+        self.conn = FakeConnection(rows)
+
+    def acquire(self):
+        return FakeAcquire(self.conn)
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user] = lambda: TEST_USER
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def list_tasks(client, rows, **params):
+    with patch("server.get_db_pool", AsyncMock(return_value=FakePool(rows))):
+        return client.get("/api/tasks", params=params)
+
+
+def all_pages(client, rows, limit):
+    """Follow X-Next-Cursor until it runs out; returns the ids of each page"""
+    pages = []
+    params = {"limit": limit}
+    while True:
+        response = list_tasks(client, rows, **params)
+        assert response.status_code == 200
+        pages.append([task["id"] for task in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+        params = {"limit": limit, "cursor": cursor}
+
+
+def test_cursor_round_trip():
+    row = make_task("t-1", 3, "2026-10-17 07:00:00+00")
+    assert decode_task_cursor(encode_task_cursor(row)) == (3, "2026-10-17 07:00:00+00", "t-1")
+
+
+def test_cursor_round_trip_null_priority():
+    """A NULL priority travels as the sentinel it sorts as"""
+    row = make_task("t-1", None, "2026-10-17 07:00:00+00")
+    assert decode_task_cursor(encode_task_cursor(row)) == (NULL_PRIORITY, "2026-10-17 07:00:00+00", "t-1")
+
+
+def test_without_limit_returns_everything_without_cursor(client):
+    rows = [make_task(f"t-{i}", 2, f"2026-10-17 07:0{i}:00+00") for i in range(3)]
+
+    response = list_tasks(client, rows)
+
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()] == ["t-2", "t-1", "t-0"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_last_page_has_no_cursor(client):
+    rows = [make_task(f"t-{i}", 2, f"2026-10-17 07:0{i}:00+00") for i in range(3)]
+
+    response = list_tasks(client, rows, limit=3)
+
+    assert len(response.json()) == 3
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_equal_priority_and_created_at_break_ties_on_id(client):
+    """Rows sharing priority and created_at are paged by id, none skipped or repeated"""
+    same_time = "2026-10-17 07:00:00+00"
+    rows = [make_task(task_id, 2, same_time) for task_id in ("t-b", "t-d", "t-a", "t-e", "t-c")]
+
+    pages = all_pages(client, rows, limit=2)
+
+    assert pages == [["t-e", "t-d"], ["t-c", "t-b"], ["t-a"]]
+
+
+def test_null_priorities_across_a_page_boundary(client):
+    """NULL priorities sort first and a page boundary inside them loses nothing"""
+    rows = [
+        make_task("n-1", None, "2026-10-17 07:01:00+00"),
+        make_task("n-2", None, "2026-10-17 07:02:00+00"),
+        make_task("n-3", None, "2026-10-17 07:03:00+00"),
+        make_task("p-4", 4, "2026-10-17 07:04:00+00"),
+        make_task("p-1", 1, "2026-10-17 07:05:00+00"),
+    ]
+
+    pages = all_pages(client, rows, limit=2)
+
+    assert pages == [["n-3", "n-2"], ["n-1", "p-4"], ["p-1"]]
+    listed = [task["id"] for task in list_tasks(client, rows).json()]
+    assert [task_id for page in pages for task_id in page] == listed
+
+
+def test_cursor_combines_with_status_filter(client):
+    rows = [
+        make_task("t-1", 2, "2026-10-17 07:01:00+00"),
+        make_task("t-2", 2, "2026-10-17 07:02:00+00", status="later"),
+        make_task("t-3", 2, "2026-10-17 07:03:00+00"),
+        make_task("t-4", 2, "2026-10-17 07:04:00+00"),
+    ]
+
+    first = list_tasks(client, rows, status="inbox", limit=2)
+    second = list_tasks(client, rows, status="inbox", limit=2, cursor=first.headers["X-Next-Cursor"])
+
+    assert [task["id"] for task in first.json()] == ["t-4", "t-3"]
+    assert [task["id"] for task in second.json()] == ["t-1"]
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"no-commas").decode(),
+    base64.urlsafe_b64encode(b"high,2026-10-17 07:00:00+00,t-1").decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe,\x00").decode(),
+    base64.urlsafe_b64encode(b"2,not-a-timestamp,t-1").decode(),
+])
+def test_malformed_cursor_is_400(client, cursor):
+    rows = [make_task("t-1", 2, "2026-10-17 07:00:00+00")]
+
+    response = list_tasks(client, rows, limit=2, cursor=cursor)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
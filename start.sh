@@ -1,4 +1,4 @@
 #!/bin/bash
 cd backend
-python -m uvicorn server:app --host 0.0.0.0 --port $PORT
+python -m uvicorn server:app --host 0.0.0.0 --port $PORT --workers ${WEB_CONCURRENCY:-1} --loop uvloop --http httptools --limit-concurrency 1000
 